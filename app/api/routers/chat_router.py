@@ -14,6 +14,7 @@ Phase 3.3: chat.py에서 추출한 검증된 라우팅 로직
 
 import json
 import time
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 from uuid import uuid4
@@ -38,6 +39,35 @@ from ..schemas.feedback import FeedbackRequest, FeedbackResponse
 from ..schemas.streaming import StreamChatRequest, StreamErrorEvent
 from ..services.chat_service import ChatService
 
+# orjson 사용 가능 시 고속 JSON 직렬화 (없으면 표준 json으로 폴백, 한글 유니코드 유지)
+_json_dumps_bytes: Callable[[Any], bytes]
+try:
+    import orjson
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+
+    def _json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+# SSE 이벤트 타입별 프레임 머리 (청크마다 f-string 포맷 + 인코딩 반복 방지)
+_SSE_EVENT_PREFIXES: dict[str, bytes] = {
+    event_type: f"event: {event_type}\ndata: ".encode()
+    for event_type in ("metadata", "rerank_update", "chunk", "done", "error")
+}
+_SSE_FRAME_SUFFIX = b"\n\n"
+
+
+def _encode_sse_event(event: dict[str, Any]) -> bytes:
+    """ChatService 이벤트를 SSE 프레임(event: {type}\ndata: {json}\n\n) bytes로 인코딩"""
+    event_type = event.get("event", "chunk")
+    prefix = _SSE_EVENT_PREFIXES.get(event_type) or f"event: {event_type}\ndata: ".encode()
+    return prefix + _json_dumps_bytes(event) + _SSE_FRAME_SUFFIX
+
+
 logger = get_logger(__name__)
 router = APIRouter(tags=["Chat"])
 limiter = Limiter(key_func=get_remote_address)
@@ -674,7 +704,8 @@ async def chat_stream(request: Request, chat_request: StreamChatRequest) -> Stre
     검색, 리랭킹은 비스트리밍으로 처리하고, 답변 생성만 스트리밍합니다.
 
     SSE 이벤트 형식:
-    - metadata: 검색 결과 메타데이터 (세션 ID, 문서 수 등)
+    - metadata: 검색 결과 메타데이터 (세션 ID, 문서 수 등, 검색 완료 즉시 전송)
+    - rerank_update: 리랭킹 완료 후 결과 문서 수 (리랭킹 활성화 시)
     - chunk: LLM 응답 텍스트 청크
     - done: 스트리밍 완료 이벤트
     - error: 에러 이벤트
@@ -704,14 +735,8 @@ async def chat_stream(request: Request, chat_request: StreamChatRequest) -> Stre
                 session_id=chat_request.session_id,
                 options=chat_request.options,
             ):
-                # 이벤트 타입 추출 (기본값: chunk)
-                event_type = event.get("event", "chunk")
-
-                # JSON으로 직렬화 (한글 유니코드 유지)
-                event_data = json.dumps(event, ensure_ascii=False)
-
-                # SSE 형식으로 yield
-                yield f"event: {event_type}\ndata: {event_data}\n\n"
+                # SSE 형식으로 yield (이벤트 타입 기본값: chunk)
+                yield _encode_sse_event(event)
 
         except Exception as e:
             # 스트리밍 중 에러 발생 시 에러 이벤트 전송
@@ -724,7 +749,11 @@ async def chat_stream(request: Request, chat_request: StreamChatRequest) -> Stre
             )
 
             # 에러 이벤트를 SSE 형식으로 전송
-            yield f"event: error\ndata: {error_event.model_dump_json()}\n\n"
+            yield (
+                _SSE_EVENT_PREFIXES["error"]
+                + error_event.model_dump_json().encode()
+                + _SSE_FRAME_SUFFIX
+            )
 
     return StreamingResponse(
         event_generator(),
@@ -260,6 +260,16 @@ async def _process_streaming(
                     search_results=metadata.get("search_results"),
                 )
 
+            elif event_type == "rerank_update":
+                # 리랭킹 완료 결과도 내부 처리용 (metadata와 동일하게 로그만 기록)
+                rerank_data = event.get("data", {})
+                logger.debug(
+                    "스트리밍 리랭킹 완료",
+                    message_id=message_id,
+                    ranked_results=rerank_data.get("ranked_results"),
+                    reranking_applied=rerank_data.get("reranking_applied"),
+                )
+
             elif event_type == "chunk":
                 # 3. StreamTokenEvent 전송
                 token = event.get("data", "")
@@ -4,9 +4,10 @@
 SSE(Server-Sent Events) 기반 스트리밍 응답을 위한 Pydantic 모델.
 실시간 채팅 응답 스트리밍에 사용되며, 청크 단위로 응답을 전송합니다.
 
-주요 모델 (5개):
+주요 모델 (6개):
 - StreamChatRequest: 스트리밍 채팅 요청
 - StreamMetadataEvent: 세션/검색 메타데이터 이벤트
+- StreamRerankUpdateEvent: 리랭킹 완료 이벤트
 - StreamChunkEvent: 텍스트 청크 이벤트
 - StreamDoneEvent: 스트리밍 완료 이벤트
 - StreamErrorEvent: 에러 이벤트
@@ -62,6 +63,7 @@ class StreamMetadataEvent(BaseModel):
         event: 이벤트 타입 (항상 "metadata")
         session_id: 세션 식별자
         search_results: 검색된 문서 수 (0 이상)
+        ranked_results: 리랭킹 후 문서 수 (리랭킹 진행 중이면 None, rerank_update 이벤트로 전달)
         reranking_applied: 리랭킹 적용 여부
         query_expansion: 쿼리 확장 결과 (선택적)
         timestamp: 이벤트 생성 시간 ISO 8601 형식 (선택적)
@@ -70,11 +72,35 @@ class StreamMetadataEvent(BaseModel):
     event: Literal["metadata"] = "metadata"
     session_id: str = Field(..., description="세션 ID")
     search_results: int = Field(..., ge=0, description="검색된 문서 수")
+    ranked_results: int | None = Field(
+        None, ge=0, description="리랭킹 후 문서 수 (리랭킹 진행 중이면 None)"
+    )
     reranking_applied: bool = Field(False, description="리랭킹 적용 여부")
     query_expansion: str | None = Field(None, description="쿼리 확장 결과")
     timestamp: str | None = Field(default=None, description="이벤트 생성 시간 (ISO 8601)")
 
 
+class StreamRerankUpdateEvent(BaseModel):
+    """
+    SSE 리랭킹 완료 이벤트
+
+    metadata 이벤트를 리랭킹 완료 전에 먼저 보낸 경우, 리랭킹이 끝난 뒤
+    첫 chunk 이벤트보다 앞서 전송되는 결과 요약.
+
+    SSE 형식 예시:
+        data: {"event":"rerank_update","data":{"ranked_results":5,"reranking_applied":true}}
+
+    Attributes:
+        event: 이벤트 타입 (항상 "rerank_update")
+        ranked_results: 리랭킹 후 문서 수 (0 이상)
+        reranking_applied: 리랭킹 적용 여부
+    """
+
+    event: Literal["rerank_update"] = "rerank_update"
+    ranked_results: int = Field(..., ge=0, description="리랭킹 후 문서 수")
+    reranking_applied: bool = Field(False, description="리랭킹 적용 여부")
+
+
 class StreamChunkEvent(BaseModel):
     """
     스트리밍 청크 이벤트 (SSE data)
@@ -12,9 +12,11 @@ Phase 3.2: chat.py에서 추출한 검증된 비즈니스 로직
 - RAG 파이프라인, 세션 처리, 통계 관리 등 핵심 기능 제공
 """
 
+import asyncio
 import time
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -42,6 +44,143 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# 토픽별 키워드 (딕셔너리 순서 = 매칭 우선순위)
+_TOPIC_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "search": ("검색", "찾기", "찾아", "검색해"),
+    "document": ("문서", "파일", "자료", "데이터"),
+    "help": ("도움", "도와", "설명", "알려"),
+    "technical": ("기술", "개발", "코드", "프로그래밍"),
+    "general": ("일반", "기본", "소개", "개요"),
+}
+
+
+def _extract_topic_str(message: str) -> str:
+    """
+    문자열 메시지의 토픽 추출 (매칭 없거나 빈 문자열이면 general)
+
+    키워드마다 C 수준 부분 문자열 검색(in)을 수행하며, 우선순위가 높은 토픽부터 확인합니다.
+    """
+    lower_message = message.lower()
+    for topic, words in _TOPIC_KEYWORDS.items():
+        for word in words:
+            if word in lower_message:
+                return topic
+    return "general"
+
+
+def _meets_min_score(doc: Any, min_score: float) -> bool:
+    """문서 점수가 min_score 이상인지 (doc.score 우선, 미달/없음이면 metadata["score"] 확인)"""
+    score = getattr(doc, "score", None)
+    if score is not None and score >= min_score:
+        return True
+    metadata = getattr(doc, "metadata", None)
+    return metadata is not None and metadata.get("score", 0) >= min_score
+
+
+async def _coalesce_chunks(
+    chunks: AsyncIterator[str], window: float, max_chunks: int, max_chars: int = 0
+) -> AsyncGenerator[str, None]:
+    """
+    연속 청크 병합기
+
+    첫 청크는 TTFT를 늘리지 않도록 도착 즉시 내보내고, 이후 청크는 버퍼에 들어온 시점부터
+    window(초) 안에 도착한 청크를 하나로 합쳐 yield합니다.
+    max_chunks개가 모이거나, 버퍼 문자 수가 max_chars 이상이 되거나(0이면 제한 없음),
+    스트림이 끝나면 즉시 내보냅니다.
+    다음 청크 대기는 별도 태스크로 유지하여, 타임아웃이 원본 스트림을 취소하지 않도록 합니다.
+    스트림 에러 시에는 버퍼에 남은 청크를 먼저 내보낸 뒤 예외를 전파합니다.
+    """
+    loop = asyncio.get_running_loop()
+    iterator = aiter(chunks)
+    buffer: list[str] = []
+    buffered_chars = 0
+    deadline = 0.0
+    next_chunk: asyncio.Future[str] = asyncio.ensure_future(anext(iterator))
+
+    try:
+        try:
+            yield await next_chunk
+        except StopAsyncIteration:
+            return
+        next_chunk = asyncio.ensure_future(anext(iterator))
+
+        while True:
+            if buffer:
+                done, _ = await asyncio.wait(
+                    (next_chunk,), timeout=max(deadline - loop.time(), 0.0)
+                )
+                if not done:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_chars = 0
+                    continue
+
+            try:
+                chunk = await next_chunk
+            except StopAsyncIteration:
+                break
+            except Exception:
+                if buffer:
+                    yield "".join(buffer)
+                raise
+
+            if not buffer:
+                deadline = loop.time() + window
+            buffer.append(chunk)
+            buffered_chars += len(chunk)
+            if len(buffer) >= max_chunks or (max_chars and buffered_chars >= max_chars):
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+            next_chunk = asyncio.ensure_future(anext(iterator))
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        next_chunk.cancel()
+
+
+@dataclass(slots=True)
+class _ChatStats:
+    """
+    채팅 통계 누적기
+
+    평균 지연시간은 온라인 평균(Welford 방식)으로 갱신하여
+    누적합 재계산 없이 O(1)로 업데이트한다.
+    """
+
+    total_chats: int = 0
+    total_tokens: int = 0
+    average_latency: float = 0.0
+    errors: int = 0
+
+    def record(self, data: dict[str, Any]) -> None:
+        """채팅 1건의 결과를 통계에 반영"""
+        self.total_chats += 1
+
+        if not data.get("success"):
+            self.errors += 1
+            return
+
+        tokens_used = data.get("tokens_used")
+        if tokens_used:
+            self.total_tokens += tokens_used
+
+        latency = data.get("latency")
+        if latency:
+            self.average_latency += (latency - self.average_latency) / self.total_chats
+
+    def as_dict(self) -> StatsDict:
+        """API 응답용 딕셔너리 스냅샷 반환"""
+        total_chats = self.total_chats
+        return {
+            "total_chats": total_chats,
+            "total_tokens": self.total_tokens,
+            "average_latency": self.average_latency,
+            "error_rate": (self.errors / total_chats) * 100 if total_chats else 0.0,
+            "errors": self.errors,
+        }
+
 
 class ChatService:
     """
@@ -65,23 +204,35 @@ class ChatService:
         self.modules = modules
         self.config = config
 
+        # 요청 경로에서 반복 조회하지 않도록 모듈/설정을 초기화 시 바인딩
+        self._session_module = modules.get("session")
+        self._retrieval_module = modules.get("retrieval")
+        self._generation_module = modules.get("generation")
+        self._reranking_cfg: dict[str, Any] = config.get("reranking") or {}
+        self._retrieval_cfg: dict[str, Any] = config.get("retrieval") or {}
+        streaming_cfg: dict[str, Any] = config.get("streaming") or {}
+        # 청크 병합 대기 시간 (설정 없으면 병합 비활성화)
+        self._chunk_coalesce_window = float(streaming_cfg.get("chunk_coalesce_ms", 0)) / 1000
+        self._chunk_coalesce_max = max(int(streaming_cfg.get("chunk_coalesce_max", 4)), 1)
+        self._chunk_coalesce_max_chars = max(
+            int(streaming_cfg.get("chunk_coalesce_max_chars", 0)), 0
+        )
+        self._reranking_enabled = bool(
+            self._reranking_cfg.get("enabled", False)
+            or self._retrieval_cfg.get("enable_reranking", False)
+        )
+
         # 통계 정보
-        self.stats = {
-            "total_chats": 0,
-            "total_tokens": 0,
-            "average_latency": 0.0,
-            "error_rate": 0.0,
-            "errors": 0,
-        }
+        self._stats = _ChatStats()
 
         # RAGPipeline 인스턴스 생성 (의존성 주입)
         self.rag_pipeline = RAGPipeline(
             config=config,
             query_router=modules.get("query_router"),
             query_expansion=modules.get("query_expansion"),
-            retrieval_module=modules.get("retrieval"),
-            generation_module=modules.get("generation"),
-            session_module=modules.get("session"),
+            retrieval_module=self._retrieval_module,
+            generation_module=self._generation_module,
+            session_module=self._session_module,
             self_rag_module=modules.get("self_rag"),  # ✅ Self-RAG 모듈 주입
             extract_topic_func=self.extract_topic,
             circuit_breaker_factory=modules.get(
@@ -95,6 +246,19 @@ class ChatService:
             ),  # ✅ SQL Search Service 주입 (Phase 3)
         )
 
+        # LangSmith 트레이싱 (langsmith.enabled=false 설정 시 데코레이터 오버헤드 제거)
+        self.langsmith_enabled = LANGSMITH_AVAILABLE and bool(
+            config.get("langsmith", {}).get("enabled", True)
+        )
+        if self.langsmith_enabled:
+            self._run_rag_pipeline = traceable(
+                name="RAGPipeline",
+                tags=["chat", "rag", "pipeline"],
+                metadata={"module": "chat_service", "version": "3.0.0"},
+            )(self._execute_rag_pipeline_untraced)
+        else:
+            self._run_rag_pipeline = self._execute_rag_pipeline_untraced
+
         logger.info("ChatService 초기화 완료 (RAGPipeline + Self-RAG + SQL Search 포함)")
 
     async def handle_session(
@@ -179,39 +343,15 @@ class ChatService:
 
         기존 코드: chat.py의 extract_topic() 함수 (L301-329)
         """
-        # 안전한 메시지 처리
-        if isinstance(message, list):
-            message = " ".join(str(item) for item in message)
-        elif not isinstance(message, str):
-            message = str(message)
-
-        if not message:
-            return "general"
-
-        keywords = {
-            "search": ["검색", "찾기", "찾아", "검색해"],
-            "document": ["문서", "파일", "자료", "데이터"],
-            "help": ["도움", "도와", "설명", "알려"],
-            "technical": ["기술", "개발", "코드", "프로그래밍"],
-            "general": ["일반", "기본", "소개", "개요"],
-        }
-
-        try:
-            lower_message = message.lower()
+        if type(message) is str:
+            return _extract_topic_str(message)
 
-            for topic, words in keywords.items():
-                if any(word in lower_message for word in words):
-                    return topic
+        # 안전한 메시지 처리 (순서가 있는 리스트/튜플만 공백으로 연결, 그 외는 문자열 변환)
+        # dict/set은 순서가 보장되지 않고 제너레이터는 소비되므로 연결 대상에서 제외
+        if isinstance(message, (list, tuple)):
+            return _extract_topic_str(" ".join(map(str, message)))
+        return _extract_topic_str(str(message))
 
-            return "general"
-        except Exception:
-            return "general"
-
-    @traceable(
-        name="RAGPipeline",
-        tags=["chat", "rag", "pipeline"],
-        metadata={"module": "chat_service", "version": "3.0.0"},
-    )
     async def execute_rag_pipeline(
         self, message: str, session_id: str, options: dict[str, Any] | None = None
     ) -> RAGResultDict:
@@ -249,7 +389,13 @@ class ChatService:
             session_id=session_id,
         )
 
-        # RAGPipeline.execute() 단일 호출 (8단계 오케스트레이션)
+        # RAGPipeline.execute() 단일 호출 (8단계 오케스트레이션, LangSmith 트레이싱 선택적)
+        return await self._run_rag_pipeline(message, session_id, options)
+
+    async def _execute_rag_pipeline_untraced(
+        self, message: str, session_id: str, options: dict[str, Any] | None = None
+    ) -> RAGResultDict:
+        """RAGPipeline.execute() 호출 (트레이싱 없음)"""
         return await self.rag_pipeline.execute(
             message=message, session_id=session_id, options=options
         )
@@ -260,16 +406,18 @@ class ChatService:
         """
         세션에 대화 기록 추가
 
+        응답의 message_id로 즉시 피드백/후속 턴 조회가 가능하도록 저장 완료까지 대기하며,
+        저장 실패는 호출자에게 전파됩니다.
+
         Args:
             session_id: 세션 ID
             user_message: 사용자 메시지
             assistant_answer: 어시스턴트 응답
             metadata: 추가 메타데이터
         """
-        session_module = self.modules.get("session")
-        if session_module:
+        if self._session_module:
             logger.debug(f"대화 추가: session_id={session_id}")
-            await session_module.add_conversation(
+            await self._session_module.add_conversation(
                 session_id, user_message, assistant_answer, metadata
             )
 
@@ -279,25 +427,16 @@ class ChatService:
 
         기존 코드: chat.py의 update_stats() 함수 (L161-179)
         """
-        self.stats["total_chats"] += 1
-
-        if data.get("success"):
-            if data.get("tokens_used"):
-                self.stats["total_tokens"] += data["tokens_used"]
-
-            if data.get("latency"):
-                current_avg = self.stats["average_latency"]
-                chat_count = self.stats["total_chats"]
-                self.stats["average_latency"] = (
-                    current_avg * (chat_count - 1) + data["latency"]
-                ) / chat_count
-        else:
-            self.stats["errors"] += 1
-            self.stats["error_rate"] = (self.stats["errors"] / self.stats["total_chats"]) * 100
+        self._stats.record(data)
+
+    @property
+    def stats(self) -> StatsDict:
+        """현재 통계 스냅샷 (읽기 전용)"""
+        return self._stats.as_dict()
 
     def get_stats(self) -> StatsDict:
         """현재 통계 반환"""
-        return self.stats.copy()  # type: ignore[return-value]
+        return self._stats.as_dict()
 
     async def get_session_info(self, session_id: str) -> SessionInfoDict:
         """
@@ -343,19 +482,115 @@ class ChatService:
             "timestamp": datetime.now().isoformat(),
         }
 
+    async def _fetch_session_context(self, session_module: Any, session_id: str | None) -> str:
+        """스트리밍용 세션 컨텍스트 조회 (세션 모듈 없으면 빈 문자열)"""
+        if not session_module:
+            return ""
+        context: str = await session_module.get_context_string(session_id)
+        return context
+
+    async def _search_documents(
+        self, retrieval_module: Any, message: str, options: dict[str, Any]
+    ) -> list[Any]:
+        """스트리밍용 문서 검색 (검색 모듈 없거나 실패 시 빈 리스트)"""
+        if not retrieval_module:
+            return []
+        try:
+            results: list[Any] = await retrieval_module.search(message, {
+                "limit": options.get("limit", 8),
+                "min_score": options.get("min_score", 0.05),
+            })
+        except Exception as e:
+            logger.warning(f"스트리밍: 검색 실패 - {e}")
+            return []
+        logger.debug(f"스트리밍: 검색 완료 - {len(results)}개 문서")
+        return results
+
+    async def _search_and_start_rerank(
+        self, retrieval_module: Any, message: str, options: dict[str, Any]
+    ) -> tuple[list[Any], asyncio.Task[tuple[list[Any], bool]] | None]:
+        """
+        스트리밍용 문서 검색 후 리랭킹 태스크 즉시 시작
+
+        리랭킹은 세션 컨텍스트 조회나 metadata 이벤트 전송을 기다릴 필요가 없으므로
+        검색이 끝나는 즉시 백그라운드 태스크로 시작합니다.
+
+        Returns:
+            (검색 결과, 리랭킹 태스크) 튜플. 리랭킹 대상이 아니면 태스크는 None.
+        """
+        search_results = await self._search_documents(retrieval_module, message, options)
+        if not search_results:
+            return search_results, None
+
+        if not self._is_reranking_enabled():
+            logger.debug("스트리밍: 리랭킹 비활성화, 원본 사용")
+            return search_results, None
+        if not (retrieval_module and hasattr(retrieval_module, "rerank")):
+            logger.debug("스트리밍: 리랭킹 모듈 없음, 원본 사용")
+            return search_results, None
+
+        rerank_task = asyncio.create_task(
+            self._rerank_documents(retrieval_module, message, search_results, options)
+        )
+        return search_results, rerank_task
+
+    def _is_reranking_enabled(self) -> bool:
+        """리랭킹 활성화 여부 (reranking.enabled 또는 retrieval.enable_reranking)"""
+        return self._reranking_enabled
+
+    async def _rerank_documents(
+        self,
+        retrieval_module: Any,
+        message: str,
+        search_results: list[Any],
+        options: dict[str, Any],
+    ) -> tuple[list[Any], bool]:
+        """
+        스트리밍용 리랭킹 + min_score 필터링
+
+        Returns:
+            (리랭킹된 문서 리스트, 리랭킹 적용 여부) 튜플.
+            실패 시 원본 검색 결과와 False를 반환합니다.
+        """
+        reranking_config = self._reranking_cfg
+        try:
+            rerank_top_n = options.get("top_n", reranking_config.get("top_n", 8))
+            reranked_documents = await retrieval_module.rerank(
+                query=message,
+                results=search_results,
+                top_n=rerank_top_n,
+            )
+
+            # min_score 필터링
+            min_score = reranking_config.get("min_score", 0.05)
+            if min_score > 0:
+                reranked_documents = [
+                    doc for doc in reranked_documents if _meets_min_score(doc, min_score)
+                ]
+
+            logger.debug(f"스트리밍: 리랭킹 완료 - {len(reranked_documents)}개 문서")
+            return reranked_documents, True
+        except Exception as e:
+            logger.warning(f"스트리밍: 리랭킹 실패, 원본 사용 - {e}")
+            return search_results, False
+
     async def stream_rag_pipeline(
         self, message: str, session_id: str | None, options: dict[str, Any] | None = None
     ) -> AsyncGenerator[dict[str, Any], None]:
         """
         스트리밍 RAG 파이프라인 실행
 
-        세션 처리, 컨텍스트 준비, 문서 검색, 리랭킹은 비스트리밍으로 처리하고,
-        답변 생성 단계에서만 스트리밍으로 청크를 yield합니다.
+        메시지 도착 즉시 문서 검색을 백그라운드 태스크로 시작하고(Trigger),
+        세션 처리와 검색을 병렬로 진행합니다. 검색이 끝나는 즉시 리랭킹을 백그라운드로
+        시작하고, 리랭킹이 세션 컨텍스트 조회 및 metadata 이벤트 전송과 겹쳐 실행되도록 합니다.
+        답변 생성 단계에서는 청크를 스트리밍으로 yield합니다.
 
         이벤트 타입:
-        - metadata: 검색 결과 메타데이터 (세션 ID, 문서 수, 소스 등)
+        - metadata: 검색 결과 메타데이터 (세션 ID, 문서 수 등)
+          리랭킹이 진행될 예정이면 ranked_results는 None
+        - rerank_update: 리랭킹 완료 후 결과 (ranked_results, reranking_applied)
         - chunk: LLM 응답 텍스트 청크 (data, chunk_index)
-        - done: 스트리밍 완료 이벤트 (session_id, total_chunks)
+        - done: 스트리밍 완료 이벤트 (session_id, message_id, total_chunks)
         - error: 에러 이벤트 (error_code, message)
 
         Args:
@@ -375,11 +610,22 @@ class ChatService:
         start_time = time.time()
         chunk_index = 0
         final_session_id = session_id
+        # 메시지 ID/타임스탬프는 스트림당 1회만 생성하여 metadata/done 이벤트에서 재사용
+        message_id = str(uuid.uuid4())
+        started_at = datetime.now().isoformat()
 
-        try:
-            # 1. 세션 처리 (비스트리밍)
-            session_module = self.modules.get("session")
+        session_module = self._session_module
+        retrieval_module = self._retrieval_module
+        generation_module = self._generation_module
+
+        # Trigger: 메시지 도착 즉시 검색 시작 (세션 처리와 겹쳐 실행, 검색 완료 시 리랭킹 바로 시작)
+        search_task = asyncio.create_task(
+            self._search_and_start_rerank(retrieval_module, message, options)
+        )
+        rerank_task: asyncio.Task[tuple[list[Any], bool]] | None = None
 
+        try:
+            # 1. 세션 처리 (검색과 병렬)
             if session_module:
                 if session_id:
                     # 기존 세션 검증
@@ -396,89 +642,62 @@ class ChatService:
                     new_session = await session_module.create_session({"metadata": {}})
                     final_session_id = new_session["session_id"]
                     logger.debug(f"스트리밍: 새 세션 생성 - {final_session_id}")
+            elif not final_session_id:
+                final_session_id = str(uuid.uuid4())
+
+            # 2~3. 세션 컨텍스트 조회 + 검색 결과 대기 (병렬 실행)
+            # 두 단계는 서로 독립적이므로 동시에 대기하여 대기 시간을 max(stage)로 단축
+            context_result, search_outcome = await asyncio.gather(
+                self._fetch_session_context(session_module, final_session_id),
+                search_task,
+                return_exceptions=True,
+            )
 
-                # 2. 세션 컨텍스트 조회 (비스트리밍)
-                session_context = await session_module.get_context_string(final_session_id)
+            # 검색 실패는 빈 결과로 계속 진행
+            # (컨텍스트 조회 실패 시에도 리랭킹 태스크가 정리되도록 먼저 바인딩)
+            search_results: list[Any]
+            if isinstance(search_outcome, BaseException):
+                logger.warning(f"스트리밍: 검색 실패 - {search_outcome}")
+                search_results = []
             else:
-                session_context = ""
-                if not final_session_id:
-                    final_session_id = str(uuid.uuid4())
-
-            # 3. 문서 검색 (비스트리밍)
-            retrieval_module = self.modules.get("retrieval")
-            search_results = []
-
-            if retrieval_module:
-                try:
-                    search_results = await retrieval_module.search(message, {
-                        "limit": options.get("limit", 8),
-                        "min_score": options.get("min_score", 0.05),
-                    })
-                    logger.debug(f"스트리밍: 검색 완료 - {len(search_results)}개 문서")
-                except Exception as e:
-                    logger.warning(f"스트리밍: 검색 실패 - {e}")
+                search_results, rerank_task = search_outcome
 
-            # 4. 리랭킹 (비스트리밍)
-            reranked_documents = search_results  # 기본값: 원본 검색 결과
-            reranking_applied = False
-
-            if search_results:
-                reranking_config = self.config.get("reranking", {})
-                retrieval_config = self.config.get("retrieval", {})
-                reranking_enabled = reranking_config.get("enabled", False) or retrieval_config.get(
-                    "enable_reranking", False
-                )
+            # 컨텍스트 조회 실패는 기존과 동일하게 에러 이벤트로 처리
+            if isinstance(context_result, BaseException):
+                raise context_result
+            session_context = context_result
 
-                if reranking_enabled:
-                    retrieval_module = self.modules.get("retrieval")
-                    if retrieval_module and hasattr(retrieval_module, "rerank"):
-                        try:
-                            rerank_top_n = options.get("top_n", reranking_config.get("top_n", 8))
-                            reranked_documents = await retrieval_module.rerank(
-                                query=message,
-                                results=search_results,
-                                top_n=rerank_top_n,
-                            )
-
-                            # min_score 필터링
-                            min_score = reranking_config.get("min_score", 0.05)
-                            if min_score > 0:
-                                reranked_documents = [
-                                    doc
-                                    for doc in reranked_documents
-                                    if (hasattr(doc, "score") and doc.score >= min_score)
-                                    or (hasattr(doc, "metadata") and doc.metadata.get("score", 0) >= min_score)
-                                ]
-
-                            reranking_applied = True
-                            logger.debug(
-                                f"스트리밍: 리랭킹 완료 - {len(reranked_documents)}개 문서"
-                            )
-                        except Exception as e:
-                            logger.warning(f"스트리밍: 리랭킹 실패, 원본 사용 - {e}")
-                            reranked_documents = search_results
-                    else:
-                        logger.debug("스트리밍: 리랭킹 모듈 없음, 원본 사용")
-                else:
-                    logger.debug("스트리밍: 리랭킹 비활성화, 원본 사용")
+            # 리랭킹 진행 여부 (metadata 이벤트의 ranked_results 결정)
+            rerank_pending = rerank_task is not None
 
-            # 5. 메타데이터 이벤트 전송
+            # 4. 메타데이터 이벤트 즉시 전송 (리랭킹 완료를 기다리지 않음)
             metadata_event = {
                 "event": "metadata",
                 "data": {
                     "session_id": final_session_id,
                     "search_results": len(search_results),
-                    "ranked_results": len(reranked_documents),
-                    "reranking_applied": reranking_applied,
-                    "message_id": str(uuid.uuid4()),
-                    "timestamp": datetime.now().isoformat(),
+                    "ranked_results": None if rerank_pending else len(search_results),
+                    "reranking_applied": False,
+                    "message_id": message_id,
+                    "timestamp": started_at,
                 },
             }
             yield metadata_event
 
-            # 6. 스트리밍 답변 생성
-            generation_module = self.modules.get("generation")
+            # 5. 리랭킹 결과 대기 (검색 직후 시작됨) → rerank_update 이벤트 전송
+            reranked_documents = search_results  # 기본값: 원본 검색 결과
+
+            if rerank_task is not None:
+                reranked_documents, reranking_applied = await rerank_task
+                yield {
+                    "event": "rerank_update",
+                    "data": {
+                        "ranked_results": len(reranked_documents),
+                        "reranking_applied": reranking_applied,
+                    },
+                }
 
+            # 6. 스트리밍 답변 생성
             if generation_module and hasattr(generation_module, "stream_answer"):
                 # 컨텍스트 문서 준비 (리랭킹된 문서 사용)
                 context_documents = reranked_documents if reranked_documents else []
@@ -489,19 +708,24 @@ class ChatService:
                     "session_context": session_context,
                 }
 
-                # 스트리밍 호출
+                # 스트리밍 호출 (설정 시 짧은 시간 내 연속 청크를 하나의 이벤트로 병합)
                 try:
-                    async for text_chunk in generation_module.stream_answer(
+                    text_chunks = generation_module.stream_answer(
                         query=message,
                         context_documents=context_documents,
                         options=generation_options,
-                    ):
-                        chunk_event = {
-                            "event": "chunk",
-                            "data": text_chunk,
-                            "chunk_index": chunk_index,
-                        }
-                        yield chunk_event
+                    )
+                    if self._chunk_coalesce_window > 0:
+                        text_chunks = _coalesce_chunks(
+                            text_chunks,
+                            self._chunk_coalesce_window,
+                            self._chunk_coalesce_max,
+                            self._chunk_coalesce_max_chars,
+                        )
+                    async for text_chunk in text_chunks:
+                        # 소비자(SSE/WebSocket 라우터, 테스트)가 이벤트를 보관할 수 있으므로
+                        # 버퍼 재사용 없이 청크마다 작은 dict 리터럴을 바로 yield
+                        yield {"event": "chunk", "data": text_chunk, "chunk_index": chunk_index}
                         chunk_index += 1
 
                 except Exception as e:
@@ -528,6 +752,7 @@ class ChatService:
                 "event": "done",
                 "data": {
                     "session_id": final_session_id,
+                    "message_id": message_id,
                     "total_chunks": chunk_index,
                     "processing_time": processing_time,
                     "tokens_used": 0,  # 스트리밍에서는 정확한 토큰 계산 어려움
@@ -548,3 +773,17 @@ class ChatService:
                 "error_code": ErrorCode.GENERAL_004.value,
                 "message": "스트리밍 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.",
             }
+
+        finally:
+            # 조기 종료(에러, 클라이언트 연결 해제) 시 백그라운드 태스크 정리
+            # 세션 처리 중 에러로 검색 결과를 받지 못했다면 검색 태스크가 시작한 리랭킹도 정리
+            if (
+                rerank_task is None
+                and search_task.done()
+                and not search_task.cancelled()
+                and search_task.exception() is None
+            ):
+                rerank_task = search_task.result()[1]
+            for task in (search_task, rerank_task):
+                if task is not None and not task.done():
+                    task.cancel()
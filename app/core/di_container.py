@@ -1302,7 +1302,7 @@ def create_retriever_via_factory(
             except ImportError:
                 logger.warning(
                     f"BM25 엔진 의존성 미설치 - {provider}는 Dense 전용으로 동작합니다. "
-                    "하이브리드 검색을 사용하려면: uv add kiwipiepy rank-bm25"
+                    "하이브리드 검색을 사용하려면: uv add kiwipiepy"
                 )
                 bm25_preprocessors = None
         else:
@@ -254,6 +254,8 @@ class ConfigLoader:
             "LLM_MODEL": ("llm", "model"),
             # Generation 모듈도 같은 provider 사용
             "GENERATION_PROVIDER": ("generation", "default_provider"),
+            # LangSmith 트레이싱 on/off
+            "LANGSMITH_TRACING_ENABLED": ("langsmith", "enabled"),
         }
         for env_var, config_path in env_mappings.items():
             value = os.getenv(env_var)
@@ -17,15 +17,36 @@ ReAct 패턴에서 "Reflect" 담당 컴포넌트.
         # 개선 로직 실행
 """
 
+import hashlib
 import json
 import re
+from collections.abc import Callable
+from dataclasses import replace
 from typing import Any
 
+from cachetools import LRUCache
+
 from ....lib.logger import get_logger
 from .interfaces import AgentConfig, ReflectionResult
 
+# orjson 사용 가능 시 고속 JSON 파싱 (없으면 표준 json으로 폴백)
+# orjson.JSONDecodeError는 json.JSONDecodeError(ValueError)의 하위 클래스
+_json_loads: Callable[[str], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
+# 마크다운 JSON 코드 블록 추출 정규식 (non-greedy)
+_JSON_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Reflection 결과 캐시 최대 크기 (동일 query/answer/context 재평가 시 LLM 호출 생략)
+_REFLECTION_CACHE_SIZE = 512
+
 
 # Reflection 프롬프트 템플릿
 REFLECTOR_SYSTEM_PROMPT = """당신은 RAG 시스템의 답변 품질 평가 에이전트입니다.
@@ -74,6 +95,7 @@ class AgentReflector:
     Attributes:
         _llm_client: LLM 클라이언트 (generate_text 메서드 필요)
         _config: 에이전트 설정 (reflection_threshold 등)
+        _cache: (query, answer, context) 다이제스트 → 평가 결과 LRU 캐시
     """
 
     def __init__(
@@ -98,6 +120,9 @@ class AgentReflector:
 
         self._llm_client = llm_client
         self._config = config
+        self._cache: LRUCache[bytes, ReflectionResult] = LRUCache(
+            maxsize=_REFLECTION_CACHE_SIZE
+        )
 
         logger.info(
             f"AgentReflector 초기화: "
@@ -126,8 +151,16 @@ class AgentReflector:
             ReflectionResult: 평가 결과 (score, issues, suggestions 등)
 
         Note:
-            LLM 호출 실패 시 보수적으로 needs_improvement=False 반환
+            LLM 호출 실패 시 보수적으로 needs_improvement=False 반환.
+            동일한 (query, answer, context)는 캐시된 결과의 복사본을 반환하며,
+            폴백 결과는 캐시하지 않습니다.
         """
+        cache_key = self._cache_key(query, answer, context)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.debug("AgentReflector: 캐시 히트")
+            return self._copy_result(cached)
+
         try:
             # 1. 프롬프트 구성
             user_prompt = REFLECTOR_USER_PROMPT.format(
@@ -143,12 +176,35 @@ class AgentReflector:
             )
 
             # 3. 응답 파싱
-            return self._parse_reflection_response(response)
+            result = self._build_reflection_result(response)
 
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Reflection 응답 파싱 실패: {e}")
+            return self._fallback_result()
         except Exception as e:
             logger.error(f"AgentReflector 에러: {e}")
             return self._fallback_result()
 
+        # 호출자가 결과를 수정해도 캐시 항목이 바뀌지 않도록 복사본을 보관
+        self._cache[cache_key] = self._copy_result(result)
+        return result
+
+    @staticmethod
+    def _copy_result(result: ReflectionResult) -> ReflectionResult:
+        """ReflectionResult 복사 (issues/suggestions 리스트까지 분리)"""
+        return replace(result, issues=list(result.issues), suggestions=list(result.suggestions))
+
+    @staticmethod
+    def _cache_key(query: str, answer: str, context: str) -> bytes:
+        """캐시 키 (긴 문자열을 키로 보관하지 않도록 16바이트 다이제스트 사용)"""
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (query, answer, context or ""):
+            encoded = part.encode("utf-8")
+            # 길이 접두사로 필드 경계를 구분 (("ab", "c")와 ("a", "bc") 충돌 방지)
+            hasher.update(len(encoded).to_bytes(8, "little"))
+            hasher.update(encoded)
+        return hasher.digest()
+
     def _parse_reflection_response(self, response: str) -> ReflectionResult:
         """
         LLM 응답을 ReflectionResult로 파싱
@@ -157,44 +213,56 @@ class AgentReflector:
             response: LLM 응답 문자열 (JSON 형식)
 
         Returns:
-            ReflectionResult: 파싱된 결과
+            ReflectionResult: 파싱된 결과 (파싱 실패 시 폴백 결과)
         """
         try:
-            # JSON 추출 (마크다운 코드 블록 처리)
-            json_str = self._extract_json(response)
-            data = json.loads(json_str)
+            return self._build_reflection_result(response)
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Reflection 응답 파싱 실패: {e}")
+            return self._fallback_result()
 
-            score = float(data.get("score", 7.0))
-            issues = data.get("issues", [])
-            suggestions = data.get("suggestions", [])
-            reasoning = data.get("reasoning", "")
+    def _build_reflection_result(self, response: str) -> ReflectionResult:
+        """
+        LLM 응답에서 ReflectionResult 생성
 
-            # threshold 기반 개선 필요 여부 판단
-            needs_improvement = score < self._config.reflection_threshold
+        Raises:
+            ValueError, KeyError, TypeError: 응답 형식이 올바르지 않은 경우
+        """
+        # JSON 추출 (마크다운 코드 블록 처리)
+        json_str = self._extract_json(response)
+        data = _json_loads(json_str)
 
-            logger.info(
-                f"AgentReflector: score={score}, "
-                f"needs_improvement={needs_improvement}"
-            )
+        score = float(data.get("score", 7.0))
+        issues = data.get("issues", [])
+        suggestions = data.get("suggestions", [])
+        reasoning = data.get("reasoning", "")
 
-            return ReflectionResult(
-                score=score,
-                issues=issues,
-                suggestions=suggestions,
-                needs_improvement=needs_improvement,
-                reasoning=reasoning,
-            )
+        # threshold 기반 개선 필요 여부 판단
+        needs_improvement = score < self._config.reflection_threshold
 
-        except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
-            logger.warning(f"Reflection 응답 파싱 실패: {e}")
-            return self._fallback_result()
+        logger.info(
+            f"AgentReflector: score={score}, "
+            f"needs_improvement={needs_improvement}"
+        )
+
+        return ReflectionResult(
+            score=score,
+            issues=issues,
+            suggestions=suggestions,
+            needs_improvement=needs_improvement,
+            reasoning=reasoning,
+        )
 
     def _extract_json(self, response: str) -> str:
         """응답에서 JSON 문자열 추출"""
         response = response.strip()
 
+        # 코드 블록이 없으면 정규식 없이 그대로 반환 (일반적인 경우)
+        if "```" not in response:
+            return response
+
         # 마크다운 코드 블록 처리
-        json_match = re.search(r"```(?:json)?\s*(.*?)\s*```", response, re.DOTALL)
+        json_match = _JSON_FENCE_PATTERN.search(response)
         if json_match:
             return json_match.group(1).strip()
 
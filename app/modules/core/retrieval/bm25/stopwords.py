@@ -13,7 +13,7 @@ Phase 2 구현 (2025-11-28)
 """
 
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Set
 
 logger = logging.getLogger(__name__)
 
@@ -146,6 +146,16 @@ class StopwordFilter:
         """현재 불용어 세트 반환 (복사본)"""
         return self.stopwords.copy()
 
+    @property
+    def active_stopwords(self) -> Set[str]:
+        """
+        필터링에 사용할 불용어 집합 (비활성화 시 빈 집합)
+
+        토크나이저 등이 filter()를 별도 패스로 호출하지 않고
+        자체 루프에서 멤버십만 검사할 때 사용합니다 (읽기 전용으로 사용).
+        """
+        return self.stopwords if self.enabled else frozenset()
+
     @property
     def count(self) -> int:
         """불용어 개수"""
@@ -15,6 +15,9 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# protect_entries가 만드는 임시 토큰 접두어
+_PLACEHOLDER_PREFIX = "__USER_DICT_"
+
 
 class UserDictionary:
     """
@@ -92,7 +95,7 @@ class UserDictionary:
 
         def replacer(match: re.Match) -> str:
             word = match.group(0)
-            token = f"__USER_DICT_{counter[0]}__"
+            token = f"{_PLACEHOLDER_PREFIX}{counter[0]}__"
             restore_map[token] = word
             counter[0] += 1
             return token
@@ -126,6 +129,33 @@ class UserDictionary:
 
         return result
 
+    def restore_tokens(self, tokens: list[str], restore_map: dict[str, str]) -> list[str]:
+        """
+        토큰 리스트 일괄 복원
+
+        토큰마다 restore_entries()로 복원 맵 전체를 순회하지 않도록,
+        임시 토큰 접두어가 있는 토큰만 골라 한 번 컴파일한 정규식으로 복원합니다.
+
+        Args:
+            tokens: 형태소 분석 결과 토큰 리스트
+            restore_map: protect_entries에서 반환된 복원 맵
+
+        Returns:
+            복원된 토큰 리스트
+        """
+        if not restore_map:
+            return tokens
+
+        pattern = re.compile("|".join(map(re.escape, restore_map)))
+
+        def replacer(match: re.Match) -> str:
+            return restore_map[match.group(0)]
+
+        return [
+            pattern.sub(replacer, token) if _PLACEHOLDER_PREFIX in token else token
+            for token in tokens
+        ]
+
     def contains(self, word: str) -> bool:
         """
         단어가 사용자 사전에 있는지 확인
@@ -15,6 +15,8 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import numpy as np
+
 from app.modules.core.retrieval.interfaces import SearchResult
 
 logger = logging.getLogger(__name__)
@@ -22,6 +24,37 @@ logger = logging.getLogger(__name__)
 # RRF 상수 (일반적으로 60 사용)
 _RRF_K = 60
 
+# 순위별 RRF 가중치 테이블 (1 / (k + rank + 1)), 모듈 로드 시 1회 계산
+_RRF_MAX_RANK = 4096
+_RRF_RANK_WEIGHTS = np.reciprocal(_RRF_K + np.arange(_RRF_MAX_RANK, dtype=np.float64) + 1.0)
+_RRF_RANK_WEIGHTS.setflags(write=False)
+
+
+def _rank_weights(n: int) -> np.ndarray:
+    """상위 n개 순위의 RRF 가중치 (테이블 범위를 넘으면 직접 계산)"""
+    if n <= _RRF_MAX_RANK:
+        return _RRF_RANK_WEIGHTS[:n]
+    return np.reciprocal(_RRF_K + np.arange(n, dtype=np.float64) + 1.0)
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    점수 내림차순 상위 top_k 인덱스 (동점 시 인덱스 오름차순)
+
+    top_k가 전체보다 작으면 전체 정렬 대신 부분 선택(O(n))으로 k번째 점수를 구하고,
+    선택된 후보만 정렬합니다. 경계 동점은 인덱스가 작은 것부터 채워 전체 stable 정렬과
+    동일한 결과를 보장합니다.
+    """
+    n = scores.size
+    if not 0 < top_k < n:
+        return np.argsort(-scores, kind="stable")[:top_k]
+
+    kth_score = np.partition(scores, n - top_k)[n - top_k]
+    above = np.flatnonzero(scores > kth_score)
+    ties = np.flatnonzero(scores == kth_score)[: top_k - above.size]
+    candidates = np.concatenate((above, ties))
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
 
 class HybridMerger:
     """
@@ -57,45 +90,76 @@ class HybridMerger:
         if not dense_results and not bm25_results:
             return []
 
-        rrf_scores: dict[str, float] = {}
-        doc_info: dict[str, dict[str, Any]] = {}
+        # 단일 소스 fast path: ID가 모두 고유하면 입력 순서가 곧 RRF 순위이므로 매핑/정렬 생략
+        # (한 소스 안의 중복 ID는 점수 합산이 필요하므로 아래 일반 경로에서 처리)
+        if not bm25_results and len({result.id for result in dense_results}) == len(dense_results):
+            ranked_dense = dense_results[:top_k]
+            weights = (self._alpha * _rank_weights(len(ranked_dense))).tolist()
+            return [
+                SearchResult(
+                    id=result.id,
+                    content=result.content,
+                    score=weight,
+                    metadata=result.metadata,
+                )
+                for result, weight in zip(ranked_dense, weights, strict=True)
+            ]
+        if not dense_results and len({item["id"] for item in bm25_results}) == len(bm25_results):
+            ranked_bm25 = bm25_results[:top_k]
+            weights = ((1.0 - self._alpha) * _rank_weights(len(ranked_bm25))).tolist()
+            return [
+                SearchResult(
+                    id=bm25_item["id"],
+                    content=bm25_item["content"],
+                    score=weight,
+                    metadata=bm25_item.get("metadata", {}),
+                )
+                for bm25_item, weight in zip(ranked_bm25, weights, strict=True)
+            ]
 
-        # Dense 결과 RRF 점수
+        # 문서 ID → 정수 인덱스 매핑 (첫 등장 순서 유지, 미등록 ID는 다음 인덱스 할당)
+        # 문서 정보는 정수 인덱스로 접근하는 병렬 리스트에 보관하고, 문자열 ID는 최종 변환 시에만 사용
+        id_to_idx: dict[str, int] = {}
+        contents: list[str] = []
+        metadatas: list[dict[str, Any]] = []
+
+        dense_idx = np.empty(len(dense_results), dtype=np.intp)
         for rank, result in enumerate(dense_results):
-            rrf_score = self._alpha * (1.0 / (_RRF_K + rank + 1))
-            rrf_scores[result.id] = rrf_scores.get(result.id, 0.0) + rrf_score
-            if result.id not in doc_info:
-                doc_info[result.id] = {
-                    "content": result.content,
-                    "metadata": result.metadata,
-                }
-
-        # BM25 결과 RRF 점수
-        bm25_weight = 1.0 - self._alpha
+            idx = id_to_idx.setdefault(result.id, len(id_to_idx))
+            dense_idx[rank] = idx
+            if idx == len(contents):
+                contents.append(result.content)
+                metadatas.append(result.metadata)
+
+        bm25_idx = np.empty(len(bm25_results), dtype=np.intp)
         for rank, bm25_item in enumerate(bm25_results):
-            doc_id = bm25_item["id"]
-            rrf_score = bm25_weight * (1.0 / (_RRF_K + rank + 1))
-            rrf_scores[doc_id] = rrf_scores.get(doc_id, 0.0) + rrf_score
-            if doc_id not in doc_info:
-                doc_info[doc_id] = {
-                    "content": bm25_item["content"],
-                    "metadata": bm25_item.get("metadata", {}),
-                }
-
-        # 정렬 + SearchResult 변환
-        sorted_ids = sorted(rrf_scores.keys(), key=lambda x: rrf_scores[x], reverse=True)
-
-        merged: list[SearchResult] = []
-        for doc_id in sorted_ids[:top_k]:
-            info = doc_info[doc_id]
-            merged.append(
-                SearchResult(
-                    id=doc_id,
-                    content=info["content"],
-                    score=rrf_scores[doc_id],
-                    metadata=info["metadata"],
-                )
+            idx = id_to_idx.setdefault(bm25_item["id"], len(id_to_idx))
+            bm25_idx[rank] = idx
+            if idx == len(contents):
+                contents.append(bm25_item["content"])
+                metadatas.append(bm25_item.get("metadata", {}))
+
+        # RRF 점수 누적 (벡터화): weight / (k + rank + 1)
+        scores = np.zeros(len(id_to_idx), dtype=np.float64)
+        dense_scores = self._alpha * _rank_weights(len(dense_results))
+        bm25_scores = (1.0 - self._alpha) * _rank_weights(len(bm25_results))
+        np.add.at(scores, dense_idx, dense_scores)
+        np.add.at(scores, bm25_idx, bm25_scores)
+
+        # 상위 top_k 선택 (동점 시 첫 등장 순서 유지) + SearchResult 변환
+        top_idx = _top_k_indices(scores, top_k).tolist()
+        top_scores = scores[top_idx].tolist()
+        ids = list(id_to_idx)
+
+        merged: list[SearchResult] = [
+            SearchResult(
+                id=ids[idx],
+                content=contents[idx],
+                score=score,
+                metadata=metadatas[idx],
             )
+            for idx, score in zip(top_idx, top_scores, strict=True)
+        ]
 
         logger.debug(
             f"HybridMerger: Dense {len(dense_results)}개 + BM25 {len(bm25_results)}개 "
@@ -1,28 +1,104 @@
 """
 BM25 검색 인덱스
 
-rank-bm25 라이브러리를 래핑하여 Python 기반 BM25 키워드 검색을 제공합니다.
+NumPy 기반 BM25+ 점수 계산기(BM25PlusScorer)로 Python 기반 BM25 키워드 검색을 제공합니다.
 Weaviate/Qdrant 등 DB 내장 BM25가 없는 환경에서 사용됩니다.
 
 의존성:
-- rank-bm25: pip install rank-bm25 (선택적)
 - KoreanTokenizer: 한국어 형태소 분석 (Task 1에서 구현)
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
-import math
+import multiprocessing
+import pickle
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from app.modules.core.retrieval.bm25_engine.scorer import BM25PlusScorer
 from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
 
 logger = logging.getLogger(__name__)
 
+# 프로세스 풀을 사용할 최소 문서 수
+# (이보다 작은 코퍼스는 워커 기동 + Kiwi 재생성 비용이 더 크므로 현재 프로세스에서 처리)
+_PARALLEL_MIN_DOCUMENTS = 2000
+
+# 쿼리 토큰화 결과 LRU 캐시 크기 (챗 루프 등에서 반복되는 쿼리의 Kiwi 재분석 방지)
+_QUERY_CACHE_SIZE = 1024
+
+# save()/load() 디렉토리 형식 버전과 문서/용어 사전 파일 이름
+INDEX_FORMAT_VERSION = 3
+_META_FILE = "meta.pkl"
+
+# 프로세스 풀 워커별 토크나이저 (워커 초기화 시 언피클링되며 Kiwi를 재생성)
+_worker_tokenizer: KoreanTokenizer | None = None
+
+
+def _init_tokenizer_worker(tokenizer: KoreanTokenizer) -> None:
+    """프로세스 풀 워커 초기화: 토크나이저를 워커 전역에 보관"""
+    global _worker_tokenizer
+    _worker_tokenizer = tokenizer
+
+
+def _tokenize_shard(texts: list[str]) -> list[list[str]]:
+    """워커에서 문서 샤드 토큰화"""
+    if _worker_tokenizer is None:
+        raise RuntimeError("토크나이저 워커가 초기화되지 않았습니다")
+    return _worker_tokenizer.tokenize_batch(texts)
+
+
+def _token_cache_key(doc: dict[str, Any]) -> str:
+    """토큰 캐시 키: 문서 ID + 내용 해시 (같은 ID라도 내용이 바뀌면 다시 토큰화)"""
+    digest = hashlib.blake2b(doc["content"].encode("utf-8"), digest_size=16).hexdigest()
+    return f"{doc['id']}:{digest}"
+
+
+def _top_k_positions(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    점수 내림차순 상위 top_k 위치 (동점 시 위치 오름차순, 전체 stable 정렬과 동일)
+
+    top_k가 전체보다 작으면 부분 선택(O(n))으로 k번째 점수를 구해 후보만 정렬합니다.
+    """
+    n = scores.size
+    if not 0 < top_k < n:
+        return np.argsort(-scores, kind="stable")[:top_k]
+
+    kth_score = np.partition(scores, n - top_k)[n - top_k]
+    above = np.flatnonzero(scores > kth_score)
+    ties = np.flatnonzero(scores == kth_score)[: top_k - above.size]
+    candidates = np.concatenate((above, ties))
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+def _rank_normalized(
+    doc_ids: np.ndarray, raw_scores: np.ndarray, top_k: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    양수 점수 문서를 sigmoid 정규화하여 상위 top_k 선택
+
+    포화 구간에서는 서로 다른 원시 점수가 같은 정규화 점수가 되므로 정규화 점수로 순위를 정합니다.
+
+    Returns:
+        (상위 문서 ID, 정규화 점수)
+    """
+    positive = np.flatnonzero(raw_scores > 0)
+    normalized_scores = 1.0 / (1.0 + np.exp(-raw_scores[positive]))
+    top_positions = _top_k_positions(normalized_scores, top_k)
+    return doc_ids[positive[top_positions]], normalized_scores[top_positions]
+
 
 class BM25Index:
     """
-    rank-bm25 기반 BM25 검색 인덱스
+    BM25+ 기반 검색 인덱스
 
     문서를 토큰화하여 BM25 인덱스를 구축하고,
     쿼리에 대한 키워드 기반 점수를 계산합니다.
@@ -33,9 +109,10 @@ class BM25Index:
 
     def __init__(self, tokenizer: KoreanTokenizer) -> None:
         self._tokenizer = tokenizer
-        self._bm25 = None
+        self._bm25: BM25PlusScorer | None = None
         self._documents: list[dict[str, Any]] = []
-        self._tokenized_corpus: list[list[str]] = []
+        # 인스턴스별 캐시 (메서드 데코레이터로 두면 클래스 전역 캐시가 인스턴스를 붙잡음)
+        self._tokenize_query = lru_cache(maxsize=_QUERY_CACHE_SIZE)(self._analyze_query)
 
         logger.info("BM25Index 초기화 완료")
 
@@ -44,36 +121,158 @@ class BM25Index:
         """인덱싱된 문서 수"""
         return len(self._documents)
 
-    def build(self, documents: list[dict[str, Any]]) -> None:
+    def build(
+        self,
+        documents: list[dict[str, Any]],
+        n_workers: int = 1,
+        token_cache: MutableMapping[str, list[str]] | None = None,
+    ) -> None:
         """
         문서 리스트로 BM25 인덱스 구축
 
         Args:
             documents: 인덱싱할 문서 리스트 (id, content, metadata 필드)
+            n_workers: 코퍼스 토큰화 프로세스 수 (1이면 현재 프로세스에서 처리).
+                문서 수가 _PARALLEL_MIN_DOCUMENTS 미만이거나 토크나이저를 피클링할 수
+                없으면 현재 프로세스에서 처리합니다. 각 워커는 토크나이저를 복제해
+                Kiwi를 새로 생성하며, 워커 내부 Kiwi 스레드 수는 토크나이저의
+                num_workers 설정을 따릅니다.
+            token_cache: 문서 토큰화 결과 캐시 (키: 문서 ID + 내용 해시).
+                재구축 시 같은 캐시를 넘기면 내용이 바뀌지 않은 문서는 Kiwi 분석을 건너뛰고,
+                새로 토큰화한 문서는 캐시에 추가합니다. shelve 등 영속 매핑도 사용할 수 있으나
+                토크나이저 설정(불용어/사용자 사전)이 바뀌면 캐시를 비워야 합니다.
         """
+        # 재구축 전에 토크나이저 사전(불용어/동의어 등)이 바뀌었을 수 있으므로 쿼리 캐시 초기화
+        self._tokenize_query.cache_clear()
+
         if not documents:
             self._documents = []
-            self._tokenized_corpus = []
             self._bm25 = None
             logger.info("BM25Index: 빈 인덱스 구축")
             return
 
-        try:
-            from rank_bm25 import BM25Plus
-        except ImportError as e:
-            raise ImportError(
-                "BM25Index를 사용하려면 rank-bm25가 필요합니다. "
-                "설치: uv add rank-bm25 또는 pip install rank-bm25"
-            ) from e
-
         self._documents = documents
-        contents = [doc["content"] for doc in documents]
-        self._tokenized_corpus = self._tokenizer.tokenize_batch(contents)
+        if token_cache is None:
+            tokenized_corpus = self._tokenize_corpus(
+                [doc["content"] for doc in documents], n_workers
+            )
+        else:
+            tokenized_corpus = self._tokenize_cached(documents, n_workers, token_cache)
         # BM25Plus: BM25Okapi 대비 IDF 하한선(delta)이 있어
         # 소규모 코퍼스에서도 안정적인 점수를 반환합니다.
-        self._bm25 = BM25Plus(self._tokenized_corpus)
+        self._bm25 = BM25PlusScorer.from_tokens(tokenized_corpus)
         logger.info(f"BM25Index: {len(documents)}개 문서 인덱싱 완료")
 
+    def save(self, path: str | Path) -> None:
+        """
+        인덱스를 디렉토리에 저장
+
+        문서와 용어 목록은 meta.pkl에, 포스팅 배열은 .npy 파일로 저장하여
+        load() 시 메모리 맵으로 열 수 있게 합니다. 토크나이저(Kiwi)는 저장하지 않습니다.
+
+        Args:
+            path: 저장할 디렉토리 (없으면 생성)
+        """
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        vocab = self._bm25.vocab if self._bm25 is not None else {}
+        meta = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "documents": self._documents,
+            # 용어 사전은 ID 순서(첫 등장 순서)로 삽입되어 있으므로 용어 목록만 저장
+            "terms": list(vocab),
+        }
+        with open(directory / _META_FILE, "wb") as f:
+            pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+        if self._bm25 is not None:
+            self._bm25.save(directory)
+
+    @classmethod
+    def load(
+        cls, path: str | Path, tokenizer: KoreanTokenizer, mmap_mode: str | None = "r"
+    ) -> BM25Index:
+        """
+        save()로 저장한 디렉토리에서 인덱스 복원 (재토큰화 없음)
+
+        Args:
+            path: save()로 저장한 디렉토리
+            tokenizer: 쿼리 토큰화에 사용할 토크나이저 (저장 시와 같은 설정이어야 함)
+            mmap_mode: 포스팅 배열의 np.load mmap_mode (None이면 메모리로 전부 읽음)
+
+        Raises:
+            ValueError: 지원하지 않는 형식 버전
+        """
+        directory = Path(path)
+        with open(directory / _META_FILE, "rb") as f:
+            meta = pickle.load(f)  # noqa: S301
+        if meta.get("format_version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 BM25 인덱스 형식: {meta.get('format_version')}")
+
+        index = cls(tokenizer=tokenizer)
+        index._documents = meta["documents"]
+        if index._documents:
+            vocab = {term: term_id for term_id, term in enumerate(meta["terms"])}
+            index._bm25 = BM25PlusScorer.load(
+                directory, vocab, len(index._documents), mmap_mode=mmap_mode
+            )
+        logger.info(f"BM25Index: {len(index._documents)}개 문서 인덱스 로드 완료")
+        return index
+
+    def _tokenize_cached(
+        self,
+        documents: list[dict[str, Any]],
+        n_workers: int,
+        token_cache: MutableMapping[str, list[str]],
+    ) -> list[list[str]]:
+        """캐시에 없는 문서만 토큰화하고 결과를 캐시에 기록 (문서 순서 유지)"""
+        keys = [_token_cache_key(doc) for doc in documents]
+        tokenized_corpus: list[list[str]] = []
+        misses: list[int] = []
+        for i, key in enumerate(keys):
+            cached = token_cache.get(key)
+            if cached is None:
+                misses.append(i)
+                cached = []
+            tokenized_corpus.append(cached)
+
+        if misses:
+            fresh = self._tokenize_corpus([documents[i]["content"] for i in misses], n_workers)
+            for i, tokens in zip(misses, fresh, strict=True):
+                tokenized_corpus[i] = tokens
+                token_cache[keys[i]] = tokens
+        logger.info(
+            f"BM25Index: 토큰 캐시 적중 {len(documents) - len(misses)}/{len(documents)}개 문서"
+        )
+        return tokenized_corpus
+
+    def _tokenize_corpus(self, contents: list[str], n_workers: int) -> list[list[str]]:
+        """코퍼스 토큰화 (n_workers > 1이면 연속 샤드로 나눠 프로세스 풀에서 처리, 순서 유지)"""
+        n_workers = min(n_workers, len(contents))
+        if n_workers <= 1 or len(contents) < _PARALLEL_MIN_DOCUMENTS:
+            return self._tokenizer.tokenize_batch(contents)
+
+        try:
+            pickle.dumps(self._tokenizer)
+        except TypeError as e:
+            logger.warning(f"BM25Index: 토크나이저 피클링 불가, 단일 프로세스로 토큰화합니다: {e}")
+            return self._tokenizer.tokenize_batch(contents)
+
+        shard_size = -(-len(contents) // n_workers)
+        shards = [
+            contents[start : start + shard_size]
+            for start in range(0, len(contents), shard_size)
+        ]
+        # spawn: fork 시 부모의 Kiwi 스레드 풀 상태가 복제되어 교착될 수 있으므로
+        # 토크나이저를 피클링으로 전달해 워커마다 Kiwi를 새로 생성
+        with ProcessPoolExecutor(
+            max_workers=len(shards),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_tokenizer_worker,
+            initargs=(self._tokenizer,),
+        ) as executor:
+            tokenized_shards = executor.map(_tokenize_shard, shards)
+            return list(chain.from_iterable(tokenized_shards))
+
     def search(self, query: str, top_k: int = 10) -> list[dict[str, Any]]:
         """
         BM25 키워드 검색 수행
@@ -88,29 +287,56 @@ class BM25Index:
         if self._bm25 is None or not self._documents:
             return []
 
-        query_tokens = self._tokenizer.tokenize(query)
-        if not query_tokens:
+        return self._search_tokens(list(self._tokenize_query(query)), top_k)
+
+    def search_batch(self, queries: list[str], top_k: int = 10) -> list[list[dict[str, Any]]]:
+        """
+        다수 쿼리 일괄 BM25 검색
+
+        쿼리 토큰화를 tokenize_batch()로 한 번에 수행하여 Kiwi 배치 분석을 활용합니다.
+        평가 파이프라인처럼 많은 쿼리를 한 번에 처리할 때 사용합니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+            top_k: 쿼리별 반환할 최대 결과 수
+
+        Returns:
+            쿼리 순서대로의 검색 결과 리스트 (각 결과는 search()와 동일한 형식)
+        """
+        if self._bm25 is None or not self._documents:
+            return [[] for _ in queries]
+
+        return [
+            self._search_tokens(query_tokens, top_k)
+            for query_tokens in self._tokenizer.tokenize_batch(queries)
+        ]
+
+    def _analyze_query(self, query: str) -> tuple[str, ...]:
+        """쿼리 토큰화 (LRU 캐시 키로 쓰이도록 해시 가능한 tuple 반환)"""
+        return tuple(self._tokenizer.tokenize(query))
+
+    def _search_tokens(self, query_tokens: list[str], top_k: int) -> list[dict[str, Any]]:
+        """토큰화된 쿼리로 상위 top_k 문서 검색"""
+        if self._bm25 is None or not query_tokens:
             return []
 
-        raw_scores = self._bm25.get_scores(query_tokens)
+        doc_ids, raw_scores, pruned_bound = self._bm25.get_candidate_scores(query_tokens, top_k)
+        top_ids, top_scores = _rank_normalized(doc_ids, raw_scores, top_k)
+
+        # sigmoid 포화 구간에서는 제외된 문서도 같은 정규화 점수가 될 수 있으므로
+        # k번째 점수가 제외 문서 상한보다 확실히 크지 않으면 전체 점수로 다시 순위 결정
+        if pruned_bound is not None and top_scores[-1] <= 1.0 / (1.0 + np.exp(-pruned_bound)):
+            top_ids, top_scores = _rank_normalized(
+                np.arange(len(self._documents)), self._bm25.get_scores(query_tokens), top_k
+            )
 
         results: list[dict[str, Any]] = []
-        for idx, raw_score in enumerate(raw_scores):
-            if raw_score > 0:
-                normalized_score = self._normalize_score(raw_score)
-                doc = self._documents[idx]
-                results.append({
-                    "id": doc["id"],
-                    "content": doc["content"],
-                    "score": normalized_score,
-                    "metadata": doc.get("metadata", {}),
-                })
-
-        # 점수 기준 내림차순 정렬
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:top_k]
-
-    @staticmethod
-    def _normalize_score(raw_score: float) -> float:
-        """BM25 원시 점수를 0~1 범위로 정규화 (sigmoid 함수)"""
-        return 1.0 / (1.0 + math.exp(-raw_score))
+        for idx, normalized_score in zip(top_ids.tolist(), top_scores.tolist(), strict=True):
+            doc = self._documents[idx]
+            results.append({
+                "id": doc["id"],
+                "content": doc["content"],
+                "score": normalized_score,
+                "metadata": doc.get("metadata", {}),
+            })
+        return results
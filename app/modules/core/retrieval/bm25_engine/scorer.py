@@ -0,0 +1,282 @@
+"""
+BM25+ 점수 계산기
+
+rank-bm25의 BM25Plus와 같은 공식(k1=1.5, b=0.75, delta=1)으로 점수를 계산하되,
+코퍼스를 용어별 포스팅 배열(CSC 형태)로 보관하여 쿼리 용어가 등장한 문서만 갱신합니다.
+
+점수 공식 (쿼리 용어 t, 문서 d):
+    idf(t) * (delta + tf(t, d) * (k1 + 1) / (k1 * (1 - b + b * |d| / avgdl) + tf(t, d)))
+
+- tf=0인 문서도 idf(t) * delta를 받으므로 이 값은 용어별 상수로 한 번에 더합니다.
+- tf>0인 포스팅의 나머지 항은 구축 시 미리 계산해 두고, 검색 시 슬라이스 합산만 수행합니다.
+- 상위 top_k만 필요한 경우 MaxScore 가지치기로 기여도가 낮은 용어의 긴 포스팅 스캔을 건너뜁니다.
+- save()/load()로 포스팅 배열을 .npy 파일로 저장하고 메모리 맵으로 다시 열 수 있습니다.
+
+의존성:
+- numpy
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Mapping
+from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+# 부동소수점 합산 순서 차이로 상한이 실제 점수보다 작아지지 않도록 두는 상대 여유
+_BOUND_SLACK = 1e-9
+
+# save()/load()가 사용하는 배열 파일 이름 (디렉토리 내 {이름}.npy)
+_ARRAY_NAMES = ("indptr", "posting_docs", "posting_weights", "delta_idf", "max_weights")
+
+
+def intern_corpus(corpus: list[list[str]]) -> tuple[dict[str, int], np.ndarray, np.ndarray]:
+    """
+    토큰 문자열을 정수 ID로 변환
+
+    같은 문자열을 문서마다 보관하지 않도록 용어 사전(첫 등장 순서로 ID 부여)과
+    전체 코퍼스를 이어 붙인 ID 배열 + 문서별 토큰 수로 분리합니다.
+    용어 수가 uint16 범위 이내면 ID 배열을 uint16으로 줄여 보관합니다 (그 외 int32).
+
+    Returns:
+        (용어 → ID 사전, 평탄화된 토큰 ID 배열, 문서별 토큰 수 배열)
+    """
+    vocab: dict[str, int] = {}
+    doc_lengths = np.fromiter(map(len, corpus), dtype=np.int64, count=len(corpus))
+    token_ids = np.fromiter(
+        (vocab.setdefault(token, len(vocab)) for tokens in corpus for token in tokens),
+        dtype=np.int32,
+        count=int(doc_lengths.sum()),
+    )
+    if len(vocab) <= np.iinfo(np.uint16).max + 1:
+        token_ids = token_ids.astype(np.uint16)
+    return vocab, token_ids, doc_lengths
+
+
+class BM25PlusScorer:
+    """
+    NumPy 기반 BM25+ 점수 계산기
+
+    Args:
+        vocab: 용어 → ID 사전 (모든 ID가 코퍼스에 한 번 이상 등장해야 함)
+        token_ids: 문서 순서대로 이어 붙인 토큰 ID 배열
+        doc_lengths: 문서별 토큰 수 배열
+        k1: 용어 빈도 포화 파라미터 (기본값: 1.5)
+        b: 문서 길이 정규화 파라미터 (기본값: 0.75)
+        delta: 용어당 하한 점수 (기본값: 1.0)
+
+    토큰 문자열 코퍼스로 생성할 때는 from_tokens()를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        vocab: dict[str, int],
+        token_ids: np.ndarray,
+        doc_lengths: np.ndarray,
+        k1: float = 1.5,
+        b: float = 0.75,
+        delta: float = 1.0,
+    ) -> None:
+        self.corpus_size = len(doc_lengths)
+        self._vocab = vocab
+
+        # (용어 ID, 문서 ID) 쌍별 빈도: 용어 우선 키로 정렬된 고유값을 구하면
+        # 용어별 연속 구간(indptr)으로 묶이고 구간 내 문서 ID는 오름차순
+        flat_ids = np.asarray(token_ids, dtype=np.int64)
+        doc_of_token = np.repeat(np.arange(self.corpus_size, dtype=np.int64), doc_lengths)
+        stride = max(self.corpus_size, 1)
+        pair_keys, pair_tfs = np.unique(flat_ids * stride + doc_of_token, return_counts=True)
+        terms = pair_keys // stride
+        docs = (pair_keys % stride).astype(np.intp)
+        tfs = pair_tfs.astype(np.float64)
+        doc_freqs = np.bincount(terms, minlength=len(vocab))
+        self._indptr: list[int] = [0, *np.cumsum(doc_freqs).tolist()]
+
+        idf = np.log((self.corpus_size + 1) / doc_freqs)
+        doc_len = np.asarray(doc_lengths, dtype=np.float64)
+        avgdl = float(doc_len.mean()) if self.corpus_size else 0.0
+        length_norm = k1 * (1 - b + b * doc_len / avgdl) if avgdl > 0 else np.full_like(doc_len, k1)
+
+        self._posting_docs = docs
+        self._posting_weights = idf[terms] * tfs * (k1 + 1) / (length_norm[docs] + tfs)
+        self._delta_idf: list[float] = (delta * idf).tolist()
+        # 용어별 최대 포스팅 가중치 (MaxScore 상한)
+        self._max_weights: list[float] = (
+            np.maximum.reduceat(self._posting_weights, self._indptr[:-1]).tolist()
+            if vocab
+            else []
+        )
+
+    @property
+    def vocab(self) -> Mapping[str, int]:
+        """용어 → ID 사전 (읽기 전용, ID 순서 = 첫 등장 순서)"""
+        return MappingProxyType(self._vocab)
+
+    @classmethod
+    def from_tokens(
+        cls,
+        corpus: list[list[str]],
+        k1: float = 1.5,
+        b: float = 0.75,
+        delta: float = 1.0,
+    ) -> BM25PlusScorer:
+        """토큰 문자열 코퍼스로 생성 (정수 ID 변환 포함)"""
+        vocab, token_ids, doc_lengths = intern_corpus(corpus)
+        return cls(vocab, token_ids, doc_lengths, k1=k1, b=b, delta=delta)
+
+    def save(self, directory: str | Path) -> None:
+        """
+        점수 계산에 필요한 배열을 디렉토리에 .npy 파일로 저장
+
+        용어 사전과 문서 수는 저장하지 않으므로 load() 호출 시 함께 전달해야 합니다.
+        """
+        directory = Path(directory)
+        arrays = {
+            "indptr": np.asarray(self._indptr, dtype=np.int64),
+            "posting_docs": self._posting_docs,
+            "posting_weights": self._posting_weights,
+            "delta_idf": np.asarray(self._delta_idf, dtype=np.float64),
+            "max_weights": np.asarray(self._max_weights, dtype=np.float64),
+        }
+        for name in _ARRAY_NAMES:
+            np.save(directory / f"{name}.npy", arrays[name])
+
+    @classmethod
+    def load(
+        cls,
+        directory: str | Path,
+        vocab: dict[str, int],
+        corpus_size: int,
+        mmap_mode: str | None = "r",
+    ) -> BM25PlusScorer:
+        """
+        save()로 저장한 배열로 점수 계산기 복원 (포스팅 재계산 없음)
+
+        포스팅 배열은 기본적으로 읽기 전용 메모리 맵으로 열어 검색 시 필요한 페이지만
+        읽습니다. 용어 수 크기의 배열(indptr 등)은 검색 루프의 스칼라 조회를 위해 리스트로 변환합니다.
+
+        Args:
+            directory: save()로 저장한 디렉토리
+            vocab: 저장 당시의 용어 → ID 사전
+            corpus_size: 저장 당시의 문서 수
+            mmap_mode: np.load의 mmap_mode (None이면 메모리로 전부 읽음)
+        """
+        directory = Path(directory)
+        arrays = {
+            name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode) for name in _ARRAY_NAMES
+        }
+        scorer = cls.__new__(cls)
+        scorer.corpus_size = corpus_size
+        scorer._vocab = vocab
+        scorer._indptr = arrays["indptr"].tolist()
+        scorer._posting_docs = arrays["posting_docs"]
+        scorer._posting_weights = arrays["posting_weights"]
+        scorer._delta_idf = arrays["delta_idf"].tolist()
+        scorer._max_weights = arrays["max_weights"].tolist()
+        return scorer
+
+    def get_scores(self, query_tokens: list[str]) -> np.ndarray:
+        """
+        전체 문서에 대한 쿼리 BM25+ 점수
+
+        Args:
+            query_tokens: 토큰화된 쿼리 (중복 용어는 중복 횟수만큼 반영)
+
+        Returns:
+            문서 순서대로의 점수 배열 (shape: (corpus_size,))
+        """
+        terms = self._query_terms(query_tokens)
+        scores = np.zeros(self.corpus_size, dtype=np.float64)
+        for term_id, count in terms:
+            start, end = self._indptr[term_id], self._indptr[term_id + 1]
+            # 한 용어의 포스팅 내 문서 ID는 고유하므로 fancy index 누적이 안전
+            scores[self._posting_docs[start:end]] += count * self._posting_weights[start:end]
+        return self._add_floor(scores, terms)
+
+    def get_candidate_scores(
+        self, query_tokens: list[str], top_k: int
+    ) -> tuple[np.ndarray, np.ndarray, float | None]:
+        """
+        MaxScore 가지치기로 상위 top_k 후보 문서만 점수 계산
+
+        최대 기여도가 큰 용어부터 누적하다가, 현재 k번째 점수가 남은 용어 상한의 합보다 커지면
+        아직 등장하지 않은 문서는 상위 top_k에 들 수 없으므로 누적을 멈춥니다.
+        이후 남은 용어는 후보 문서만 포스팅에서 이진 탐색으로 조회합니다.
+        등록 용어가 1개 이하이거나 top_k가 코퍼스 크기 이상이면 전체 점수를 계산합니다.
+
+        Args:
+            query_tokens: 토큰화된 쿼리
+            top_k: 필요한 상위 문서 수
+
+        Returns:
+            (후보 문서 ID 오름차순, 후보 점수, 제외된 문서의 점수 상한 또는 None)
+            후보 점수는 get_scores()의 해당 문서 점수와 동일합니다.
+        """
+        terms = self._query_terms(query_tokens)
+        n = self.corpus_size
+        if len(terms) <= 1 or not 0 < top_k < n:
+            return np.arange(n), self.get_scores(query_tokens), None
+
+        # remaining[i]: i번째 이후 용어들이 더할 수 있는 점수 상한
+        remaining = [0.0] * (len(terms) + 1)
+        for i in range(len(terms) - 1, -1, -1):
+            term_id, count = terms[i]
+            remaining[i] = remaining[i + 1] + count * self._max_weights[term_id]
+        remaining = [bound * (1 + _BOUND_SLACK) for bound in remaining]
+
+        scores = np.zeros(n, dtype=np.float64)
+        for i, (term_id, count) in enumerate(terms):
+            if i > 0:
+                kth_score = np.partition(scores, n - top_k)[n - top_k]
+                if kth_score > remaining[i]:
+                    break
+            start, end = self._indptr[term_id], self._indptr[term_id + 1]
+            scores[self._posting_docs[start:end]] += count * self._posting_weights[start:end]
+        else:
+            return np.arange(n), self._add_floor(scores, terms), None
+
+        upper = scores + remaining[i]
+        candidates = np.flatnonzero(upper >= kth_score)
+        excluded = upper[upper < kth_score]
+        candidate_scores = scores[candidates]
+        for term_id, count in terms[i:]:
+            start, end = self._indptr[term_id], self._indptr[term_id + 1]
+            term_docs = self._posting_docs[start:end]
+            pos = np.minimum(np.searchsorted(term_docs, candidates), end - start - 1)
+            hit = term_docs[pos] == candidates
+            candidate_scores[hit] += count * self._posting_weights[start:end][pos[hit]]
+
+        pruned_bound = float(excluded.max()) + self._floor(terms) if excluded.size else None
+        return candidates, self._add_floor(candidate_scores, terms), pruned_bound
+
+    def _query_terms(self, query_tokens: list[str]) -> list[tuple[int, int]]:
+        """
+        쿼리의 등록 용어별 (용어 ID, 반복 횟수)
+
+        get_scores()와 get_candidate_scores()가 같은 순서로 합산하도록
+        최대 기여도 내림차순(동률 시 첫 등장 순서)으로 정렬합니다.
+        """
+        counts = Counter(
+            term_id for term_id in map(self._vocab.get, query_tokens) if term_id is not None
+        )
+        return sorted(
+            counts.items(),
+            key=lambda item: item[1] * self._max_weights[item[0]],
+            reverse=True,
+        )
+
+    def _floor(self, terms: list[tuple[int, int]]) -> float:
+        """tf와 무관하게 모든 문서가 받는 idf * delta 합"""
+        floor = 0.0
+        for term_id, count in terms:
+            floor += count * self._delta_idf[term_id]
+        return floor
+
+    def _add_floor(self, scores: np.ndarray, terms: list[tuple[int, int]]) -> np.ndarray:
+        """점수 배열에 idf * delta 하한을 더함"""
+        floor = self._floor(terms)
+        if floor:
+            scores += floor
+        return scores
@@ -14,7 +14,10 @@ Kiwi 한국어 형태소 분석기를 래핑하여 BM25 검색에 필요한
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+import pickle
+from collections.abc import Iterable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from app.modules.core.retrieval.bm25.stopwords import StopwordFilter
@@ -32,6 +35,21 @@ _MEANINGFUL_POS_TAGS = frozenset(
 )
 
 
+@lru_cache(maxsize=4)
+def _get_kiwi(num_workers: int | None) -> Kiwi:  # type: ignore[name-defined]  # noqa: F821
+    """
+    프로세스 공유 Kiwi 인스턴스 (num_workers별 1개)
+
+    Kiwi 생성은 형태소 모델 전체를 메모리에 로드하므로 토크나이저마다 만들지 않고 재사용합니다.
+    토크나이저는 분석만 수행하고 Kiwi 상태(사용자 단어 등)를 변경하지 않으므로 공유해도 안전합니다.
+    """
+    from kiwipiepy import Kiwi
+
+    kiwi = Kiwi(num_workers=num_workers)
+    logger.debug("Kiwi 형태소 분석기 로드 완료")
+    return kiwi
+
+
 class KoreanTokenizer:
     """
     Kiwi 기반 한국어 형태소 토크나이저
@@ -43,6 +61,7 @@ class KoreanTokenizer:
         stopword_filter: 불용어 필터 (선택적, DI 주입)
         synonym_manager: 동의어 관리자 (선택적, DI 주입)
         user_dictionary: 사용자 사전 (선택적, DI 주입)
+        num_workers: Kiwi 내부 분석 스레드 수 (None이면 Kiwi 기본값: 가용 코어 수)
 
     사용 예시:
         tokenizer = KoreanTokenizer()
@@ -55,13 +74,15 @@ class KoreanTokenizer:
         stopword_filter: StopwordFilter | None = None,
         synonym_manager: SynonymManager | None = None,
         user_dictionary: UserDictionary | None = None,
+        num_workers: int | None = None,
     ) -> None:
         self._stopword_filter = stopword_filter
         self._synonym_manager = synonym_manager
         self._user_dictionary = user_dictionary
+        self._num_workers = num_workers
 
-        # Kiwi 인스턴스 (지연 초기화)
-        self._kiwi = self._initialize_kiwi()
+        # Kiwi 인스턴스 (프로세스 공유)
+        self._kiwi = self._initialize_kiwi(num_workers)
 
         logger.info(
             "KoreanTokenizer 초기화 완료 "
@@ -70,14 +91,36 @@ class KoreanTokenizer:
             f"user_dictionary={'있음' if user_dictionary else '없음'})"
         )
 
-    def _initialize_kiwi(self) -> Kiwi:  # type: ignore[name-defined]  # noqa: F821
-        """Kiwi 형태소 분석기 초기화"""
-        try:
-            from kiwipiepy import Kiwi
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        피클링 상태 (Kiwi 인스턴스는 피클링 불가하므로 제외)
 
-            kiwi = Kiwi()
-            logger.debug("Kiwi 형태소 분석기 로드 완료")
-            return kiwi
+        Raises:
+            TypeError: 주입된 전처리 모듈을 피클링할 수 없는 경우
+        """
+        state = self.__dict__.copy()
+        del state["_kiwi"]
+        for name in ("_stopword_filter", "_synonym_manager", "_user_dictionary"):
+            try:
+                pickle.dumps(state[name])
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                raise TypeError(
+                    f"KoreanTokenizer 전처리 모듈({name.lstrip('_')})을 피클링할 수 없어 "
+                    f"프로세스 간 전달이 불가능합니다: {e}"
+                ) from e
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """언피클링 시 Kiwi 재생성 (프로세스 풀 워커 등)"""
+        self.__dict__.update(state)
+        self._kiwi = self._initialize_kiwi(self._num_workers)
+
+    def _initialize_kiwi(
+        self, num_workers: int | None = None
+    ) -> Kiwi:  # type: ignore[name-defined]  # noqa: F821
+        """Kiwi 형태소 분석기 초기화 (같은 num_workers의 인스턴스는 프로세스 내에서 공유)"""
+        try:
+            return _get_kiwi(num_workers)
         except ImportError as e:
             raise ImportError(
                 "KoreanTokenizer를 사용하려면 kiwipiepy가 필요합니다. "
@@ -104,45 +147,100 @@ class KoreanTokenizer:
         if not text or not text.strip():
             return []
 
+        processed_text, restore_map = self._preprocess(text)
+        return self._postprocess(self._kiwi.tokenize(processed_text), restore_map)
+
+    def tokenize_batch(self, texts: list[str]) -> list[list[str]]:
+        """
+        다수 텍스트 일괄 토큰화
+
+        전처리(사용자 사전 보호, 동의어 확장)를 먼저 적용한 뒤,
+        Kiwi 배치 분석을 한 번만 호출하여 Kiwi 내부 스레드 풀에서 병렬로 처리합니다.
+        배치 분석을 사용할 수 없는 단일 스레드 모드(num_workers=0)에서는 문서별로 처리합니다.
+
+        Args:
+            texts: 토큰화할 텍스트 리스트
+
+        Returns:
+            각 텍스트별 토큰 리스트의 리스트
+        """
+        results: list[list[str]] = [[] for _ in texts]
+        positions: list[int] = []
+        processed_texts: list[str] = []
+        restore_maps: list[dict[str, str]] = []
+
+        for position, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            processed_text, restore_map = self._preprocess(text)
+            positions.append(position)
+            processed_texts.append(processed_text)
+            restore_maps.append(restore_map)
+
+        if not processed_texts:
+            return results
+
+        # num_workers=0(단일 스레드 모드)은 Kiwi 배치 분석을 지원하지 않으므로 문서별로 분석
+        if self._num_workers == 0:
+            analyzed = [self._kiwi.tokenize(text) for text in processed_texts]
+        else:
+            analyzed = list(self._kiwi.tokenize(processed_texts))
+
+        for position, kiwi_tokens, restore_map in zip(
+            positions, analyzed, restore_maps, strict=True
+        ):
+            results[position] = self._postprocess(kiwi_tokens, restore_map)
+
+        return results
+
+    def _preprocess(self, text: str) -> tuple[str, dict[str, str]]:
+        """
+        Kiwi 분석 전 전처리
+
+        1. UserDictionary 보호 (합성어 → 임시 토큰)
+        2. SynonymManager 확장 (동의어 → 표준어)
+
+        Returns:
+            (전처리된 텍스트, UserDictionary 복원 맵) 튜플
+        """
         processed_text = text
         restore_map: dict[str, str] = {}
 
-        # 1. UserDictionary 보호 (합성어 → 임시 토큰)
         if self._user_dictionary:
             processed_text, restore_map = self._user_dictionary.protect_entries(
                 processed_text
             )
 
-        # 2. SynonymManager 확장 (동의어 → 표준어)
         if self._synonym_manager:
             processed_text = self._synonym_manager.expand_query(processed_text)
 
-        # 3. Kiwi 형태소 분석 — 의미 있는 품사만 추출
-        tokens: list[str] = []
-        for token in self._kiwi.tokenize(processed_text):
-            if token.tag in _MEANINGFUL_POS_TAGS:
-                form = token.form
-                # UserDictionary 복원
-                if restore_map:
-                    form = self._user_dictionary.restore_entries(  # type: ignore[union-attr]
-                        form, restore_map
-                    )
-                tokens.append(form)
-
-        # 4. StopwordFilter 적용
-        if self._stopword_filter:
-            tokens = self._stopword_filter.filter(tokens)
+        return processed_text, restore_map
 
-        return tokens
-
-    def tokenize_batch(self, texts: list[str]) -> list[list[str]]:
+    def _postprocess(
+        self, kiwi_tokens: Iterable[Any], restore_map: dict[str, str]
+    ) -> list[str]:
         """
-        다수 텍스트 일괄 토큰화
+        Kiwi 분석 결과 후처리
 
-        Args:
-            texts: 토큰화할 텍스트 리스트
+        3. 의미 있는 품사만 추출 (+ UserDictionary 복원)
+        4. StopwordFilter 적용 (불용어 제거)
 
-        Returns:
-            각 텍스트별 토큰 리스트의 리스트
+        복원할 사용자 사전 엔트리가 없으면 품사 선택과 불용어 제거를 한 번의 루프로 처리합니다.
         """
-        return [self.tokenize(text) for text in texts]
+        stopwords = (
+            self._stopword_filter.active_stopwords if self._stopword_filter else frozenset()
+        )
+
+        if not restore_map:
+            return [
+                token.form
+                for token in kiwi_tokens
+                if token.tag in _MEANINGFUL_POS_TAGS and token.form not in stopwords
+            ]
+
+        # UserDictionary 복원 (토큰별이 아닌 문서당 한 번) 후 복원된 형태로 불용어 판정
+        tokens = self._user_dictionary.restore_tokens(  # type: ignore[union-attr]
+            [token.form for token in kiwi_tokens if token.tag in _MEANINGFUL_POS_TAGS],
+            restore_map,
+        )
+        return [token for token in tokens if token not in stopwords]
@@ -12,15 +12,24 @@ Cohere의 Rerank API를 사용한 고품질 리랭킹.
 참고: https://docs.cohere.com/reference/rerank
 """
 
+import asyncio
 from typing import Any
 
 import httpx
 
 from .....lib.logger import get_logger
 from ..interfaces import SearchResult
+from .json_codec import json_dumps as _json_dumps
 
 logger = get_logger(__name__)
 
+# 문서 문자 수 합이 이 값 이상이면 요청 본문 JSON 인코딩을 스레드에서 수행
+# (대용량 문서 리랭킹 시 이벤트 루프 블로킹 방지, 작은 요청은 스레드 전환 비용이 더 큼)
+_THREAD_ENCODE_MIN_CHARS = 200_000
+
+# 공유 HTTP 클라이언트 커넥션 풀 한도 (동시 리랭킹 요청 간 연결 재사용)
+_CONNECTION_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
 
 class CohereReranker:
     """
@@ -31,6 +40,7 @@ class CohereReranker:
     - 100+ 언어 지원 (multilingual 모델)
     - 4096 토큰 컨텍스트
     - Graceful Fallback (오류 시 원본 반환)
+    - 공유 HTTP 클라이언트로 요청 간 커넥션 재사용 (TCP/TLS 핸드셰이크 1회)
     """
 
     def __init__(
@@ -57,6 +67,9 @@ class CohereReranker:
         self.timeout = timeout
         self.max_tokens_per_doc = max_tokens_per_doc
 
+        # 공유 HTTP 클라이언트 (initialize() 또는 첫 요청 시 생성, close()에서 종료)
+        self._client: httpx.AsyncClient | None = None
+
         # 통계 추적
         self.stats = {
             "total_requests": 0,
@@ -67,13 +80,23 @@ class CohereReranker:
         logger.info(f"CohereReranker 초기화: model={model}, endpoint={endpoint}")
 
     async def initialize(self) -> None:
-        """리랭커 초기화 (Cohere는 HTTP API이므로 추가 초기화 불필요)"""
+        """리랭커 초기화 (공유 HTTP 클라이언트 생성)"""
+        self._get_client()
         logger.debug("CohereReranker 초기화 완료 (HTTP API 사용)")
 
     async def close(self) -> None:
-        """리소스 정리 (HTTP 클라이언트는 요청마다 생성/소멸)"""
+        """리소스 정리 (공유 HTTP 클라이언트 종료)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         logger.info("CohereReranker 종료 완료")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 HTTP 클라이언트 반환 (initialize() 없이 호출된 경우 지연 생성)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout, limits=_CONNECTION_LIMITS)
+        return self._client
+
     async def rerank(
         self,
         query: str,
@@ -124,17 +147,21 @@ class CohereReranker:
                 f"documents={len(documents)}, top_n={request_data['top_n']}"
             )
 
-            # HTTP 요청 실행 (asyncio + httpx)
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    self.endpoint,
-                    json=request_data,
-                    headers=headers,
-                    timeout=self.timeout,
-                )
-                response.raise_for_status()
+            if sum(map(len, documents)) >= _THREAD_ENCODE_MIN_CHARS:
+                body = await asyncio.to_thread(_json_dumps, request_data)
+            else:
+                body = _json_dumps(request_data)
+
+            # HTTP 요청 실행 (공유 클라이언트로 커넥션 재사용)
+            response = await self._get_client().post(
+                self.endpoint,
+                content=body,
+                headers=headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
 
-                rerank_response = response.json()
+            rerank_response = response.json()
 
             # 결과 재구성 (새 SearchResult 객체 생성, 불변성 유지)
             reranked_results = []
@@ -176,6 +203,44 @@ class CohereReranker:
             logger.error(f"Cohere 리랭킹 실패: {e}")
             return results  # 실패 시 원본 결과 반환
 
+    async def rerank_many(
+        self,
+        pairs: list[tuple[str, list[SearchResult]]],
+        top_n: int | None = None,
+        *,
+        max_concurrency: int = 10,
+    ) -> list[list[SearchResult]]:
+        """
+        다수 쿼리 동시 리랭킹 (평가/오프라인 파이프라인용)
+
+        쿼리별 rerank() 요청을 동시 실행 수를 제한하여 병렬로 보내며,
+        공유 HTTP 클라이언트의 커넥션 풀을 재사용합니다.
+        개별 요청 실패 시 rerank()와 같이 해당 쿼리의 원본 결과를 반환합니다.
+
+        Args:
+            pairs: (쿼리, 원본 검색 결과) 리스트
+            top_n: 쿼리별 리랭킹 후 반환할 최대 결과 수 (None이면 전체)
+            max_concurrency: 동시에 진행할 최대 요청 수
+
+        Returns:
+            pairs 순서대로의 리랭킹 결과 리스트
+
+        Raises:
+            ValueError: max_concurrency가 1 미만인 경우
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency는 1 이상이어야 합니다: {max_concurrency}")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _rerank_one(query: str, results: list[SearchResult]) -> list[SearchResult]:
+            async with semaphore:
+                return await self.rerank(query, results, top_n=top_n)
+
+        return list(
+            await asyncio.gather(*(_rerank_one(query, results) for query, results in pairs))
+        )
+
     def supports_caching(self) -> bool:
         """
         캐싱 지원 여부 반환 (IReranker 인터페이스 구현)
@@ -21,6 +21,7 @@ import httpx
 
 from .....lib.logger import get_logger
 from ..interfaces import SearchResult
+from .json_codec import json_dumps
 
 logger = get_logger(__name__)
 
@@ -193,7 +194,7 @@ class JinaColBERTReranker:
         async with httpx.AsyncClient() as client:
             response = await client.post(
                 self.config.endpoint,
-                json=request_data,
+                content=json_dumps(request_data),
                 headers=headers,
                 timeout=self.config.timeout,
             )
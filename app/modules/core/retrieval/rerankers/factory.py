@@ -22,6 +22,7 @@ approach별 설명:
 """
 
 import os
+from collections.abc import Callable
 from typing import Any
 
 from .....lib.logger import get_logger
@@ -36,6 +37,103 @@ from .openrouter_reranker import OpenRouterReranker
 logger = get_logger(__name__)
 
 
+# ========================================
+# provider별 생성 함수
+# ========================================
+# 시그니처: (api_key, provider_config, defaults) -> IReranker
+# provider_config의 값이 우선이며, 없으면 레지스트리 기본값을 사용합니다.
+
+RerankerBuilder = Callable[[str | None, dict[str, Any], dict[str, Any]], IReranker]
+
+
+def _build_gemini(
+    api_key: str | None, provider_config: dict[str, Any], defaults: dict[str, Any]
+) -> IReranker:
+    return GeminiFlashReranker(
+        api_key=api_key,
+        model=provider_config.get("model", defaults["model"]),
+        max_documents=provider_config.get("max_documents", defaults["max_documents"]),
+        timeout=provider_config.get("timeout", defaults["timeout"]),
+    )
+
+
+def _build_openai_llm(
+    api_key: str | None, provider_config: dict[str, Any], defaults: dict[str, Any]
+) -> IReranker:
+    return OpenAILLMReranker(
+        api_key=api_key,
+        model=provider_config.get("model", defaults["model"]),
+        max_documents=provider_config.get("max_documents", defaults["max_documents"]),
+        timeout=provider_config.get("timeout", defaults["timeout"]),
+        verbosity=provider_config.get("verbosity", defaults["verbosity"]),
+        reasoning_effort=provider_config.get(
+            "reasoning_effort", defaults["reasoning_effort"]
+        ),
+    )
+
+
+def _build_openrouter(
+    api_key: str | None, provider_config: dict[str, Any], defaults: dict[str, Any]
+) -> IReranker:
+    return OpenRouterReranker(
+        api_key=api_key,
+        model=provider_config.get("model", defaults["model"]),
+        max_documents=provider_config.get("max_documents", defaults["max_documents"]),
+        timeout=provider_config.get("timeout", defaults["timeout"]),
+    )
+
+
+def _build_jina(
+    api_key: str | None, provider_config: dict[str, Any], defaults: dict[str, Any]
+) -> IReranker:
+    return JinaReranker(
+        api_key=api_key,
+        model=provider_config.get("model", defaults["model"]),
+        timeout=provider_config.get("timeout", defaults.get("timeout", 30)),
+    )
+
+
+def _build_cohere(
+    api_key: str | None, provider_config: dict[str, Any], defaults: dict[str, Any]
+) -> IReranker:
+    return CohereReranker(
+        api_key=api_key,
+        model=provider_config.get("model", defaults["model"]),
+        timeout=provider_config.get("timeout", defaults.get("timeout", 30)),
+    )
+
+
+def _build_jina_colbert(
+    api_key: str | None, provider_config: dict[str, Any], defaults: dict[str, Any]
+) -> IReranker:
+    colbert_config = ColBERTRerankerConfig(
+        enabled=True,
+        api_key=api_key,
+        model=provider_config.get("model", defaults["model"]),
+        timeout=provider_config.get("timeout", defaults.get("timeout", 10)),
+        max_documents=provider_config.get("max_documents", defaults.get("max_documents", 20)),
+    )
+    return JinaColBERTReranker(config=colbert_config)
+
+
+def _build_local(
+    api_key: str | None, provider_config: dict[str, Any], defaults: dict[str, Any]
+) -> IReranker:
+    """로컬 CrossEncoder 리랭커 생성 (API 키 불필요, 선택적 의존성)"""
+    try:
+        from .local_reranker import LocalReranker
+    except ImportError:
+        raise ImportError(
+            "LocalReranker를 사용하려면 sentence-transformers가 필요합니다. "
+            "설치: uv sync --extra local-reranker"
+        )
+
+    return LocalReranker(
+        model_name=provider_config.get("model", defaults["model"]),
+        batch_size=provider_config.get("batch_size", defaults["batch_size"]),
+    )
+
+
 # ========================================
 # 레지스트리 정의
 # ========================================
@@ -63,6 +161,7 @@ PROVIDER_REGISTRY: dict[str, dict[str, Any]] = {
     "google": {
         "class": GeminiFlashReranker,
         "api_key_env": "GOOGLE_API_KEY",
+        "builders": {"llm": _build_gemini},
         "default_config": {
             "model": "gemini-flash-lite-latest",
             "max_documents": 20,
@@ -72,6 +171,7 @@ PROVIDER_REGISTRY: dict[str, dict[str, Any]] = {
     "openai": {
         "class": OpenAILLMReranker,
         "api_key_env": "OPENAI_API_KEY",
+        "builders": {"llm": _build_openai_llm},
         "default_config": {
             "model": "gpt-5-nano",
             "max_documents": 20,
@@ -84,6 +184,10 @@ PROVIDER_REGISTRY: dict[str, dict[str, Any]] = {
         "class_cross_encoder": JinaReranker,
         "class_late_interaction": JinaColBERTReranker,
         "api_key_env": "JINA_API_KEY",
+        "builders": {
+            "cross-encoder": _build_jina,
+            "late-interaction": _build_jina_colbert,
+        },
         "default_config": {
             "model": "jina-reranker-v2-base-multilingual",
             "top_n": 10,
@@ -100,6 +204,7 @@ PROVIDER_REGISTRY: dict[str, dict[str, Any]] = {
     "cohere": {
         "class": CohereReranker,
         "api_key_env": "COHERE_API_KEY",
+        "builders": {"cross-encoder": _build_cohere},
         "default_config": {
             "model": "rerank-multilingual-v3.0",
             "top_n": 10,
@@ -109,6 +214,7 @@ PROVIDER_REGISTRY: dict[str, dict[str, Any]] = {
     "openrouter": {
         "class": OpenRouterReranker,
         "api_key_env": "OPENROUTER_API_KEY",
+        "builders": {"llm": _build_openrouter},
         "default_config": {
             "model": "google/gemini-2.5-flash-lite",
             "max_documents": 20,
@@ -118,6 +224,8 @@ PROVIDER_REGISTRY: dict[str, dict[str, Any]] = {
     "sentence-transformers": {
         "class": None,  # 조건부 로드
         "api_key_env": None,  # API 키 불필요
+        "builders": {"local": _build_local},
+        "config_alias": "local",  # reranking.local 키로도 설정 가능
         "default_config": {
             "model": "cross-encoder/ms-marco-MiniLM-L-12-v2",
             "batch_size": 32,
@@ -126,6 +234,12 @@ PROVIDER_REGISTRY: dict[str, dict[str, Any]] = {
 }
 
 
+# approach별 기본 설정 키 (없으면 default_config 사용)
+_APPROACH_DEFAULTS_KEY: dict[str, str] = {
+    "late-interaction": "default_config_colbert",
+}
+
+
 # ========================================
 # Factory 클래스
 # ========================================
@@ -181,175 +295,26 @@ class RerankerFactoryV2:
                 f"지원 목록: {list(PROVIDER_REGISTRY.keys())}"
             )
 
-        # 리랭커 생성
-        if approach == "llm":
-            return RerankerFactoryV2._create_llm_reranker(provider, reranking_config)
-        elif approach == "cross-encoder":
-            return RerankerFactoryV2._create_cross_encoder_reranker(
-                provider, reranking_config
-            )
-        elif approach == "late-interaction":
-            return RerankerFactoryV2._create_late_interaction_reranker(
-                provider, reranking_config
-            )
-        elif approach == "local":
-            return RerankerFactoryV2._create_local_reranker(provider, reranking_config)
-        else:
-            raise ValueError(f"알 수 없는 approach: {approach}")
-
-    @staticmethod
-    def _create_llm_reranker(provider: str, config: dict[str, Any]) -> IReranker:
-        """LLM approach 리랭커 생성"""
-        provider_info = PROVIDER_REGISTRY[provider]
-        api_key = os.getenv(provider_info["api_key_env"])
-
-        if not api_key:
-            raise ValueError(
-                f"{provider_info['api_key_env']} 환경변수가 설정되지 않았습니다. "
-                f"API key가 필요합니다."
-            )
-
-        provider_config = config.get(provider, {})
-        defaults = provider_info["default_config"]
-
-        reranker: IReranker
-        if provider == "google":
-            reranker = GeminiFlashReranker(
-                api_key=api_key,
-                model=provider_config.get("model", defaults["model"]),
-                max_documents=provider_config.get(
-                    "max_documents", defaults["max_documents"]
-                ),
-                timeout=provider_config.get("timeout", defaults["timeout"]),
-            )
-        elif provider == "openai":
-            reranker = OpenAILLMReranker(
-                api_key=api_key,
-                model=provider_config.get("model", defaults["model"]),
-                max_documents=provider_config.get(
-                    "max_documents", defaults["max_documents"]
-                ),
-                timeout=provider_config.get("timeout", defaults["timeout"]),
-                verbosity=provider_config.get("verbosity", defaults["verbosity"]),
-                reasoning_effort=provider_config.get(
-                    "reasoning_effort", defaults["reasoning_effort"]
-                ),
-            )
-        elif provider == "openrouter":
-            reranker = OpenRouterReranker(
-                api_key=api_key,
-                model=provider_config.get("model", defaults["model"]),
-                max_documents=provider_config.get(
-                    "max_documents", defaults["max_documents"]
-                ),
-                timeout=provider_config.get("timeout", defaults["timeout"]),
-            )
-        else:
-            raise ValueError(
-                f"LLM approach에서 {provider}는 아직 지원되지 않습니다."
-            )
-
-        logger.info(f"✅ {reranker.__class__.__name__} 생성 완료")
-        return reranker
-
-    @staticmethod
-    def _create_cross_encoder_reranker(
-        provider: str, config: dict[str, Any]
-    ) -> IReranker:
-        """Cross-encoder approach 리랭커 생성"""
         provider_info = PROVIDER_REGISTRY[provider]
-        api_key = os.getenv(provider_info["api_key_env"])
+        builder: RerankerBuilder = provider_info["builders"][approach]
 
-        if not api_key:
+        api_key_env = provider_info["api_key_env"]
+        api_key = os.getenv(api_key_env) if api_key_env else None
+        if api_key_env and not api_key:
             raise ValueError(
-                f"{provider_info['api_key_env']} 환경변수가 설정되지 않았습니다. "
+                f"{api_key_env} 환경변수가 설정되지 않았습니다. "
                 f"API key가 필요합니다."
             )
 
-        provider_config = config.get(provider, {})
-        defaults = provider_info["default_config"]
-
-        reranker: IReranker
-        if provider == "jina":
-            reranker = JinaReranker(
-                api_key=api_key,
-                model=provider_config.get("model", defaults["model"]),
-                timeout=provider_config.get("timeout", defaults.get("timeout", 30)),
-            )
-        elif provider == "cohere":
-            reranker = CohereReranker(
-                api_key=api_key,
-                model=provider_config.get("model", defaults["model"]),
-                timeout=provider_config.get("timeout", defaults.get("timeout", 30)),
-            )
-        else:
-            raise ValueError(
-                f"Cross-encoder approach에서 {provider}는 아직 지원되지 않습니다."
-            )
-
-        logger.info(f"✅ {reranker.__class__.__name__} 생성 완료")
-        return reranker
-
-    @staticmethod
-    def _create_late_interaction_reranker(
-        provider: str, config: dict[str, Any]
-    ) -> IReranker:
-        """Late-interaction approach 리랭커 생성"""
-        provider_info = PROVIDER_REGISTRY[provider]
-        api_key = os.getenv(provider_info["api_key_env"])
-
-        if not api_key:
-            raise ValueError(
-                f"{provider_info['api_key_env']} 환경변수가 설정되지 않았습니다. "
-                f"API key가 필요합니다."
-            )
-
-        provider_config = config.get(provider, {})
+        provider_config = reranking_config.get(provider)
+        if provider_config is None and "config_alias" in provider_info:
+            provider_config = reranking_config.get(provider_info["config_alias"])
         defaults = provider_info.get(
-            "default_config_colbert", provider_info["default_config"]
-        )
-
-        if provider == "jina":
-            colbert_config = ColBERTRerankerConfig(
-                enabled=True,
-                api_key=api_key,
-                model=provider_config.get("model", defaults["model"]),
-                timeout=provider_config.get("timeout", defaults.get("timeout", 10)),
-                max_documents=provider_config.get(
-                    "max_documents", defaults.get("max_documents", 20)
-                ),
-            )
-            reranker = JinaColBERTReranker(config=colbert_config)
-        else:
-            raise ValueError(
-                f"Late-interaction approach에서 {provider}는 아직 지원되지 않습니다."
-            )
-
-        logger.info(f"✅ {reranker.__class__.__name__} 생성 완료")
-        return reranker
-
-    @staticmethod
-    def _create_local_reranker(
-        provider: str, config: dict[str, Any]
-    ) -> IReranker:
-        """Local approach 리랭커 생성 (API 키 불필요)"""
-        try:
-            from .local_reranker import LocalReranker
-        except ImportError:
-            raise ImportError(
-                "LocalReranker를 사용하려면 sentence-transformers가 필요합니다. "
-                "설치: uv sync --extra local-reranker"
-            )
-
-        # config에서 sentence-transformers 또는 local 키로 설정 조회
-        provider_config = config.get("sentence-transformers", config.get("local", {}))
-        defaults = PROVIDER_REGISTRY["sentence-transformers"]["default_config"]
-
-        reranker = LocalReranker(
-            model_name=provider_config.get("model", defaults["model"]),
-            batch_size=provider_config.get("batch_size", defaults["batch_size"]),
+            _APPROACH_DEFAULTS_KEY.get(approach, "default_config"),
+            provider_info["default_config"],
         )
 
+        reranker = builder(api_key, provider_config or {}, defaults)
         logger.info(f"✅ {reranker.__class__.__name__} 생성 완료")
         return reranker
 
@@ -11,6 +11,7 @@ import httpx
 
 from .....lib.logger import get_logger
 from ..interfaces import SearchResult
+from .json_codec import json_dumps
 
 logger = get_logger(__name__)
 
@@ -119,7 +120,7 @@ class JinaReranker:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
                     self.endpoint,
-                    json=request_data,
+                    content=json_dumps(request_data),
                     headers=headers,
                     timeout=self.timeout,
                 )
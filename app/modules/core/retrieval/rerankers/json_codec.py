@@ -0,0 +1,25 @@
+"""
+리랭커 API 요청 본문 JSON 인코딩
+
+httpx의 json= 인자는 표준 json.dumps(ensure_ascii=True)를 사용하므로
+한국어 문서가 문자당 6바이트(\\uXXXX)로 이스케이프됩니다.
+여기서는 UTF-8 bytes를 직접 만들어 content=로 전달합니다.
+
+의존성:
+- orjson (선택, 없으면 표준 json으로 폴백)
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+# orjson 사용 가능 시 고속 JSON 인코딩 (없으면 표준 json으로 폴백)
+json_dumps: Callable[[Any], bytes]
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+except ImportError:
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
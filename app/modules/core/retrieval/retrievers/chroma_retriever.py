@@ -12,9 +12,10 @@ Chroma Retriever - Dense 및 하이브리드 벡터 검색
 - chromadb: pip install chromadb
 - app.infrastructure.storage.vector.chroma_store: ChromaVectorStore
 - app.modules.core.retrieval.interfaces: IRetriever, SearchResult
-- (선택) kiwipiepy, rank-bm25: 하이브리드 검색 시 필요
+- (선택) kiwipiepy: 하이브리드 검색 시 필요
 """
 
+import asyncio
 from typing import Any, Protocol, runtime_checkable
 
 from app.lib.logger import get_logger
@@ -141,20 +142,8 @@ class ChromaRetriever:
             RuntimeError: 검색 실패 시
         """
         try:
-            # 1. 쿼리 벡터화
-            logger.debug(f"쿼리 임베딩 생성 중: '{query[:50]}...'")
-            query_vector = self.embedder.embed_query(query)
-
-            # 2. ChromaVectorStore에서 검색
-            raw_results = await self.store.search(
-                collection=self.collection_name,
-                query_vector=query_vector,
-                top_k=top_k,
-                filters=filters,
-            )
-
-            # 3. SearchResult로 변환
-            dense_results = self._convert_to_search_results(raw_results)
+            # 1~3. 쿼리 벡터화 → ChromaVectorStore 검색 → SearchResult 변환
+            dense_results = await self._dense_search(query, top_k, filters)
 
             # Phase 1: 하이브리드 검색 (BM25 엔진이 주입된 경우)
             if self._hybrid_enabled and self._bm25_index is not None and self._hybrid_merger is not None:
@@ -188,6 +177,85 @@ class ChromaRetriever:
             )
             raise
 
+    async def search_batch(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        filters: dict[str, Any] | None = None,
+    ) -> list[list[SearchResult]]:
+        """
+        다수 쿼리 일괄 검색
+
+        Dense 검색은 쿼리별로 동시에 수행하고, 하이브리드 모드의 BM25 검색은
+        BM25Index.search_batch()로 한 번에 수행합니다 (평가/리랭킹 파이프라인용).
+
+        Args:
+            queries: 검색 쿼리 리스트
+            top_k: 쿼리별 반환할 최대 결과 수
+            filters: 메타데이터 필터링 조건 (모든 쿼리에 동일 적용)
+
+        Returns:
+            쿼리 순서대로의 검색 결과 리스트 (각 결과는 search()와 동일한 형식)
+        """
+        try:
+            dense_batch = await asyncio.gather(
+                *(self._dense_search(query, top_k, filters) for query in queries)
+            )
+
+            if (
+                self._hybrid_enabled
+                and self._bm25_index is not None
+                and self._hybrid_merger is not None
+            ):
+                bm25_batch = self._bm25_index.search_batch(queries, top_k=top_k)
+                results: list[list[SearchResult]] = [
+                    self._hybrid_merger.merge(
+                        dense_results=dense_results,
+                        bm25_results=bm25_results,
+                        top_k=top_k,
+                    )
+                    for dense_results, bm25_results in zip(dense_batch, bm25_batch, strict=True)
+                ]
+            else:
+                results = list(dense_batch)
+
+            self._stats["total_searches"] += len(queries)
+
+            logger.info(
+                f"ChromaRetriever 일괄 검색 완료: {len(queries)}개 쿼리 "
+                f"(hybrid={self._hybrid_enabled})"
+            )
+
+            return results
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.error(
+                f"ChromaRetriever 일괄 검색 실패: {e}",
+                extra={"query_count": len(queries)},
+                exc_info=True,
+            )
+            raise
+
+    async def _dense_search(
+        self,
+        query: str,
+        top_k: int,
+        filters: dict[str, Any] | None,
+    ) -> list[SearchResult]:
+        """쿼리 벡터화 후 ChromaVectorStore 유사도 검색 결과를 SearchResult로 변환"""
+        logger.debug(f"쿼리 임베딩 생성 중: '{query[:50]}...'")
+        query_vector = self.embedder.embed_query(query)
+
+        raw_results = await self.store.search(
+            collection=self.collection_name,
+            query_vector=query_vector,
+            top_k=top_k,
+            filters=filters,
+        )
+
+        return self._convert_to_search_results(raw_results)
+
     async def health_check(self) -> bool:
         """
         Chroma 연결 상태 확인
@@ -12,7 +12,7 @@ FastAPI 서버 없이 직접 검색 파이프라인과 LLM을 호출합니다.
     - rich: CLI UI
     - chromadb: 벡터 검색
     - sentence-transformers: 임베딩
-    - kiwipiepy, rank-bm25: BM25 검색 (선택적)
+    - kiwipiepy: BM25 검색 (선택적)
     - openai: LLM 호출 (선택적, Gemini/OpenRouter OpenAI 호환 API)
 """
 
@@ -27,9 +27,10 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from easy_start.load_data import (  # noqa: E402
-    BM25_INDEX_PATH,
     CHROMA_PERSIST_DIR,
     COLLECTION_NAME,
+    LEGACY_BM25_INDEX_PATH,
+    find_bm25_index_path,
 )
 
 # 상수
@@ -289,9 +290,15 @@ def initialize_components() -> tuple[Any, Any | None, Any | None]:
     bm25_index = None
     merger = None
     try:
-        if Path(BM25_INDEX_PATH).exists():
+        bm25_index_path = find_bm25_index_path()
+        if bm25_index_path is not None:
+            if bm25_index_path == LEGACY_BM25_INDEX_PATH:
+                print(
+                    "💡 이전 형식 BM25 인덱스(.bm25_index.pkl)를 사용합니다. "
+                    "빠른 로드를 위해 easy_start/load_data.py를 다시 실행하세요."
+                )
             from easy_start.load_data import load_bm25_index
-            bm25_index = load_bm25_index(BM25_INDEX_PATH)
+            bm25_index = load_bm25_index(bm25_index_path)
 
             from app.modules.core.retrieval.bm25_engine import HybridMerger
             merger = HybridMerger(alpha=0.6)
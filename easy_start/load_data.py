@@ -11,7 +11,7 @@ BM25 인덱스도 함께 구축하여 하이브리드 검색을 준비합니다.
 의존성:
     - chromadb: 벡터 스토어
     - sentence-transformers: 로컬 임베딩
-    - kiwipiepy, rank-bm25: BM25 인덱스 (선택적)
+    - kiwipiepy: BM25 인덱스 (선택적)
 """
 
 import asyncio
@@ -27,7 +27,10 @@ sys.path.insert(0, str(project_root))
 
 # 상수
 CHROMA_PERSIST_DIR = str(project_root / "easy_start" / ".chroma_data")
-BM25_INDEX_PATH = str(project_root / "easy_start" / ".bm25_index.pkl")
+# BM25 인덱스 디렉토리 (문서 meta.pkl + 메모리 맵용 포스팅 .npy 파일)
+BM25_INDEX_PATH = str(project_root / "easy_start" / ".bm25_index")
+# 이전 버전의 단일 pickle 인덱스 (디렉토리가 없으면 이 파일을 대신 읽음)
+LEGACY_BM25_INDEX_PATH = str(project_root / "easy_start" / ".bm25_index.pkl")
 COLLECTION_NAME = "documents"
 SAMPLE_DATA_PATH = project_root / "quickstart" / "sample_data.json"
 
@@ -87,7 +90,7 @@ def build_bm25_index(docs: list[dict[str, Any]]) -> Any:
         BM25Index 인스턴스
 
     Raises:
-        ImportError: kiwipiepy 또는 rank-bm25가 미설치된 경우
+        ImportError: kiwipiepy가 미설치된 경우
     """
     from app.modules.core.retrieval.bm25_engine import BM25Index, KoreanTokenizer
 
@@ -150,46 +153,59 @@ async def load_to_chroma(
 
 def save_bm25_index(index: Any, path: str = BM25_INDEX_PATH) -> None:
     """
-    BM25 인덱스 데이터를 파일로 저장
+    BM25 인덱스를 디렉토리에 저장
 
-    Kiwi(C 확장)는 pickle 불가이므로, 재구축에 필요한
-    문서와 토큰화 결과만 저장합니다.
+    Kiwi(C 확장)는 pickle 불가이므로 토크나이저를 제외한
+    문서와 BM25 포스팅 배열만 저장합니다 (BM25Index.save 참고).
     """
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    serializable_data = {
-        "documents": index._documents,
-        "tokenized_corpus": index._tokenized_corpus,
-    }
-    with open(path, "wb") as f:
-        pickle.dump(serializable_data, f)
+    index.save(path)
 
 
 def load_bm25_index(path: str = BM25_INDEX_PATH) -> Any:
     """
-    저장된 BM25 인덱스 데이터로 BM25Index를 재구축
+    저장된 BM25 인덱스 로드
 
-    pickle에서 문서 + 토큰화 결과를 로드한 후
-    BM25Plus 인스턴스만 재생성합니다 (토큰화 과정 생략).
+    디렉토리 형식은 포스팅 배열을 메모리 맵으로 열어 재토큰화/재계산 없이 복원합니다.
+    단일 pickle 파일로 저장된 이전 형식(토큰 문자열 리스트)은
+    BM25 점수 계산기를 재생성하여 읽습니다.
     """
-    from rank_bm25 import BM25Plus
-
     from app.modules.core.retrieval.bm25_engine import BM25Index, KoreanTokenizer
+    from app.modules.core.retrieval.bm25_engine.scorer import BM25PlusScorer, intern_corpus
+
+    # 토크나이저는 검색 시 쿼리 토큰화에만 사용
+    tokenizer = KoreanTokenizer()
+    if Path(path).is_dir():
+        return BM25Index.load(path, tokenizer=tokenizer)
 
     with open(path, "rb") as f:
         data = pickle.load(f)  # noqa: S301
 
-    # 토크나이저는 검색 시 쿼리 토큰화에만 사용
-    tokenizer = KoreanTokenizer()
     index = BM25Index(tokenizer=tokenizer)
 
     # 저장된 데이터로 내부 상태 복원 (재토큰화 없이)
     index._documents = data["documents"]
-    index._tokenized_corpus = data["tokenized_corpus"]
-    index._bm25 = BM25Plus(data["tokenized_corpus"])
+    vocab, token_ids, doc_lengths = intern_corpus(data["tokenized_corpus"])
+    index._bm25 = BM25PlusScorer(vocab, token_ids, doc_lengths)
 
     return index
 
 
+def find_bm25_index_path() -> str | None:
+    """
+    로드할 BM25 인덱스 경로 탐색
+
+    디렉토리 형식(BM25_INDEX_PATH)을 우선하고, 없으면 이전 버전의
+    단일 pickle 파일(LEGACY_BM25_INDEX_PATH)을 반환합니다.
+
+    Returns:
+        인덱스 경로 (둘 다 없으면 None)
+    """
+    for path in (BM25_INDEX_PATH, LEGACY_BM25_INDEX_PATH):
+        if Path(path).exists():
+            return path
+    return None
+
+
 async def main() -> None:
     """메인 실행 함수"""
     print("🚀 Docker-Free 로컬 퀵스타트 - 데이터 로드")
@@ -21,7 +21,7 @@ sys.path.insert(0, str(project_root))
 
 # 상수
 REQUIRED_PACKAGES = ["chromadb", "sentence_transformers", "rich"]
-OPTIONAL_PACKAGES = ["kiwipiepy", "rank_bm25"]
+OPTIONAL_PACKAGES = ["kiwipiepy"]
 CHROMA_DATA_DIR = str(project_root / "easy_start" / ".chroma_data")
 ENV_FILE_PATH = str(project_root / ".env")
 
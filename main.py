@@ -301,6 +301,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
                 # 환경변수를 통해 LangSmith 자동 활성화
                 os.environ["LANGCHAIN_TRACING_V2"] = "true"
                 os.environ["LANGCHAIN_PROJECT"] = langsmith_project
+                # 트레이스 전송을 백그라운드로 처리하여 요청 경로에서 동기 HTTP 호출 제거
+                # (사용자가 지정한 값은 유지)
+                os.environ.setdefault("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
                 langsmith_enabled = True
                 logger.info(f"📊 LangSmith tracing enabled for project: {langsmith_project}")
             else:
@@ -31,6 +31,32 @@ def pytest_configure(config: pytest.Config) -> None:
     os.environ["ENVIRONMENT"] = "test"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """실제 LLM 호출 테스트 opt-in 옵션 등록"""
+    parser.addoption(
+        "--run-real-llm",
+        action="store_true",
+        default=False,
+        help="real_llm 마커가 붙은 실제 LLM API 호출 테스트 실행",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """
+    수집 훅
+
+    --run-real-llm 없이 실행하면 real_llm 테스트를 skip 처리.
+    API 키가 환경변수에 있다는 이유만으로 네트워크 호출이 기본 실행에 포함되지 않도록 합니다.
+    """
+    if config.getoption("--run-real-llm"):
+        return
+
+    skip_real_llm = pytest.mark.skip(reason="실제 LLM 테스트는 --run-real-llm 옵션 필요")
+    for item in items:
+        if "real_llm" in item.keywords:
+            item.add_marker(skip_real_llm)
+
+
 @pytest.fixture(scope="session")
 def project_root_path() -> Path:
     """프로젝트 루트 경로"""
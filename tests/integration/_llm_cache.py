@@ -0,0 +1,87 @@
+"""
+실제 LLM 테스트용 디스크 응답 캐시
+
+같은 (model, temperature, system_prompt, prompt) 요청은 .cache/llm/{sha256}.json에
+저장된 응답을 반환하여, 반복 실행 시 네트워크 호출 없이 테스트를 재생합니다.
+첫 실행(캐시 미스)에서만 실제 API를 호출하고 응답을 기록합니다.
+
+환경변수:
+- REAL_LLM_CACHE=0: 캐시를 사용하지 않고 항상 실제 API 호출 (모델 응답 재검증용)
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "llm"
+
+
+def llm_cache_enabled() -> bool:
+    """REAL_LLM_CACHE=0이 아니면 캐시 사용"""
+    return os.getenv("REAL_LLM_CACHE", "1") != "0"
+
+
+class CachedLLMClient:
+    """
+    generate_text() 응답을 디스크에 캐시하는 LLM 클라이언트 래퍼
+
+    generate_text() 외의 속성은 원본 클라이언트로 위임합니다.
+
+    Args:
+        client: generate_text()를 제공하는 LLM 클라이언트
+        cache_dir: 응답 캐시 디렉토리
+    """
+
+    def __init__(self, client: Any, cache_dir: Path = CACHE_DIR) -> None:
+        self._client = client
+        self._cache_dir = cache_dir
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
+
+    async def generate_text(
+        self, prompt: str, system_prompt: str | None = None, **kwargs: Any
+    ) -> str:
+        """캐시 적중 시 저장된 응답 반환, 미스 시 원본 호출 후 기록"""
+        path = self._cache_dir / f"{self._cache_key(prompt, system_prompt, kwargs)}.json"
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                cached: str = json.load(f)["response"]
+            return cached
+
+        response: str = await self._client.generate_text(
+            prompt, system_prompt=system_prompt, **kwargs
+        )
+        self._write(path, response)
+        return response
+
+    def _cache_key(self, prompt: str, system_prompt: str | None, kwargs: dict[str, Any]) -> str:
+        """모델/온도/프롬프트/추가 인자의 SHA-256 키"""
+        payload = json.dumps(
+            {
+                "model": getattr(self._client, "model", None),
+                "temperature": getattr(self._client, "temperature", None),
+                "system_prompt": system_prompt,
+                "prompt": prompt,
+                "kwargs": kwargs,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _write(self, path: Path, response: str) -> None:
+        """임시 파일에 쓴 뒤 교체 (xdist 워커 동시 기록 시 깨진 파일 방지)"""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"response": response}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -6,25 +6,48 @@ Self-Reflection E2E 통합 테스트
 - Reflection 활성화 시 품질 평가 및 개선 흐름
 - Reflection 비활성화 시 건너뜀
 """
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.modules.core.agent.factory import AgentFactory
 
+# Mock LLM 응답 시퀀스로 전체 흐름을 실행하므로 10초 안에 끝나야 함
+pytestmark = pytest.mark.timeout(10)
+
+
+def _compact_json(**fields: object) -> str:
+    """LLM 응답 JSON (공백 없는 정규 형식)"""
+    return json.dumps(fields, ensure_ascii=False, separators=(",", ":"))
+
+
+# 시나리오별 LLM 응답 (모듈 로드 시 한 번만 생성)
+PLANNER_DONE = _compact_json(reasoning="검색 완료", tool_calls=[], should_continue=False)
+REFLECTION_LOW = _compact_json(
+    score=5.0, issues=["정보 부족"], suggestions=["상세 검색"], reasoning="부족"
+)
+REFLECTION_IMPROVED = _compact_json(score=9.0, issues=[], suggestions=[], reasoning="충분함")
+REFLECTION_HIGH = _compact_json(score=9.5, issues=[], suggestions=[], reasoning="훌륭함")
+
 
 class TestSelfReflectionE2E:
     """Self-Reflection 전체 흐름 E2E 테스트"""
 
-    @pytest.fixture
-    def mock_llm_client(self):
-        """실제 LLM을 모방하는 Mock"""
-        client = AsyncMock()
-        return client
+    @pytest.fixture(scope="module")
+    def shared_llm_client(self):
+        """모듈 공용 LLM Mock (AsyncMock 생성 비용을 테스트마다 반복하지 않음)"""
+        return AsyncMock()
 
     @pytest.fixture
+    def mock_llm_client(self, shared_llm_client):
+        """실제 LLM을 모방하는 Mock (테스트 종료 시 호출 기록/응답 시퀀스 초기화)"""
+        yield shared_llm_client
+        shared_llm_client.reset_mock(return_value=True, side_effect=True)
+
+    @pytest.fixture(scope="module")
     def mock_mcp_server(self):
-        """Mock MCP 서버"""
+        """Mock MCP 서버 (테스트별 상태가 없으므로 모듈 단위 공유)"""
         server = MagicMock()
         server.is_enabled = True
         server.get_tool_schemas.return_value = []
@@ -56,7 +79,6 @@ class TestSelfReflectionE2E:
             },
         }
 
-    @pytest.mark.asyncio
     async def test_e2e_reflection_flow_with_improvement(
         self, mock_llm_client, mock_mcp_server, config_with_reflection
     ):
@@ -64,15 +86,15 @@ class TestSelfReflectionE2E:
         # Given: LLM 응답 시퀀스 설정
         mock_llm_client.generate_text.side_effect = [
             # 1. Planner 응답 (검색 완료)
-            '{"reasoning": "검색 완료", "tool_calls": [], "should_continue": false}',
+            PLANNER_DONE,
             # 2. Synthesizer 첫 번째 응답
             "첫 번째 답변입니다.",
             # 3. Reflector 첫 번째 평가 (낮은 점수)
-            '{"score": 5.0, "issues": ["정보 부족"], "suggestions": ["상세 검색"], "reasoning": "부족"}',
+            REFLECTION_LOW,
             # 4. Synthesizer 재생성 응답 (개선됨)
             "개선된 상세 답변입니다.",
             # 5. Reflector 두 번째 평가 (높은 점수)
-            '{"score": 9.0, "issues": [], "suggestions": [], "reasoning": "충분함"}',
+            REFLECTION_IMPROVED,
         ]
 
         # Orchestrator 생성
@@ -94,7 +116,6 @@ class TestSelfReflectionE2E:
         # LLM 호출 횟수 확인 (Planner + Synthesizer*2 + Reflector*2 = 5)
         assert mock_llm_client.generate_text.call_count == 5
 
-    @pytest.mark.asyncio
     async def test_e2e_reflection_flow_high_quality_first(
         self, mock_llm_client, mock_mcp_server, config_with_reflection
     ):
@@ -102,11 +123,11 @@ class TestSelfReflectionE2E:
         # Given: LLM 응답 시퀀스 설정
         mock_llm_client.generate_text.side_effect = [
             # 1. Planner 응답 (검색 완료)
-            '{"reasoning": "검색 완료", "tool_calls": [], "should_continue": false}',
+            PLANNER_DONE,
             # 2. Synthesizer 응답
             "고품질 답변입니다.",
             # 3. Reflector 평가 (높은 점수)
-            '{"score": 9.5, "issues": [], "suggestions": [], "reasoning": "훌륭함"}',
+            REFLECTION_HIGH,
         ]
 
         # Orchestrator 생성
@@ -126,7 +147,6 @@ class TestSelfReflectionE2E:
         # LLM 호출 횟수 확인 (Planner + Synthesizer + Reflector = 3)
         assert mock_llm_client.generate_text.call_count == 3
 
-    @pytest.mark.asyncio
     async def test_e2e_reflection_disabled(
         self, mock_llm_client, mock_mcp_server, config_without_reflection
     ):
@@ -134,7 +154,7 @@ class TestSelfReflectionE2E:
         # Given: LLM 응답 시퀀스 설정
         mock_llm_client.generate_text.side_effect = [
             # 1. Planner 응답
-            '{"reasoning": "검색 완료", "tool_calls": [], "should_continue": false}',
+            PLANNER_DONE,
             # 2. Synthesizer 응답
             "일반 답변입니다.",
         ]
@@ -160,7 +180,6 @@ class TestSelfReflectionE2E:
         # LLM 호출 횟수 확인 (Planner + Synthesizer = 2, Reflector 없음)
         assert mock_llm_client.generate_text.call_count == 2
 
-    @pytest.mark.asyncio
     async def test_e2e_factory_creates_complete_orchestrator(
         self, mock_llm_client, mock_mcp_server, config_with_reflection
     ):
@@ -174,11 +193,9 @@ class TestSelfReflectionE2E:
 
         # Then: 모든 컴포넌트 존재
         assert orchestrator is not None
-        assert orchestrator._planner is not None
-        assert orchestrator._executor is not None
-        assert orchestrator._synthesizer is not None
-        assert orchestrator._config is not None
-        assert orchestrator._reflector is not None
+        required = ("_planner", "_executor", "_synthesizer", "_config", "_reflector")
+        missing = [name for name in required if getattr(orchestrator, name) is None]
+        assert not missing, f"누락된 컴포넌트: {missing}"
 
         # Config 값 확인
         assert orchestrator._config.enable_reflection is True
@@ -9,18 +9,28 @@ Self-Reflection 실제 LLM 통합 테스트
 3. AgentReflector 단독 테스트: Reflector의 품질 평가 기능 검증
 
 주의사항:
-- 테스트는 API 키 없으면 skip 처리
+- --run-real-llm 옵션으로 실행해야 하며, API 키 없으면 skip 처리
 - 비용 최소화를 위해 짧은 프롬프트 사용
 - 타임아웃 설정 필수 (30초)
+- 테스트 간 독립적이므로 병렬 실행 가능: pytest --run-real-llm -n auto (make test-real-llm)
+- 응답은 .cache/llm/에 캐시되어 재실행 시 재생됨 (REAL_LLM_CACHE=0이면 항상 실제 호출)
+- 평가 점수/근거는 INFO 로그로 기록됨 (확인 시: pytest --run-real-llm --log-cli-level=INFO)
 """
 
+import asyncio
+import logging
 import os
+from dataclasses import replace
+from typing import Any
 
 import pytest
 
 from app.lib.llm_client import OpenAILLMClient
 from app.modules.core.agent.interfaces import AgentConfig
 from app.modules.core.agent.reflector import AgentReflector
+from tests.integration._llm_cache import CachedLLMClient, llm_cache_enabled
+
+logger = logging.getLogger(__name__)
 
 # API 키 존재 여부 확인
 HAS_OPENAI_KEY = bool(os.getenv("OPENAI_API_KEY"))
@@ -28,75 +38,75 @@ HAS_OPENROUTER_KEY = bool(os.getenv("OPENROUTER_API_KEY"))
 HAS_ANY_LLM_KEY = HAS_OPENAI_KEY or HAS_OPENROUTER_KEY
 
 
-# API 키가 없으면 전체 모듈 스킵
-pytestmark = pytest.mark.skipif(
-    not HAS_ANY_LLM_KEY,
-    reason="실제 LLM API 키 필요 (OPENAI_API_KEY 또는 OPENROUTER_API_KEY)"
+# --run-real-llm 옵션 없이 실행하거나 API 키가 없으면 전체 모듈 스킵
+pytestmark = [
+    pytest.mark.real_llm,
+    pytest.mark.skipif(
+        not HAS_ANY_LLM_KEY,
+        reason="실제 LLM API 키 필요 (OPENAI_API_KEY 또는 OPENROUTER_API_KEY)"
+    ),
+]
+
+
+# 테스트 공통 AgentConfig: Reflection 활성화, threshold 7.0, 순차 도구 실행
+_BASE_AGENT_CONFIG = AgentConfig(
+    tool_selection="llm",
+    selector_model="gpt-4o-mini",
+    max_iterations=3,
+    fallback_tool="search_weaviate",
+    timeout=30.0,
+    timeout_seconds=60.0,
+    tool_timeout=15.0,
+    parallel_execution=False,
+    max_concurrent_tools=1,
+    enable_reflection=True,
+    reflection_threshold=7.0,
+    max_reflection_iterations=2,
 )
 
 
-class TestSelfReflectionRealLLM:
-    """실제 LLM을 사용한 Self-Reflection 통합 테스트"""
+def make_agent_config(**overrides: Any) -> AgentConfig:
+    """공통 AgentConfig에서 지정한 필드만 바꾼 설정 생성"""
+    return replace(_BASE_AGENT_CONFIG, **overrides)
 
-    @pytest.fixture
-    def openai_llm_client(self):
-        """
-        OpenAI LLM 클라이언트 생성
 
-        비용 최소화를 위해 gpt-4o-mini 모델 사용
-        """
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            pytest.skip("OPENAI_API_KEY 환경변수 필요")
-
-        config = {
-            "api_key": api_key,
-            "model": "gpt-4o-mini",  # 비용 최소화
-            "temperature": 0.0,
-            "max_tokens": 512,
-            "timeout": 30,
-        }
-        return OpenAILLMClient(config)
+@pytest.fixture(scope="session")
+def openai_llm_client():
+    """
+    OpenAI LLM 클라이언트 생성 (세션당 1회, xdist 사용 시 워커당 1회)
+
+    비용 최소화를 위해 gpt-4o-mini 모델 사용.
+    테스트 간 공유 상태가 없는 클라이언트이므로 커넥션 풀을 재사용합니다.
+    """
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        pytest.skip("OPENAI_API_KEY 환경변수 필요")
+
+    config = {
+        "api_key": api_key,
+        "model": "gpt-4o-mini",  # 비용 최소화
+        "temperature": 0.0,
+        "max_tokens": 512,
+        "timeout": 30,
+    }
+    client = OpenAILLMClient(config)
+    # 반복 실행 시 같은 프롬프트는 디스크 캐시에서 재생 (REAL_LLM_CACHE=0이면 항상 실제 호출)
+    return CachedLLMClient(client) if llm_cache_enabled() else client
+
+
+class TestSelfReflectionRealLLM:
+    """실제 LLM을 사용한 Self-Reflection 통합 테스트"""
 
     @pytest.fixture
     def reflection_config(self) -> AgentConfig:
         """Reflection 활성화 설정"""
-        return AgentConfig(
-            tool_selection="llm",
-            selector_model="gpt-4o-mini",
-            max_iterations=3,
-            fallback_tool="search_weaviate",
-            timeout=30.0,
-            timeout_seconds=60.0,
-            tool_timeout=15.0,
-            parallel_execution=False,
-            max_concurrent_tools=1,
-            # Self-Reflection 설정
-            enable_reflection=True,
-            reflection_threshold=7.0,  # 7.0 미만이면 개선 필요
-            max_reflection_iterations=2,
-        )
+        return make_agent_config()  # 7.0 미만이면 개선 필요
 
     @pytest.fixture
     def no_reflection_config(self) -> AgentConfig:
         """Reflection 비활성화 설정"""
-        return AgentConfig(
-            tool_selection="llm",
-            selector_model="gpt-4o-mini",
-            max_iterations=3,
-            fallback_tool="search_weaviate",
-            timeout=30.0,
-            timeout_seconds=60.0,
-            tool_timeout=15.0,
-            parallel_execution=False,
-            max_concurrent_tools=1,
-            # Self-Reflection 비활성화
-            enable_reflection=False,
-            reflection_threshold=7.0,
-            max_reflection_iterations=0,
-        )
+        return make_agent_config(enable_reflection=False)
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(60)  # 60초 타임아웃
     async def test_reflector_evaluates_high_quality_answer(
         self, openai_llm_client, reflection_config
@@ -149,10 +159,11 @@ class TestSelfReflectionRealLLM:
         assert result.needs_improvement is False, "고품질 답변은 개선 불필요"
         assert isinstance(result.reasoning, str)
 
-        print(f"\n[테스트 결과] 점수: {result.score}, 개선필요: {result.needs_improvement}")
-        print(f"평가 근거: {result.reasoning}")
+        logger.info(
+            "[테스트 결과] 점수: %s, 개선필요: %s, 평가 근거: %s",
+            result.score, result.needs_improvement, result.reasoning,
+        )
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(60)
     async def test_reflector_evaluates_low_quality_answer(
         self, openai_llm_client, reflection_config
@@ -185,10 +196,11 @@ class TestSelfReflectionRealLLM:
 
         # Then: 낮은 점수 부여 (또는 문제점 지적)
         # 주의: LLM의 평가는 항상 일정하지 않을 수 있음
-        print(f"\n[테스트 결과] 점수: {result.score}, 개선필요: {result.needs_improvement}")
-        print(f"문제점: {result.issues}")
-        print(f"제안: {result.suggestions}")
-        print(f"평가 근거: {result.reasoning}")
+        logger.info(
+            "[테스트 결과] 점수: %s, 개선필요: %s, 문제점: %s, 제안: %s, 평가 근거: %s",
+            result.score, result.needs_improvement, result.issues, result.suggestions,
+            result.reasoning,
+        )
 
         # 저품질 답변이므로 문제점이나 제안이 있어야 함
         # (점수 기준은 LLM 성향에 따라 다를 수 있음)
@@ -201,7 +213,6 @@ class TestSelfReflectionRealLLM:
         )
         assert has_feedback, "저품질 답변에 대해 피드백이 없음"
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(60)
     async def test_reflector_handles_empty_context(
         self, openai_llm_client, reflection_config
@@ -239,9 +250,8 @@ class TestSelfReflectionRealLLM:
         assert isinstance(result.suggestions, list)
         assert isinstance(result.needs_improvement, bool)
 
-        print(f"\n[테스트 결과] 점수: {result.score}, 개선필요: {result.needs_improvement}")
+        logger.info("[테스트 결과] 점수: %s, 개선필요: %s", result.score, result.needs_improvement)
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(90)
     async def test_reflection_with_korean_content(
         self, openai_llm_client, reflection_config
@@ -296,14 +306,12 @@ class TestSelfReflectionRealLLM:
         assert isinstance(result.score, float)
         assert 0.0 <= result.score <= 10.0
 
-        print("\n[한국어 테스트 결과]")
-        print(f"점수: {result.score}")
-        print(f"개선필요: {result.needs_improvement}")
-        print(f"문제점: {result.issues}")
-        print(f"제안: {result.suggestions}")
-        print(f"평가 근거: {result.reasoning}")
+        logger.info(
+            "[한국어 테스트 결과] 점수: %s, 개선필요: %s, 문제점: %s, 제안: %s, 평가 근거: %s",
+            result.score, result.needs_improvement, result.issues, result.suggestions,
+            result.reasoning,
+        )
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(60)
     async def test_reflector_threshold_boundary(
         self, openai_llm_client
@@ -316,36 +324,10 @@ class TestSelfReflectionRealLLM:
         2. threshold에 따라 needs_improvement 값이 변경되는지 확인
         """
         # 낮은 threshold 설정 (5.0)
-        low_threshold_config = AgentConfig(
-            tool_selection="llm",
-            selector_model="gpt-4o-mini",
-            max_iterations=3,
-            fallback_tool="search_weaviate",
-            timeout=30.0,
-            timeout_seconds=60.0,
-            tool_timeout=15.0,
-            parallel_execution=False,
-            max_concurrent_tools=1,
-            enable_reflection=True,
-            reflection_threshold=5.0,  # 낮은 threshold
-            max_reflection_iterations=2,
-        )
+        low_threshold_config = make_agent_config(reflection_threshold=5.0)
 
         # 높은 threshold 설정 (9.0)
-        high_threshold_config = AgentConfig(
-            tool_selection="llm",
-            selector_model="gpt-4o-mini",
-            max_iterations=3,
-            fallback_tool="search_weaviate",
-            timeout=30.0,
-            timeout_seconds=60.0,
-            tool_timeout=15.0,
-            parallel_execution=False,
-            max_concurrent_tools=1,
-            enable_reflection=True,
-            reflection_threshold=9.0,  # 높은 threshold
-            max_reflection_iterations=2,
-        )
+        high_threshold_config = make_agent_config(reflection_threshold=9.0)
 
         # 중간 품질 답변
         query = "Python이란?"
@@ -362,18 +344,19 @@ class TestSelfReflectionRealLLM:
             config=high_threshold_config,
         )
 
-        # When: 같은 답변으로 평가
-        low_result = await low_threshold_reflector.reflect(
-            query=query, answer=answer, context=context
-        )
-        high_result = await high_threshold_reflector.reflect(
-            query=query, answer=answer, context=context
+        # When: 같은 답변으로 평가 (서로 독립적인 API 호출이므로 동시 실행)
+        low_result, high_result = await asyncio.gather(
+            low_threshold_reflector.reflect(query=query, answer=answer, context=context),
+            high_threshold_reflector.reflect(query=query, answer=answer, context=context),
         )
 
         # Then: 점수는 비슷하지만 needs_improvement는 다를 수 있음
-        print("\n[Threshold 경계값 테스트]")
-        print(f"낮은 threshold(5.0): 점수={low_result.score}, 개선필요={low_result.needs_improvement}")
-        print(f"높은 threshold(9.0): 점수={high_result.score}, 개선필요={high_result.needs_improvement}")
+        logger.info(
+            "[Threshold 경계값 테스트] 낮은 threshold(5.0): 점수=%s, 개선필요=%s / "
+            "높은 threshold(9.0): 점수=%s, 개선필요=%s",
+            low_result.score, low_result.needs_improvement,
+            high_result.score, high_result.needs_improvement,
+        )
 
         # 점수는 비슷해야 함 (같은 LLM이 평가)
         assert abs(low_result.score - high_result.score) < 2.0, \
@@ -389,41 +372,11 @@ class TestSelfReflectionRealLLM:
 class TestReflectorEdgeCases:
     """AgentReflector 엣지 케이스 테스트"""
 
-    @pytest.fixture
-    def openai_llm_client(self):
-        """OpenAI LLM 클라이언트"""
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            pytest.skip("OPENAI_API_KEY 환경변수 필요")
-
-        config = {
-            "api_key": api_key,
-            "model": "gpt-4o-mini",
-            "temperature": 0.0,
-            "max_tokens": 512,
-            "timeout": 30,
-        }
-        return OpenAILLMClient(config)
-
     @pytest.fixture
     def config(self) -> AgentConfig:
         """기본 설정"""
-        return AgentConfig(
-            tool_selection="llm",
-            selector_model="gpt-4o-mini",
-            max_iterations=3,
-            fallback_tool="search_weaviate",
-            timeout=30.0,
-            timeout_seconds=60.0,
-            tool_timeout=15.0,
-            parallel_execution=False,
-            max_concurrent_tools=1,
-            enable_reflection=True,
-            reflection_threshold=7.0,
-            max_reflection_iterations=2,
-        )
+        return make_agent_config()
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(60)
     async def test_very_long_answer(self, openai_llm_client, config):
         """
@@ -445,9 +398,8 @@ class TestReflectorEdgeCases:
 
         assert result is not None
         assert isinstance(result.score, float)
-        print(f"\n[긴 답변 테스트] 점수: {result.score}")
+        logger.info("[긴 답변 테스트] 점수: %s", result.score)
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(60)
     async def test_special_characters_in_content(self, openai_llm_client, config):
         """
@@ -467,9 +419,8 @@ class TestReflectorEdgeCases:
         )
 
         assert result is not None
-        print(f"\n[특수문자 테스트] 점수: {result.score}")
+        logger.info("[특수문자 테스트] 점수: %s", result.score)
 
-    @pytest.mark.asyncio
     @pytest.mark.timeout(60)
     async def test_code_in_answer(self, openai_llm_client, config):
         """
@@ -503,4 +454,4 @@ class TestReflectorEdgeCases:
 
         assert result is not None
         assert result.score >= 5.0, "코드 예시가 포함된 좋은 답변"
-        print(f"\n[코드 답변 테스트] 점수: {result.score}")
+        logger.info("[코드 답변 테스트] 점수: %s", result.score)
@@ -19,7 +19,7 @@ SSE 이벤트 형식: event: {type}\ndata: {json}\n\n
 
 import json
 import os
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -27,6 +27,16 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
+# orjson 사용 가능 시 고속 JSON 파싱 (없으면 표준 json으로 폴백)
+# orjson.JSONDecodeError는 json.JSONDecodeError(ValueError)의 하위 클래스
+_json_loads: Callable[[str], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # main.py에서 FastAPI 앱 임포트
 
 
@@ -58,7 +68,7 @@ def parse_sse_events(response_text: str) -> list[dict[str, Any]]:
         elif line.startswith("data: "):
             # 데이터 추출 및 JSON 파싱
             try:
-                current_data = json.loads(line[6:])
+                current_data = _json_loads(line[6:])
             except json.JSONDecodeError:
                 # JSON 파싱 실패 시 원본 문자열 유지
                 current_data = {"raw": line[6:]}
@@ -12,18 +12,21 @@ import pytest
 
 from app.modules.core.agent.factory import AgentFactory
 
+# Mock만 사용하므로 5초 안에 끝나야 함 (회귀로 인한 무한 대기 시 즉시 실패)
+pytestmark = pytest.mark.timeout(5)
+
 
 class TestAgentFactoryReflection:
     """AgentFactory Reflection 생성 테스트"""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_llm_client(self):
-        """Mock LLM 클라이언트"""
+        """Mock LLM 클라이언트 (테스트별 상태가 없으므로 모듈 단위 공유)"""
         return MagicMock()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_mcp_server(self):
-        """Mock MCP 서버 (활성화 상태)"""
+        """Mock MCP 서버 (활성화 상태, 모듈 단위 공유)"""
         server = MagicMock()
         server.is_enabled = True
         server.get_tool_schemas.return_value = []
@@ -68,7 +68,6 @@ class TestOrchestratorReflection:
         """Reflection 비활성화 설정"""
         return AgentConfig(enable_reflection=False)
 
-    @pytest.mark.asyncio
     async def test_orchestrator_with_reflection_high_score(
         self, mock_planner, mock_executor, mock_synthesizer,
         mock_reflector_high_score, config_with_reflection
@@ -91,7 +90,6 @@ class TestOrchestratorReflection:
         assert mock_reflector_high_score.reflect.call_count == 1
         assert mock_synthesizer.synthesize.call_count == 1
 
-    @pytest.mark.asyncio
     async def test_orchestrator_with_reflection_low_score_retry(
         self, mock_planner, mock_executor, config_with_reflection
     ):
@@ -134,7 +132,6 @@ class TestOrchestratorReflection:
         assert mock_reflector.reflect.call_count == 2
         assert "개선된 답변" in result.answer
 
-    @pytest.mark.asyncio
     async def test_orchestrator_reflection_disabled(
         self, mock_planner, mock_executor, mock_synthesizer,
         mock_reflector_high_score, config_without_reflection
@@ -156,7 +153,6 @@ class TestOrchestratorReflection:
         assert result.success is True
         assert mock_reflector_high_score.reflect.call_count == 0
 
-    @pytest.mark.asyncio
     async def test_orchestrator_max_reflection_iterations(
         self, mock_planner, mock_executor, mock_synthesizer
     ):
@@ -190,7 +186,6 @@ class TestOrchestratorReflection:
         assert mock_reflector.reflect.call_count == 2
         assert result.success is True
 
-    @pytest.mark.asyncio
     async def test_orchestrator_without_reflector(
         self, mock_planner, mock_executor, mock_synthesizer,
         config_with_reflection
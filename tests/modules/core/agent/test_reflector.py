@@ -5,6 +5,7 @@ Self-Reflection 기능의 핵심 로직 검증:
 - 초기화 및 의존성 검증
 - reflect() 메서드 동작 검증
 """
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,6 +13,30 @@ import pytest
 from app.modules.core.agent.interfaces import AgentConfig, ReflectionResult
 from app.modules.core.agent.reflector import AgentReflector
 
+# Mock LLM만 사용하므로 5초 안에 끝나야 함 (회귀로 인한 무한 대기 시 즉시 실패)
+pytestmark = pytest.mark.timeout(5)
+
+
+def _reflection_json(**fields: object) -> str:
+    """LLM 평가 응답 JSON (공백 없는 정규 형식)"""
+    return json.dumps(fields, ensure_ascii=False, separators=(",", ":"))
+
+
+# 시나리오별 LLM 평가 응답 (모듈 로드 시 한 번만 생성)
+HIGH_QUALITY_REFLECTION = _reflection_json(
+    score=9.0,
+    issues=[],
+    suggestions=[],
+    reasoning="질문에 정확하게 답변하고 있으며 컨텍스트에 충실함",
+)
+LOW_QUALITY_REFLECTION = _reflection_json(
+    score=4.0,
+    issues=["정보 누락", "불확실한 내용"],
+    suggestions=["날씨 정보 추가 검색", "기온 확인 필요"],
+    reasoning="답변에 구체적인 정보가 부족함",
+)
+THRESHOLD_REFLECTION = _reflection_json(score=7.0, issues=[], suggestions=[], reasoning="적절함")
+
 
 class TestAgentReflectorInit:
     """AgentReflector 초기화 테스트"""
@@ -63,18 +88,10 @@ class TestAgentReflectorReflect:
         config = AgentConfig(reflection_threshold=7.0)
         return AgentReflector(llm_client=mock_llm_client, config=config)
 
-    @pytest.mark.asyncio
     async def test_reflect_high_quality_answer(self, reflector, mock_llm_client):
         """고품질 답변 평가 테스트"""
         # Given: LLM이 높은 점수 반환
-        mock_llm_client.generate_text.return_value = '''
-        {
-            "score": 9.0,
-            "issues": [],
-            "suggestions": [],
-            "reasoning": "질문에 정확하게 답변하고 있으며 컨텍스트에 충실함"
-        }
-        '''
+        mock_llm_client.generate_text.return_value = HIGH_QUALITY_REFLECTION
 
         # When: reflect() 호출
         result = await reflector.reflect(
@@ -89,18 +106,10 @@ class TestAgentReflectorReflect:
         assert result.needs_improvement is False
         assert result.issues == []
 
-    @pytest.mark.asyncio
     async def test_reflect_low_quality_answer(self, reflector, mock_llm_client):
         """저품질 답변 평가 테스트"""
         # Given: LLM이 낮은 점수 반환
-        mock_llm_client.generate_text.return_value = '''
-        {
-            "score": 4.0,
-            "issues": ["정보 누락", "불확실한 내용"],
-            "suggestions": ["날씨 정보 추가 검색", "기온 확인 필요"],
-            "reasoning": "답변에 구체적인 정보가 부족함"
-        }
-        '''
+        mock_llm_client.generate_text.return_value = LOW_QUALITY_REFLECTION
 
         # When: reflect() 호출
         result = await reflector.reflect(
@@ -115,13 +124,10 @@ class TestAgentReflectorReflect:
         assert "정보 누락" in result.issues
         assert len(result.suggestions) == 2
 
-    @pytest.mark.asyncio
     async def test_reflect_threshold_boundary(self, reflector, mock_llm_client):
         """threshold 경계값 테스트"""
         # Given: 정확히 threshold 점수
-        mock_llm_client.generate_text.return_value = (
-            '{"score": 7.0, "issues": [], "suggestions": [], "reasoning": "적절함"}'
-        )
+        mock_llm_client.generate_text.return_value = THRESHOLD_REFLECTION
 
         # When: reflect() 호출
         result = await reflector.reflect(
@@ -134,7 +140,6 @@ class TestAgentReflectorReflect:
         assert result.score == 7.0
         assert result.needs_improvement is False
 
-    @pytest.mark.asyncio
     async def test_reflect_llm_error_fallback(self, reflector, mock_llm_client):
         """LLM 에러 시 폴백 테스트"""
         # Given: LLM 에러 발생
@@ -151,3 +156,87 @@ class TestAgentReflectorReflect:
         assert result.score == 7.0  # 기본값
         assert result.needs_improvement is False
         assert "평가 실패" in result.reasoning
+
+    async def test_reflect_invalid_json_fallback(self, reflector, mock_llm_client):
+        """JSON 파싱 실패 시 폴백 테스트"""
+        # Given: LLM이 JSON이 아닌 응답 반환
+        mock_llm_client.generate_text.return_value = "점수는 8점입니다."
+
+        # When: reflect() 호출
+        result = await reflector.reflect(
+            query="테스트",
+            answer="테스트 답변",
+            context=""
+        )
+
+        # Then: 파싱 실패 시 기본값 사용
+        assert result.score == 7.0
+        assert result.needs_improvement is False
+        assert "평가 실패" in result.reasoning
+
+    async def test_reflect_markdown_code_block(self, reflector, mock_llm_client):
+        """마크다운 코드 블록으로 감싼 JSON 응답 파싱 테스트"""
+        # Given: LLM이 ```json 코드 블록으로 응답
+        mock_llm_client.generate_text.return_value = (
+            "평가 결과입니다.\n```json\n"
+            '{"score": 5.5, "issues": ["근거 부족"], "suggestions": [], "reasoning": "부족함"}'
+            "\n```"
+        )
+
+        # When: reflect() 호출
+        result = await reflector.reflect(
+            query="테스트",
+            answer="테스트 답변",
+            context=""
+        )
+
+        # Then: 코드 블록 내부 JSON이 파싱됨
+        assert result.score == 5.5
+        assert result.needs_improvement is True
+        assert result.issues == ["근거 부족"]
+
+    async def test_reflect_cache_hit_skips_llm(self, reflector, mock_llm_client):
+        """동일한 (query, answer, context) 재평가 시 캐시 결과 반환"""
+        # Given: LLM이 정상 JSON 반환
+        mock_llm_client.generate_text.return_value = '{"score": 8.0}'
+
+        # When: 같은 입력으로 두 번 reflect() 호출
+        first = await reflector.reflect(query="질문", answer="답변", context="문맥")
+        second = await reflector.reflect(query="질문", answer="답변", context="문맥")
+
+        # Then: LLM은 한 번만 호출되고 같은 내용의 결과 반환
+        assert mock_llm_client.generate_text.await_count == 1
+        assert second == first
+
+    async def test_reflect_cached_result_isolated_from_callers(self, reflector, mock_llm_client):
+        """호출자가 반환된 결과를 수정해도 캐시된 결과는 바뀌지 않음"""
+        # Given: 문제점이 포함된 평가 결과가 캐시됨
+        mock_llm_client.generate_text.return_value = '{"score": 5.0, "issues": ["근거 부족"]}'
+        first = await reflector.reflect(query="질문", answer="답변", context="문맥")
+
+        # When: 첫 번째 결과를 수정한 뒤 같은 입력으로 다시 호출
+        first.issues.append("호출자가 추가한 항목")
+        first.score = 0.0
+        second = await reflector.reflect(query="질문", answer="답변", context="문맥")
+        second.suggestions.append("두 번째 호출자가 추가한 항목")
+        third = await reflector.reflect(query="질문", answer="답변", context="문맥")
+
+        # Then: 캐시된 결과는 원래 평가 그대로
+        assert mock_llm_client.generate_text.await_count == 1
+        assert second.score == 5.0
+        assert second.issues == ["근거 부족"]
+        assert third.suggestions == []
+
+    async def test_reflect_fallback_not_cached(self, reflector, mock_llm_client):
+        """폴백 결과는 캐시하지 않음"""
+        # Given: 첫 호출은 파싱 실패, 두 번째는 정상 응답
+        mock_llm_client.generate_text.side_effect = ["점수는 8점입니다.", '{"score": 4.0}']
+
+        # When: 같은 입력으로 두 번 reflect() 호출
+        first = await reflector.reflect(query="질문", answer="답변", context="")
+        second = await reflector.reflect(query="질문", answer="답변", context="")
+
+        # Then: 두 번째 호출은 LLM을 다시 호출하여 실제 평가 결과 반환
+        assert "평가 실패" in first.reasoning
+        assert second.score == 4.0
+        assert mock_llm_client.generate_text.await_count == 2
@@ -5,12 +5,53 @@ TDD 방식으로 작성된 /chat/stream 엔드포인트 테스트.
 SSE(Server-Sent Events) 형식의 스트리밍 응답을 검증합니다.
 """
 
+import importlib
 import json
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from typing import Any
 from unittest.mock import MagicMock
 
+import httpx
 import pytest
 from fastapi import FastAPI
-from fastapi.testclient import TestClient
+
+from app.api.routers.chat_router import _encode_sse_event, router, set_chat_service
+
+# orjson 사용 가능 시 고속 JSON 파싱 (없으면 표준 json으로 폴백)
+_json_loads: Callable[[str], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+async def _aiter_sse_events(response: httpx.Response) -> AsyncIterator[tuple[str | None, Any]]:
+    """SSE 응답을 줄 단위로 읽어 (event 타입, data) 쌍을 도착 순서대로 yield"""
+    event_type = None
+    async for line in response.aiter_lines():
+        if line.startswith("event:"):
+            event_type = line.removeprefix("event:").strip()
+        elif line.startswith("data:"):
+            yield event_type, _json_loads(line.removeprefix("data:"))
+
+
+@pytest.fixture(scope="module")
+async def stream_client():
+    """
+    chat_router가 등록된 모듈 공용 비동기 HTTP 클라이언트
+
+    ASGITransport로 테스트 이벤트 루프에서 앱을 직접 호출하여
+    TestClient의 포털 스레드 전환 없이 요청합니다. 앱은 모듈당 한 번만 생성합니다.
+    ChatService는 chat_router 모듈 전역이므로 테스트별 fixture에서 set_chat_service()로 교체합니다.
+    """
+    app = FastAPI()
+    app.include_router(router)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
 
 
 class TestStreamEndpointExists:
@@ -18,21 +59,38 @@ class TestStreamEndpointExists:
 
     def test_stream_endpoint_exists(self):
         """스트리밍 엔드포인트가 라우터에 등록되어 있는지 확인"""
-        from app.api.routers.chat_router import router
-
         routes = [route.path for route in router.routes]
         assert "/chat/stream" in routes, "'/chat/stream' 엔드포인트가 라우터에 등록되어야 함"
 
     def test_stream_endpoint_is_post_method(self):
         """스트리밍 엔드포인트가 POST 메서드인지 확인"""
-        from app.api.routers.chat_router import router
-
         for route in router.routes:
             if hasattr(route, "path") and route.path == "/chat/stream":
                 assert "POST" in route.methods, "'/chat/stream'은 POST 메서드여야 함"
                 break
 
 
+class TestEncodeSSEEvent:
+    """SSE 프레임 인코딩 테스트"""
+
+    def test_encodes_event_as_sse_frame(self):
+        """이벤트 타입 줄 + JSON data 줄 + 빈 줄 형식의 UTF-8 bytes로 인코딩되는지 확인"""
+        event = {"event": "chunk", "data": "안녕하세요", "chunk_index": 0}
+
+        frame = _encode_sse_event(event)
+
+        assert frame.startswith(b"event: chunk\ndata: ")
+        assert frame.endswith(b"\n\n")
+        # 한글은 \uXXXX 이스케이프 없이 UTF-8 그대로 전송
+        assert "안녕하세요".encode() in frame
+        assert _json_loads(frame.removeprefix(b"event: chunk\ndata: ").decode()) == event
+
+    def test_defaults_to_chunk_and_supports_unknown_event_types(self):
+        """event 키가 없으면 chunk, 미리 정의되지 않은 타입도 그대로 인코딩되는지 확인"""
+        assert _encode_sse_event({"data": "텍스트"}).startswith(b"event: chunk\n")
+        assert _encode_sse_event({"event": "custom"}).startswith(b"event: custom\n")
+
+
 class TestStreamEndpointResponse:
     """스트리밍 엔드포인트 응답 테스트"""
 
@@ -52,100 +110,56 @@ class TestStreamEndpointResponse:
         return mock_service
 
     @pytest.fixture
-    def app_with_mock_service(self, mock_chat_service):
-        """Mock ChatService가 주입된 FastAPI 앱 생성"""
-        from app.api.routers.chat_router import router, set_chat_service
-
-        app = FastAPI()
-        app.include_router(router)
+    def client(self, stream_client, mock_chat_service):
+        """Mock ChatService가 주입된 공용 클라이언트"""
         set_chat_service(mock_chat_service)
+        return stream_client
 
-        return app
-
-    def test_stream_endpoint_returns_event_stream_content_type(self, app_with_mock_service):
-        """스트리밍 엔드포인트가 text/event-stream Content-Type을 반환하는지 확인"""
-        client = TestClient(app_with_mock_service)
-
-        response = client.post(
+    async def test_stream_endpoint_headers(self, client):
+        """스트리밍 엔드포인트의 SSE 응답 헤더 확인 (요청 1회로 모든 헤더 검증)"""
+        response = await client.post(
             "/chat/stream",
-            json={"message": "테스트 질문입니다"},
+            json={"message": "헤더 테스트"},
         )
 
         assert response.status_code == 200, f"응답 상태 코드가 200이어야 함. 실제: {response.status_code}"
+
         content_type = response.headers.get("content-type", "")
         assert content_type.startswith("text/event-stream"), (
             f"Content-Type이 text/event-stream이어야 함. 실제: {content_type}"
         )
 
-    def test_stream_endpoint_returns_sse_format(self, app_with_mock_service):
-        """스트리밍 엔드포인트가 SSE 형식으로 응답하는지 확인"""
-        client = TestClient(app_with_mock_service)
-
-        response = client.post(
-            "/chat/stream",
-            json={"message": "SSE 형식 테스트"},
-        )
-
-        # SSE 이벤트 파싱
-        content = response.text
-        events = []
-
-        for line in content.split("\n"):
-            if line.startswith("event:"):
-                event_type = line.replace("event:", "").strip()
-            elif line.startswith("data:"):
-                data_str = line.replace("data:", "").strip()
-                try:
-                    data = json.loads(data_str)
-                    events.append({"type": event_type, "data": data})
-                except json.JSONDecodeError:
-                    pass
-
-        # 최소 하나의 이벤트가 있어야 함
-        assert len(events) > 0, "SSE 이벤트가 최소 하나 이상 있어야 함"
-
-    def test_stream_endpoint_has_cache_control_header(self, app_with_mock_service):
-        """스트리밍 엔드포인트가 Cache-Control 헤더를 포함하는지 확인"""
-        client = TestClient(app_with_mock_service)
-
-        response = client.post(
-            "/chat/stream",
-            json={"message": "헤더 테스트"},
-        )
-
         cache_control = response.headers.get("cache-control", "")
         assert "no-cache" in cache_control, (
             f"Cache-Control에 no-cache가 포함되어야 함. 실제: {cache_control}"
         )
 
-    def test_stream_endpoint_has_connection_header(self, app_with_mock_service):
-        """스트리밍 엔드포인트가 Connection 헤더를 포함하는지 확인"""
-        client = TestClient(app_with_mock_service)
-
-        response = client.post(
-            "/chat/stream",
-            json={"message": "헤더 테스트"},
-        )
-
         connection = response.headers.get("connection", "")
         assert "keep-alive" in connection.lower(), (
             f"Connection에 keep-alive가 포함되어야 함. 실제: {connection}"
         )
 
-    def test_stream_endpoint_has_x_accel_buffering_header(self, app_with_mock_service):
-        """스트리밍 엔드포인트가 X-Accel-Buffering 헤더를 포함하는지 확인"""
-        client = TestClient(app_with_mock_service)
-
-        response = client.post(
-            "/chat/stream",
-            json={"message": "헤더 테스트"},
-        )
-
+        # 프록시(Nginx) 버퍼링 비활성화
         x_accel_buffering = response.headers.get("x-accel-buffering", "")
         assert x_accel_buffering == "no", (
             f"X-Accel-Buffering이 'no'여야 함. 실제: {x_accel_buffering}"
         )
 
+    async def test_stream_endpoint_returns_sse_format(self, client):
+        """스트리밍 엔드포인트가 SSE 형식으로 응답하는지 확인"""
+        # 첫 번째 event/data 쌍만 파싱하고 중단
+        async with client.stream(
+            "POST", "/chat/stream", json={"message": "SSE 형식 테스트"}
+        ) as response:
+            async with aclosing(_aiter_sse_events(response)) as events:
+                first_event = await anext(events, None)
+
+        # 최소 하나의 이벤트가 있어야 함
+        assert first_event is not None, "SSE 이벤트가 최소 하나 이상 있어야 함"
+        event_type, data = first_event
+        assert event_type == "metadata"
+        assert data["event"] == "metadata"
+
 
 class TestStreamEndpointValidation:
     """스트리밍 엔드포인트 유효성 검사 테스트"""
@@ -162,21 +176,14 @@ class TestStreamEndpointValidation:
         return mock_service
 
     @pytest.fixture
-    def app_with_mock_service(self, mock_chat_service):
-        """Mock ChatService가 주입된 FastAPI 앱 생성"""
-        from app.api.routers.chat_router import router, set_chat_service
-
-        app = FastAPI()
-        app.include_router(router)
+    def client(self, stream_client, mock_chat_service):
+        """Mock ChatService가 주입된 공용 클라이언트"""
         set_chat_service(mock_chat_service)
+        return stream_client
 
-        return app
-
-    def test_stream_endpoint_requires_message(self, app_with_mock_service):
+    async def test_stream_endpoint_requires_message(self, client):
         """스트리밍 엔드포인트에 message가 필수인지 확인"""
-        client = TestClient(app_with_mock_service)
-
-        response = client.post(
+        response = await client.post(
             "/chat/stream",
             json={},  # message 없음
         )
@@ -184,23 +191,19 @@ class TestStreamEndpointValidation:
         # Pydantic 유효성 검사 실패 → 422
         assert response.status_code == 422, f"message 없이 요청 시 422 에러 반환해야 함. 실제: {response.status_code}"
 
-    def test_stream_endpoint_accepts_optional_session_id(self, app_with_mock_service):
+    async def test_stream_endpoint_accepts_optional_session_id(self, client):
         """스트리밍 엔드포인트가 선택적 session_id를 처리하는지 확인"""
-        client = TestClient(app_with_mock_service)
-
         # session_id 포함
-        response = client.post(
+        response = await client.post(
             "/chat/stream",
             json={"message": "테스트", "session_id": "existing-session-123"},
         )
 
         assert response.status_code == 200, f"session_id 포함 요청이 성공해야 함. 실제: {response.status_code}"
 
-    def test_stream_endpoint_accepts_options(self, app_with_mock_service):
+    async def test_stream_endpoint_accepts_options(self, client):
         """스트리밍 엔드포인트가 options를 처리하는지 확인"""
-        client = TestClient(app_with_mock_service)
-
-        response = client.post(
+        response = await client.post(
             "/chat/stream",
             json={
                 "message": "옵션 테스트",
@@ -227,21 +230,14 @@ class TestStreamEndpointErrorHandling:
         return mock_service
 
     @pytest.fixture
-    def app_with_error_service(self, mock_error_chat_service):
-        """에러 ChatService가 주입된 FastAPI 앱 생성"""
-        from app.api.routers.chat_router import router, set_chat_service
-
-        app = FastAPI()
-        app.include_router(router)
+    def client(self, stream_client, mock_error_chat_service):
+        """에러 ChatService가 주입된 공용 클라이언트"""
         set_chat_service(mock_error_chat_service)
+        return stream_client
 
-        return app
-
-    def test_stream_endpoint_handles_service_error_gracefully(self, app_with_error_service):
+    async def test_stream_endpoint_handles_service_error_gracefully(self, client):
         """스트리밍 중 에러 발생 시 에러 이벤트를 전송하는지 확인"""
-        client = TestClient(app_with_error_service)
-
-        response = client.post(
+        response = await client.post(
             "/chat/stream",
             json={"message": "에러 테스트"},
         )
@@ -249,9 +245,9 @@ class TestStreamEndpointErrorHandling:
         # 스트리밍 응답은 일단 시작되므로 200 반환
         assert response.status_code == 200
 
-        content = response.text
-        # 에러 이벤트 또는 에러 관련 내용이 포함되어야 함
-        assert "error" in content.lower() or "STREAM_ERROR" in content, (
+        # 에러 이벤트 또는 에러 관련 내용이 포함되어야 함 (본문 디코딩 없이 bytes로 검사)
+        body = response.content
+        assert b"error" in body or b"Error" in body or b"STREAM_ERROR" in body, (
             "에러 발생 시 error 이벤트가 전송되어야 함"
         )
 
@@ -259,46 +255,28 @@ class TestStreamEndpointErrorHandling:
 class TestStreamEndpointWithoutService:
     """ChatService 미초기화 상태 테스트"""
 
-    def test_stream_endpoint_returns_503_when_service_not_initialized(self):
+    @pytest.fixture(scope="module")
+    def chat_router_module(self):
+        """
+        chat_router 모듈 객체
+
+        패키지 __init__.py가 router를 chat_router 이름으로 다시 내보내므로
+        속성 조회 대신 import_module()로 sys.modules의 모듈을 가져옵니다.
+        """
+        return importlib.import_module("app.api.routers.chat_router")
+
+    async def test_stream_endpoint_returns_503_when_service_not_initialized(
+        self, stream_client, chat_router_module, monkeypatch
+    ):
         """ChatService가 초기화되지 않았을 때 503 반환하는지 확인"""
-        import sys
-
-        # 모듈 캐시에서 직접 가져오기
-        # (패키지 __init__.py에서 router as chat_router로 덮어쓰기 전 모듈)
-        if "app.api.routers.chat_router" in sys.modules:
-            chat_router_module = sys.modules["app.api.routers.chat_router"]
-        else:
-            # 직접 import (패키지 __init__.py 로드 전 강제 모듈 로드)
-            import importlib.util
-
-            spec = importlib.util.find_spec("app.api.routers.chat_router")
-            if spec and spec.loader:
-                chat_router_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(chat_router_module)
-            else:
-                pytest.skip("chat_router 모듈을 찾을 수 없음")
-                return
-
-        # router 가져오기
-        router = chat_router_module.router
-
-        # 서비스를 None으로 설정
-        original_service = chat_router_module.chat_service
-        chat_router_module.chat_service = None
-
-        try:
-            app = FastAPI()
-            app.include_router(router)
-            client = TestClient(app, raise_server_exceptions=False)
-
-            response = client.post(
-                "/chat/stream",
-                json={"message": "테스트"},
-            )
-
-            assert response.status_code == 503, (
-                f"ChatService 미초기화 시 503 에러 반환해야 함. 실제: {response.status_code}"
-            )
-        finally:
-            # 원래 서비스 복원
-            chat_router_module.chat_service = original_service
+        # 서비스를 None으로 설정 (테스트 종료 시 monkeypatch가 원래 서비스 복원)
+        monkeypatch.setattr(chat_router_module, "chat_service", None)
+
+        response = await stream_client.post(
+            "/chat/stream",
+            json={"message": "테스트"},
+        )
+
+        assert response.status_code == 503, (
+            f"ChatService 미초기화 시 503 에러 반환해야 함. 실제: {response.status_code}"
+        )
@@ -126,6 +126,43 @@ class TestWebSocketChatFlow:
         # Cleanup
         set_chat_service(None)
 
+    @pytest.mark.asyncio
+    async def test_rerank_update_event_is_not_forwarded(self, app):
+        """rerank_update 이벤트는 내부 처리되고 토큰 스트림 순서에 영향 없음"""
+        service = MagicMock()
+
+        async def mock_stream():
+            yield {
+                "event": "metadata",
+                "data": {"session_id": "test-session", "search_results": 3, "ranked_results": None},
+            }
+            yield {
+                "event": "rerank_update",
+                "data": {"ranked_results": 2, "reranking_applied": True},
+            }
+            yield {"event": "chunk", "data": "답변", "chunk_index": 0}
+            yield {"event": "done", "data": {"session_id": "test-session", "total_chunks": 1}}
+
+        service.stream_rag_pipeline = MagicMock(return_value=mock_stream())
+        set_chat_service(service)
+
+        with TestClient(app) as client:
+            with client.websocket_connect("/chat-ws?session_id=test-session") as websocket:
+                websocket.send_json(
+                    {
+                        "type": "message",
+                        "message_id": "msg-001",
+                        "content": "안녕하세요",
+                        "session_id": "test-session",
+                    }
+                )
+
+                received = [websocket.receive_json()["type"] for _ in range(4)]
+
+        assert received == ["stream_start", "stream_token", "stream_sources", "stream_end"]
+
+        set_chat_service(None)
+
     @pytest.mark.asyncio
     async def test_invalid_message_sends_error(self, app):
         """잘못된 메시지 형식 시 에러 전송"""
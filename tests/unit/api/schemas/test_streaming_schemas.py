@@ -287,9 +287,43 @@ class TestStreamMetadataEvent:
             search_results=0,
         )
         data = event.model_dump()
-        expected_keys = {"event", "session_id", "search_results", "reranking_applied", "query_expansion", "timestamp"}
+        expected_keys = {"event", "session_id", "search_results", "ranked_results", "reranking_applied", "query_expansion", "timestamp"}
         assert set(data.keys()) == expected_keys
 
+    def test_metadata_event_ranked_results_pending(self):
+        """리랭킹 진행 중이면 ranked_results는 None"""
+        event = StreamMetadataEvent(
+            session_id="s1",
+            search_results=5,
+            ranked_results=None,
+        )
+        assert event.ranked_results is None
+
+        with pytest.raises(ValidationError):
+            StreamMetadataEvent(session_id="s1", search_results=5, ranked_results=-1)
+
+
+class TestStreamRerankUpdateEvent:
+    """StreamRerankUpdateEvent 스키마 테스트"""
+
+    def test_valid_rerank_update_event(self):
+        """chat_service가 전송하는 rerank_update 데이터 검증"""
+        from app.api.schemas.streaming import StreamRerankUpdateEvent
+
+        event = StreamRerankUpdateEvent(
+            **{"ranked_results": 3, "reranking_applied": True}
+        )
+        assert event.event == "rerank_update"
+        assert event.ranked_results == 3
+        assert event.reranking_applied is True
+
+    def test_rerank_update_negative_ranked_results_rejected(self):
+        """ranked_results 음수 거부"""
+        from app.api.schemas.streaming import StreamRerankUpdateEvent
+
+        with pytest.raises(ValidationError):
+            StreamRerankUpdateEvent(ranked_results=-1)
+
 
 class TestStreamEventSerialization:
     """스트리밍 이벤트 직렬화 테스트"""
@@ -11,6 +11,7 @@ ChatService 단위 테스트
 - 에러 핸들링
 """
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
@@ -331,6 +332,59 @@ class TestExtractTopic:
         topic = service.extract_topic(["검색", "찾기"])
         assert topic == "search"
 
+    def test_tuple_message_conversion(self, service: ChatService) -> None:
+        """
+        튜플 메시지 → 문자열 변환 → 토픽 추출
+
+        Given: 튜플 형태의 메시지
+        When: extract_topic 호출
+        Then: 리스트와 동일하게 연결 후 토픽 반환
+        """
+        topic = service.extract_topic(("기술", "문서"))  # type: ignore[arg-type]
+        assert topic == "document"
+
+    def test_non_sequence_iterable_uses_str_conversion(self, service: ChatService) -> None:
+        """
+        리스트/튜플이 아닌 이터러블은 연결하지 않고 문자열 변환
+
+        Given: 제너레이터 메시지
+        When: extract_topic 호출
+        Then: 제너레이터를 소비하지 않고 str() 결과로 토픽 추출 ('general')
+        """
+        message = (word for word in ["검색"])
+
+        topic = service.extract_topic(message)  # type: ignore[arg-type]
+
+        assert topic == "general"
+        assert next(message) == "검색"
+
+    def test_topic_priority_ignores_keyword_position(self, service: ChatService) -> None:
+        """
+        키워드 위치와 무관하게 우선순위가 높은 토픽 반환
+
+        Given: 낮은 우선순위 키워드가 앞에, 높은 우선순위 키워드가 뒤에 있는 메시지
+        When: extract_topic 호출
+        Then: 우선순위(search > document > help > technical)가 높은 토픽 반환
+        """
+        assert service.extract_topic("코드 설명 문서 검색") == "search"
+        assert service.extract_topic("개발 도움 자료") == "document"
+        assert service.extract_topic("기술 좀 알려줘") == "help"
+
+    def test_long_message_without_keywords_returns_general(self) -> None:
+        """
+        키워드 없는 긴 메시지는 general, 끝부분 키워드는 끝까지 검색하여 반환
+
+        Given: 키워드가 없는 2,000자 메시지와 끝에 키워드가 붙은 같은 메시지
+        When: _extract_topic_str 호출
+        Then: 키워드 없으면 'general', 끝의 '문서'는 'document'
+        """
+        from app.api.services.chat_service import _extract_topic_str
+
+        message = ("가나다라마바사 " * 250)[:2000]
+
+        assert _extract_topic_str(message) == "general"
+        assert _extract_topic_str(message + " 문서") == "document"
+
 
 class TestExecuteRAGPipeline:
     """execute_rag_pipeline 메서드 테스트"""
@@ -404,6 +458,34 @@ class TestExecuteRAGPipeline:
         call_args = service.rag_pipeline.execute.call_args
         assert call_args[1]["options"] == options
 
+    @pytest.mark.asyncio
+    async def test_execute_rag_pipeline_langsmith_disabled(
+        self,
+        mock_modules: dict[str, Any],
+        mock_config: dict[str, Any],
+    ) -> None:
+        """
+        LangSmith 비활성화 시 트레이싱 없이 RAG 파이프라인 실행
+
+        Given: langsmith.enabled=False 설정
+        When: execute_rag_pipeline 호출
+        Then: 트레이싱 래퍼 없이 RAGPipeline.execute() 직접 호출
+        """
+        service = ChatService(
+            modules=mock_modules,
+            config={**mock_config, "langsmith": {"enabled": False}},
+        )
+        service.rag_pipeline.execute = AsyncMock(return_value={"answer": "답변"})
+
+        result = await service.execute_rag_pipeline(message="질문", session_id="s1")
+
+        assert service.langsmith_enabled is False
+        assert service._run_rag_pipeline == service._execute_rag_pipeline_untraced
+        assert result["answer"] == "답변"
+        service.rag_pipeline.execute.assert_called_once_with(
+            message="질문", session_id="s1", options=None
+        )
+
 
 class TestAddConversationToSession:
     """add_conversation_to_session 메서드 테스트"""
@@ -436,6 +518,58 @@ class TestAddConversationToSession:
             {"tokens": 100},
         )
 
+    @pytest.mark.asyncio
+    async def test_follow_up_turn_sees_previous_turn(
+        self,
+        service: ChatService,
+    ) -> None:
+        """
+        저장 직후 다음 턴의 세션 컨텍스트에 이전 대화가 포함됨
+
+        Given: 저장된 대화를 컨텍스트 문자열로 돌려주는 session 모듈
+        When: 대화 저장 직후 같은 세션의 컨텍스트 조회
+        Then: 방금 저장한 질문/답변이 컨텍스트에 포함됨
+        """
+        history: dict[str, list[tuple[str, str]]] = {}
+
+        async def add_conversation(
+            session_id: str, user_message: str, assistant_answer: str, metadata: dict[str, Any]
+        ) -> None:
+            await asyncio.sleep(0)
+            history.setdefault(session_id, []).append((user_message, assistant_answer))
+
+        async def get_context_string(session_id: str) -> str:
+            return "\n".join(f"Q: {q}\nA: {a}" for q, a in history.get(session_id, []))
+
+        session_module = service.modules["session"]
+        session_module.add_conversation = AsyncMock(side_effect=add_conversation)
+        session_module.get_context_string = AsyncMock(side_effect=get_context_string)
+
+        await service.add_conversation_to_session("s1", "첫 질문", "첫 답변", {})
+        context = await service._fetch_session_context(session_module, "s1")
+
+        assert "첫 질문" in context
+        assert "첫 답변" in context
+
+    @pytest.mark.asyncio
+    async def test_add_conversation_write_failure_propagates(
+        self,
+        service: ChatService,
+    ) -> None:
+        """
+        저장 실패는 호출자(라우터)에게 전파됨
+
+        Given: add_conversation에서 예외 발생
+        When: add_conversation_to_session 호출
+        Then: 동일 예외가 전파됨
+        """
+        service.modules["session"].add_conversation = AsyncMock(
+            side_effect=RuntimeError("db down")
+        )
+
+        with pytest.raises(RuntimeError, match="db down"):
+            await service.add_conversation_to_session("s1", "질문", "답변", {})
+
     @pytest.mark.asyncio
     async def test_add_conversation_no_session_module(
         self,
@@ -530,6 +664,20 @@ class TestUpdateStats:
         assert service.stats["errors"] == 1
         assert service.stats["error_rate"] == pytest.approx(33.33, rel=0.01)  # 1/3 * 100
 
+    def test_update_stats_error_rate_after_recovery(self, service: ChatService) -> None:
+        """
+        에러 이후 성공 시 error_rate 갱신
+
+        Given: 실패 1회 후 성공 1회
+        When: update_stats 반복 호출
+        Then: error_rate가 전체 채팅 수 기준으로 재계산됨
+        """
+        service.update_stats({"success": False})
+        service.update_stats({"success": True, "tokens_used": 100, "latency": 1.0})
+
+        assert service.stats["errors"] == 1
+        assert service.stats["error_rate"] == 50.0  # 1/2 * 100
+
 
 class TestGetStats:
     """get_stats 메서드 테스트"""
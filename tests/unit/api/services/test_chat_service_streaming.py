@@ -11,25 +11,45 @@ ChatService.stream_rag_pipeline() 메서드 구현을 위한 TDD 테스트.
 - error: 에러 이벤트
 """
 
+import asyncio
+from dataclasses import dataclass
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from app.api.services.chat_service import ChatService
+
+
+@dataclass(slots=True)
+class _Doc:
+    """검색 결과 문서 스텁 (ChatService가 읽는 속성만 제공)"""
+
+    metadata: dict[str, Any]
+    content: str
+    page_content: str
+
 
 class TestChatServiceStreaming:
     """ChatService 스트리밍 테스트"""
 
-    @pytest.mark.asyncio
-    async def test_stream_rag_pipeline_yields_chunks(self):
-        """stream_rag_pipeline이 청크를 yield하는지 확인"""
-        from app.api.services.chat_service import ChatService
-
-        # Mock 세션 모듈 설정
+    @pytest.fixture(scope="module")
+    def shared_session_module(self):
+        """정상 세션 Mock (모듈 단위 공유, AsyncMock 생성 비용을 테스트마다 반복하지 않음)"""
         mock_session = MagicMock()
         mock_session.get_session = AsyncMock(return_value={"is_valid": True})
         mock_session.get_context_string = AsyncMock(return_value="")
         mock_session.create_session = AsyncMock(return_value={"session_id": "test-123"})
+        return mock_session
+
+    @pytest.fixture
+    def session_module(self, shared_session_module):
+        """정상 세션 Mock (테스트 종료 시 호출 기록만 초기화, 설정된 반환값은 유지)"""
+        yield shared_session_module
+        shared_session_module.reset_mock()
 
+    async def test_stream_rag_pipeline_yields_chunks(self, session_module):
+        """stream_rag_pipeline이 청크를 yield하는지 확인"""
         # Mock 생성 모듈 설정 - 스트리밍 제너레이터 반환
         mock_generation = MagicMock()
 
@@ -45,7 +65,7 @@ class TestChatServiceStreaming:
         mock_retrieval.search = AsyncMock(return_value=[])
 
         modules = {
-            "session": mock_session,
+            "session": session_module,
             "generation": mock_generation,
             "retrieval": mock_retrieval,
         }
@@ -63,17 +83,8 @@ class TestChatServiceStreaming:
         # 최소 1개 이상의 청크가 있어야 함
         assert len(chunks) >= 2
 
-    @pytest.mark.asyncio
-    async def test_stream_rag_pipeline_event_types(self):
+    async def test_stream_rag_pipeline_event_types(self, session_module):
         """스트리밍 이벤트 타입 확인 (metadata, chunk, done)"""
-        from app.api.services.chat_service import ChatService
-
-        # Mock 세션 모듈
-        mock_session = MagicMock()
-        mock_session.get_session = AsyncMock(return_value={"is_valid": True})
-        mock_session.get_context_string = AsyncMock(return_value="")
-        mock_session.create_session = AsyncMock(return_value={"session_id": "test-123"})
-
         # Mock 생성 모듈 - 스트리밍
         mock_generation = MagicMock()
 
@@ -84,14 +95,15 @@ class TestChatServiceStreaming:
 
         # Mock 검색 모듈 - 문서 반환
         mock_retrieval = MagicMock()
-        mock_doc = MagicMock()
-        mock_doc.metadata = {"source": "test.pdf", "score": 0.9}
-        mock_doc.content = "테스트 컨텐츠"
-        mock_doc.page_content = "테스트 컨텐츠"
+        mock_doc = _Doc(
+            metadata={"source": "test.pdf", "score": 0.9},
+            content="테스트 컨텐츠",
+            page_content="테스트 컨텐츠",
+        )
         mock_retrieval.search = AsyncMock(return_value=[mock_doc])
 
         modules = {
-            "session": mock_session,
+            "session": session_module,
             "generation": mock_generation,
             "retrieval": mock_retrieval,
         }
@@ -118,17 +130,8 @@ class TestChatServiceStreaming:
         # done 이벤트가 있어야 함
         assert "done" in event_types, f"done 이벤트가 없습니다. 실제 이벤트: {event_types}"
 
-    @pytest.mark.asyncio
-    async def test_stream_rag_pipeline_metadata_event_content(self):
+    async def test_stream_rag_pipeline_metadata_event_content(self, session_module):
         """metadata 이벤트에 검색 결과 정보가 포함되는지 확인"""
-        from app.api.services.chat_service import ChatService
-
-        # Mock 세션 모듈
-        mock_session = MagicMock()
-        mock_session.get_session = AsyncMock(return_value={"is_valid": True})
-        mock_session.get_context_string = AsyncMock(return_value="")
-        mock_session.create_session = AsyncMock(return_value={"session_id": "test-123"})
-
         # Mock 생성 모듈
         mock_generation = MagicMock()
 
@@ -139,18 +142,19 @@ class TestChatServiceStreaming:
 
         # Mock 검색 모듈 - 2개 문서
         mock_retrieval = MagicMock()
-        mock_docs = []
-        for i in range(2):
-            doc = MagicMock()
-            doc.metadata = {"source": f"doc{i}.pdf", "score": 0.9 - i * 0.1}
-            doc.content = f"문서 {i} 내용"
-            doc.page_content = f"문서 {i} 내용"
-            mock_docs.append(doc)
+        mock_docs = [
+            _Doc(
+                metadata={"source": f"doc{i}.pdf", "score": 0.9 - i * 0.1},
+                content=f"문서 {i} 내용",
+                page_content=f"문서 {i} 내용",
+            )
+            for i in range(2)
+        ]
 
         mock_retrieval.search = AsyncMock(return_value=mock_docs)
 
         modules = {
-            "session": mock_session,
+            "session": session_module,
             "generation": mock_generation,
             "retrieval": mock_retrieval,
         }
@@ -176,17 +180,8 @@ class TestChatServiceStreaming:
         assert "search_results" in data, "search_results가 없습니다"
         assert data["search_results"] == 2, f"검색 결과 수가 2가 아닙니다: {data['search_results']}"
 
-    @pytest.mark.asyncio
-    async def test_stream_rag_pipeline_chunk_event_content(self):
+    async def test_stream_rag_pipeline_chunk_event_content(self, session_module):
         """chunk 이벤트에 텍스트와 인덱스가 포함되는지 확인"""
-        from app.api.services.chat_service import ChatService
-
-        # Mock 세션 모듈
-        mock_session = MagicMock()
-        mock_session.get_session = AsyncMock(return_value={"is_valid": True})
-        mock_session.get_context_string = AsyncMock(return_value="")
-        mock_session.create_session = AsyncMock(return_value={"session_id": "test-123"})
-
         # Mock 생성 모듈 - 여러 청크
         mock_generation = MagicMock()
 
@@ -199,14 +194,11 @@ class TestChatServiceStreaming:
 
         # Mock 검색 모듈
         mock_retrieval = MagicMock()
-        mock_doc = MagicMock()
-        mock_doc.metadata = {"source": "test.pdf"}
-        mock_doc.content = "테스트"
-        mock_doc.page_content = "테스트"
+        mock_doc = _Doc(metadata={"source": "test.pdf"}, content="테스트", page_content="테스트")
         mock_retrieval.search = AsyncMock(return_value=[mock_doc])
 
         modules = {
-            "session": mock_session,
+            "session": session_module,
             "generation": mock_generation,
             "retrieval": mock_retrieval,
         }
@@ -231,17 +223,8 @@ class TestChatServiceStreaming:
             assert "chunk_index" in chunk, f"청크 {i}에 chunk_index가 없습니다"
             assert chunk["chunk_index"] == i, f"청크 인덱스가 잘못됨: {chunk['chunk_index']} != {i}"
 
-    @pytest.mark.asyncio
-    async def test_stream_rag_pipeline_done_event_content(self):
+    async def test_stream_rag_pipeline_done_event_content(self, session_module):
         """done 이벤트에 완료 정보가 포함되는지 확인"""
-        from app.api.services.chat_service import ChatService
-
-        # Mock 세션 모듈
-        mock_session = MagicMock()
-        mock_session.get_session = AsyncMock(return_value={"is_valid": True})
-        mock_session.get_context_string = AsyncMock(return_value="")
-        mock_session.create_session = AsyncMock(return_value={"session_id": "test-123"})
-
         # Mock 생성 모듈
         mock_generation = MagicMock()
 
@@ -256,7 +239,7 @@ class TestChatServiceStreaming:
         mock_retrieval.search = AsyncMock(return_value=[])
 
         modules = {
-            "session": mock_session,
+            "session": session_module,
             "generation": mock_generation,
             "retrieval": mock_retrieval,
         }
@@ -282,11 +265,28 @@ class TestChatServiceStreaming:
         assert "total_chunks" in data, "total_chunks가 없습니다"
         assert data["total_chunks"] == 2, f"청크 수가 2가 아닙니다: {data['total_chunks']}"
 
-    @pytest.mark.asyncio
+    async def test_stream_rag_pipeline_done_event_reuses_message_id(self):
+        """done 이벤트가 metadata 이벤트와 같은 message_id를 사용하는지 확인"""
+        mock_generation = MagicMock()
+
+        async def mock_stream(*args, **kwargs):
+            yield "응답"
+
+        mock_generation.stream_answer = mock_stream
+
+        mock_retrieval = MagicMock()
+        mock_retrieval.search = AsyncMock(return_value=[])
+
+        service = ChatService({"generation": mock_generation, "retrieval": mock_retrieval}, {})
+
+        events = {}
+        async for event in service.stream_rag_pipeline(message="테스트", session_id=None):
+            events[event["event"]] = event
+
+        assert events["done"]["data"]["message_id"] == events["metadata"]["data"]["message_id"]
+
     async def test_stream_rag_pipeline_error_handling(self):
         """에러 발생 시 error 이벤트가 yield되는지 확인"""
-        from app.api.services.chat_service import ChatService
-
         # Mock 세션 모듈 - 에러 발생
         mock_session = MagicMock()
         mock_session.get_session = AsyncMock(side_effect=Exception("세션 에러"))
@@ -294,8 +294,8 @@ class TestChatServiceStreaming:
 
         modules = {
             "session": mock_session,
-            "generation": MagicMock(),
-            "retrieval": MagicMock(),
+            "generation": object(),
+            "retrieval": object(),
         }
 
         service = ChatService(modules, {})
@@ -315,11 +315,8 @@ class TestChatServiceStreaming:
         assert "error_code" in error_event, "error_code가 없습니다"
         assert "message" in error_event, "message가 없습니다"
 
-    @pytest.mark.asyncio
     async def test_stream_rag_pipeline_creates_session_if_needed(self):
         """세션이 없으면 새로 생성하는지 확인"""
-        from app.api.services.chat_service import ChatService
-
         # Mock 세션 모듈 - 세션 없음 → 새로 생성
         mock_session = MagicMock()
         mock_session.get_session = AsyncMock(return_value={"is_valid": False})
@@ -363,17 +360,8 @@ class TestChatServiceStreaming:
         assert metadata_event is not None
         assert metadata_event["data"]["session_id"] == "new-session-456"
 
-    @pytest.mark.asyncio
-    async def test_stream_rag_pipeline_with_options(self):
+    async def test_stream_rag_pipeline_with_options(self, session_module):
         """옵션이 올바르게 전달되는지 확인"""
-        from app.api.services.chat_service import ChatService
-
-        # Mock 세션 모듈
-        mock_session = MagicMock()
-        mock_session.get_session = AsyncMock(return_value={"is_valid": True})
-        mock_session.get_context_string = AsyncMock(return_value="")
-        mock_session.create_session = AsyncMock(return_value={"session_id": "test-123"})
-
         # Mock 생성 모듈 - 옵션 확인
         mock_generation = MagicMock()
         received_options = {}
@@ -387,14 +375,11 @@ class TestChatServiceStreaming:
 
         # Mock 검색 모듈
         mock_retrieval = MagicMock()
-        mock_doc = MagicMock()
-        mock_doc.metadata = {"source": "test.pdf"}
-        mock_doc.content = "테스트"
-        mock_doc.page_content = "테스트"
+        mock_doc = _Doc(metadata={"source": "test.pdf"}, content="테스트", page_content="테스트")
         mock_retrieval.search = AsyncMock(return_value=[mock_doc])
 
         modules = {
-            "session": mock_session,
+            "session": session_module,
             "generation": mock_generation,
             "retrieval": mock_retrieval,
         }
@@ -408,13 +393,298 @@ class TestChatServiceStreaming:
             "model": "anthropic/claude-sonnet-4",
         }
 
-        async for _ in service.stream_rag_pipeline(
+        # 첫 chunk 이벤트(= stream_answer 호출 이후)까지만 소비하고 제너레이터 종료
+        stream = service.stream_rag_pipeline(
             message="테스트",
             session_id="test-123",
             options=options,
-        ):
-            pass
+        )
+        async for event in stream:
+            if event["event"] == "chunk":
+                break
+        await stream.aclose()
 
         # 옵션이 전달되었는지 확인
         assert "temperature" in received_options
         assert received_options["temperature"] == 0.7
+
+    async def test_stream_rag_pipeline_runs_context_and_search_concurrently(self):
+        """세션 컨텍스트 조회와 문서 검색이 동시에 실행되는지 확인"""
+        search_started = asyncio.Event()
+
+        # 컨텍스트 조회는 검색이 시작되어야만 완료됨 (순차 실행 시 교착)
+        async def mock_get_context_string(session_id):
+            await search_started.wait()
+            return "이전 대화"
+
+        async def mock_search(query, options):
+            search_started.set()
+            return []
+
+        mock_session = MagicMock()
+        mock_session.get_session = AsyncMock(return_value={"is_valid": True})
+        mock_session.get_context_string = mock_get_context_string
+
+        mock_retrieval = MagicMock()
+        mock_retrieval.search = mock_search
+
+        mock_generation = MagicMock()
+
+        async def mock_stream(*args, **kwargs):
+            yield "응답"
+
+        mock_generation.stream_answer = mock_stream
+
+        service = ChatService(
+            {
+                "session": mock_session,
+                "generation": mock_generation,
+                "retrieval": mock_retrieval,
+            },
+            {},
+        )
+
+        async def collect():
+            return [
+                event
+                async for event in service.stream_rag_pipeline(
+                    message="테스트", session_id="test-123"
+                )
+            ]
+
+        events = await asyncio.wait_for(collect(), timeout=2.0)
+
+        event_types = [e.get("event") for e in events]
+        assert "error" not in event_types
+        assert event_types[-1] == "done"
+
+    async def test_stream_rag_pipeline_search_failure_continues(self, session_module):
+        """검색 실패 시 빈 결과로 스트리밍을 계속하는지 확인"""
+        mock_retrieval = MagicMock()
+        mock_retrieval.search = AsyncMock(side_effect=Exception("검색 에러"))
+
+        mock_generation = MagicMock()
+
+        async def mock_stream(*args, **kwargs):
+            yield "응답"
+
+        mock_generation.stream_answer = mock_stream
+
+        service = ChatService(
+            {
+                "session": session_module,
+                "generation": mock_generation,
+                "retrieval": mock_retrieval,
+            },
+            {},
+        )
+
+        events = [
+            event
+            async for event in service.stream_rag_pipeline(message="테스트", session_id="test-123")
+        ]
+
+        metadata_event = next(e for e in events if e.get("event") == "metadata")
+        assert metadata_event["data"]["search_results"] == 0
+        assert events[-1]["event"] == "done"
+
+    async def test_stream_rag_pipeline_metadata_sent_before_rerank(self, session_module):
+        """리랭킹 활성화 시 metadata → rerank_update 순서로 이벤트가 전송되는지 확인"""
+        docs = [MagicMock(spec=["score"], score=0.9 - i * 0.1) for i in range(3)]
+
+        mock_retrieval = MagicMock()
+        mock_retrieval.search = AsyncMock(return_value=docs)
+        mock_retrieval.rerank = AsyncMock(return_value=docs[:2])
+
+        mock_generation = MagicMock()
+
+        async def mock_stream(*args, **kwargs):
+            yield "응답"
+
+        mock_generation.stream_answer = mock_stream
+
+        service = ChatService(
+            {
+                "session": session_module,
+                "generation": mock_generation,
+                "retrieval": mock_retrieval,
+            },
+            {"reranking": {"enabled": True}},
+        )
+
+        events = [
+            event
+            async for event in service.stream_rag_pipeline(message="테스트", session_id="test-123")
+        ]
+        event_types = [e["event"] for e in events]
+
+        assert event_types[:2] == ["metadata", "rerank_update"]
+        assert events[0]["data"]["search_results"] == 3
+        assert events[0]["data"]["ranked_results"] is None
+        assert events[1]["data"] == {"ranked_results": 2, "reranking_applied": True}
+
+    async def test_stream_rag_pipeline_rerank_overlaps_session_context(self):
+        """검색 완료 직후 리랭킹이 시작되어 세션 컨텍스트 조회와 겹쳐 실행되는지 확인"""
+        rerank_started = asyncio.Event()
+
+        async def slow_context(*args, **kwargs):
+            # 리랭킹이 컨텍스트 조회 완료를 기다린다면 여기서 타임아웃 발생
+            await asyncio.wait_for(rerank_started.wait(), timeout=1.0)
+            return ""
+
+        async def mock_rerank(query, results, top_n):
+            rerank_started.set()
+            return results
+
+        mock_session = MagicMock()
+        mock_session.get_session = AsyncMock(return_value={"is_valid": True})
+        mock_session.get_context_string = slow_context
+
+        doc = MagicMock(spec=["score"], score=0.9)
+
+        mock_retrieval = MagicMock()
+        mock_retrieval.search = AsyncMock(return_value=[doc])
+        mock_retrieval.rerank = mock_rerank
+
+        mock_generation = MagicMock()
+
+        async def mock_stream(*args, **kwargs):
+            yield "응답"
+
+        mock_generation.stream_answer = mock_stream
+
+        service = ChatService(
+            {
+                "session": mock_session,
+                "generation": mock_generation,
+                "retrieval": mock_retrieval,
+            },
+            {"reranking": {"enabled": True}},
+        )
+
+        event_types = [
+            event["event"]
+            async for event in service.stream_rag_pipeline(message="테스트", session_id="test-123")
+        ]
+
+        assert event_types == ["metadata", "rerank_update", "chunk", "done"]
+
+    async def test_stream_rag_pipeline_coalesces_chunks(self):
+        """청크 병합 설정 시 첫 청크 이후 대기 시간 내 연속 청크가 최대 개수 단위로 합쳐지는지 확인"""
+        mock_generation = MagicMock()
+
+        async def mock_stream(*args, **kwargs):
+            for text in ("가", "나", "다", "라", "마"):
+                yield text
+            # 병합 대기 시간보다 늦게 도착한 청크는 별도 이벤트로 전송
+            await asyncio.sleep(0.2)
+            yield "바"
+
+        mock_generation.stream_answer = mock_stream
+
+        mock_retrieval = MagicMock()
+        mock_retrieval.search = AsyncMock(return_value=[])
+
+        service = ChatService(
+            {"generation": mock_generation, "retrieval": mock_retrieval},
+            {"streaming": {"chunk_coalesce_ms": 50, "chunk_coalesce_max": 4}},
+        )
+
+        events = [
+            event async for event in service.stream_rag_pipeline(message="테스트", session_id=None)
+        ]
+        chunk_events = [e for e in events if e["event"] == "chunk"]
+
+        # 첫 청크는 병합 없이 즉시 전송
+        assert [e["data"] for e in chunk_events] == ["가", "나다라마", "바"]
+        assert [e["chunk_index"] for e in chunk_events] == [0, 1, 2]
+        assert events[-1]["data"]["total_chunks"] == 3
+
+    async def test_stream_rag_pipeline_coalesces_small_chunks_by_size(self):
+        """최대 문자 수 설정 시 빠르게 들어오는 작은 조각이 문자 수 기준으로 합쳐지는지 확인"""
+        mock_generation = MagicMock()
+
+        async def mock_stream(*args, **kwargs):
+            for _ in range(100):
+                yield "가"
+
+        mock_generation.stream_answer = mock_stream
+
+        mock_retrieval = MagicMock()
+        mock_retrieval.search = AsyncMock(return_value=[])
+
+        service = ChatService(
+            {"generation": mock_generation, "retrieval": mock_retrieval},
+            {
+                "streaming": {
+                    "chunk_coalesce_ms": 1000,
+                    "chunk_coalesce_max": 1000,
+                    "chunk_coalesce_max_chars": 32,
+                }
+            },
+        )
+
+        events = [
+            event async for event in service.stream_rag_pipeline(message="테스트", session_id=None)
+        ]
+        chunk_data = [e["data"] for e in events if e["event"] == "chunk"]
+
+        # 첫 조각은 즉시, 이후 32자 단위로 병합하고 남은 조각은 스트림 종료 시 전송
+        assert [len(data) for data in chunk_data] == [1, 32, 32, 32, 3]
+        assert "".join(chunk_data) == "가" * 100
+        assert events[-1]["data"]["total_chunks"] == 5
+
+    async def test_stream_rag_pipeline_coalesce_does_not_delay_first_chunk(self):
+        """청크 병합 대기 시간이 길어도 첫 청크는 다음 청크를 기다리지 않고 전송되는지 확인"""
+        mock_generation = MagicMock()
+        release = asyncio.Event()
+
+        async def mock_stream(*args, **kwargs):
+            yield "첫"
+            await release.wait()
+            yield "끝"
+
+        mock_generation.stream_answer = mock_stream
+
+        mock_retrieval = MagicMock()
+        mock_retrieval.search = AsyncMock(return_value=[])
+
+        service = ChatService(
+            {"generation": mock_generation, "retrieval": mock_retrieval},
+            {"streaming": {"chunk_coalesce_ms": 1000}},
+        )
+
+        stream = service.stream_rag_pipeline(message="테스트", session_id=None)
+        assert (await anext(stream))["event"] == "metadata"
+        first = await asyncio.wait_for(anext(stream), timeout=0.5)
+        release.set()
+        rest = [event async for event in stream]
+
+        assert first["event"] == "chunk"
+        assert first["data"] == "첫"
+        assert [e["data"] for e in rest if e["event"] == "chunk"] == ["끝"]
+
+    async def test_stream_rag_pipeline_coalesce_flushes_before_error(self):
+        """청크 병합 중 생성 에러가 나면 버퍼의 청크를 먼저 전송한 뒤 error 이벤트를 보내는지 확인"""
+        mock_generation = MagicMock()
+
+        async def mock_stream(*args, **kwargs):
+            yield "부분"
+            raise RuntimeError("LLM 연결 끊김")
+
+        mock_generation.stream_answer = mock_stream
+
+        mock_retrieval = MagicMock()
+        mock_retrieval.search = AsyncMock(return_value=[])
+
+        service = ChatService(
+            {"generation": mock_generation, "retrieval": mock_retrieval},
+            {"streaming": {"chunk_coalesce_ms": 1000}},
+        )
+
+        events = [
+            event async for event in service.stream_rag_pipeline(message="테스트", session_id=None)
+        ]
+
+        assert [e["event"] for e in events] == ["metadata", "chunk", "error"]
+        assert events[1]["data"] == "부분"
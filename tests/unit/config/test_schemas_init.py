@@ -5,51 +5,68 @@ Phase 2 R2.1: 레거시 동적 import 제거, 직접 함수 정의로 전환
 TDD RED 단계 - 테스트 먼저 작성
 """
 
+import functools
 from pathlib import Path
+from types import ModuleType
 
+import pytest
 
-class TestDetectDuplicateKeysInYaml:
-    """detect_duplicate_keys_in_yaml 함수 테스트"""
 
-    def test_import_from_schemas_package(self) -> None:
-        """schemas 패키지에서 함수 import 가능 확인"""
-        from app.config.schemas import detect_duplicate_keys_in_yaml
+@functools.cache
+def _schemas() -> ModuleType:
+    """app.config.schemas 모듈 (첫 호출 시 1회 임포트, 수집 시점에는 임포트하지 않음)"""
+    import app.config.schemas
 
-        assert callable(detect_duplicate_keys_in_yaml)
+    return app.config.schemas
 
-    def test_no_duplicates(self, tmp_path: Path) -> None:
-        """중복 키가 없는 YAML 파일"""
-        from app.config.schemas import detect_duplicate_keys_in_yaml
 
-        yaml_content = """
+# 중복 키 검사용 YAML 샘플 (파일명 → 내용)
+_YAML_SAMPLES = {
+    "no_dup.yaml": """
 app:
   name: test
 server:
   port: 8000
 database:
   host: localhost
-"""
-        yaml_file = tmp_path / "test.yaml"
-        yaml_file.write_text(yaml_content)
-
-        result = detect_duplicate_keys_in_yaml(str(yaml_file))
-        assert result == []
-
-    def test_with_duplicates(self, tmp_path: Path) -> None:
-        """중복 키가 있는 YAML 파일"""
-        from app.config.schemas import detect_duplicate_keys_in_yaml
-
-        yaml_content = """app:
+""",
+    "with_dup.yaml": """app:
   name: first
 server:
   port: 8000
 app:
   name: second
-"""
-        yaml_file = tmp_path / "test.yaml"
-        yaml_file.write_text(yaml_content)
+""",
+}
+
+
+@pytest.fixture(scope="session")
+def yaml_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """YAML 샘플 파일을 세션당 1회만 기록하여 경로를 반환"""
+    base = tmp_path_factory.mktemp("yaml_samples")
+    paths = {}
+    for name, content in _YAML_SAMPLES.items():
+        path = base / name
+        path.write_text(content)
+        paths[name] = path
+    return paths
+
 
-        result = detect_duplicate_keys_in_yaml(str(yaml_file))
+class TestDetectDuplicateKeysInYaml:
+    """detect_duplicate_keys_in_yaml 함수 테스트"""
+
+    def test_import_from_schemas_package(self) -> None:
+        """schemas 패키지에서 함수 import 가능 확인"""
+        assert callable(_schemas().detect_duplicate_keys_in_yaml)
+
+    def test_no_duplicates(self, yaml_files: dict[str, Path]) -> None:
+        """중복 키가 없는 YAML 파일"""
+        result = _schemas().detect_duplicate_keys_in_yaml(str(yaml_files["no_dup.yaml"]))
+        assert result == []
+
+    def test_with_duplicates(self, yaml_files: dict[str, Path]) -> None:
+        """중복 키가 있는 YAML 파일"""
+        result = _schemas().detect_duplicate_keys_in_yaml(str(yaml_files["with_dup.yaml"]))
         assert len(result) == 1
         assert "app" in result[0]
 
@@ -59,9 +76,7 @@ class TestValidateConfigDict:
 
     def test_import_from_schemas_package(self) -> None:
         """schemas 패키지에서 함수 import 가능 확인"""
-        from app.config.schemas import validate_config_dict
-
-        assert callable(validate_config_dict)
+        assert callable(_schemas().validate_config_dict)
 
 
 class TestBM25ConfigAndPrivacyConfig:
@@ -69,15 +84,11 @@ class TestBM25ConfigAndPrivacyConfig:
 
     def test_import_bm25_config(self) -> None:
         """BM25Config import 가능 확인"""
-        from app.config.schemas import BM25Config
-
-        assert BM25Config is not None
+        assert _schemas().BM25Config is not None
 
     def test_import_privacy_config(self) -> None:
         """PrivacyConfig import 가능 확인"""
-        from app.config.schemas import PrivacyConfig
-
-        assert PrivacyConfig is not None
+        assert _schemas().PrivacyConfig is not None
 
 
 class TestGenerationConfigMaxTokens:
@@ -143,22 +154,22 @@ class TestGenerationConfigMaxTokens:
         llm_field = LLMProviderSettings.model_fields["max_tokens"]
 
         # metadata에서 ge/le 값 추출 (별도 객체로 저장됨)
-        def extract_constraint(field_info, attr: str) -> int | None:  # type: ignore[no-untyped-def]
-            """Pydantic FieldInfo metadata에서 ge/le 제약조건 추출"""
-            for m in field_info.metadata:
-                if hasattr(m, attr):
-                    return getattr(m, attr)  # type: ignore[no-any-return]
-            return None
-
-        # ge (최소값) 일치
-        gen_ge = extract_constraint(gen_field, "ge")
-        llm_ge = extract_constraint(llm_field, "ge")
-        assert gen_ge == llm_ge, f"최소값 불일치: GenerationConfig={gen_ge}, LLMProviderSettings={llm_ge}"
-
-        # le (최대값) 일치
-        gen_le = extract_constraint(gen_field, "le")
-        llm_le = extract_constraint(llm_field, "le")
-        assert gen_le == llm_le, f"최대값 불일치: GenerationConfig={gen_le}, LLMProviderSettings={llm_le}"
+        def extract_constraints(field_info) -> dict[str, int]:  # type: ignore[no-untyped-def]
+            """Pydantic FieldInfo metadata를 한 번 순회하여 ge/le 제약조건 추출"""
+            return {
+                attr: getattr(m, attr)
+                for m in field_info.metadata
+                for attr in ("ge", "le")
+                if hasattr(m, attr)
+            }
+
+        # ge (최소값) / le (최대값) 일치
+        gen_constraints = extract_constraints(gen_field)
+        llm_constraints = extract_constraints(llm_field)
+        assert gen_constraints == llm_constraints, (
+            f"범위 불일치: GenerationConfig={gen_constraints}, "
+            f"LLMProviderSettings={llm_constraints}"
+        )
 
 
 class TestSchemasPackageExports:
@@ -166,7 +177,7 @@ class TestSchemasPackageExports:
 
     def test_all_exports_available(self) -> None:
         """모든 __all__ 항목이 import 가능"""
-        from app.config import schemas
+        schemas = _schemas()
 
         expected_exports = [
             "BaseConfig",
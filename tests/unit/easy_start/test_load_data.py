@@ -160,7 +160,6 @@ class TestBm25Index:
         Then: 검색 가능한 BM25Index 인스턴스 반환
         """
         pytest.importorskip("kiwipiepy")
-        pytest.importorskip("rank_bm25")
 
         from easy_start.load_data import build_bm25_index
 
@@ -184,7 +183,6 @@ class TestBm25Index:
         Then: 로드된 인덱스로 동일한 검색 결과 반환
         """
         pytest.importorskip("kiwipiepy")
-        pytest.importorskip("rank_bm25")
 
         from easy_start.load_data import (
             build_bm25_index,
@@ -199,7 +197,7 @@ class TestBm25Index:
 
         # 구축 → 저장
         index = build_bm25_index(docs)
-        index_path = str(tmp_path / "test_bm25.pkl")
+        index_path = str(tmp_path / "test_bm25")
         save_bm25_index(index, index_path)
 
         # 로드 → 검색
@@ -207,3 +205,61 @@ class TestBm25Index:
         assert hasattr(loaded, "search")
         results = loaded.search("설치", top_k=2)
         assert len(results) > 0
+
+    def test_load_legacy_bm25_index(self, tmp_path):
+        """
+        이전 단일 pickle 형식 BM25 인덱스 로드
+
+        Given: 토큰 문자열 리스트로 저장된 pickle 파일
+        When: load_bm25_index() 호출
+        Then: 디렉토리 형식으로 저장한 인덱스와 같은 검색 결과 반환
+        """
+        pytest.importorskip("kiwipiepy")
+
+        import pickle
+
+        from easy_start.load_data import (
+            build_bm25_index,
+            load_bm25_index,
+            save_bm25_index,
+        )
+
+        docs = [
+            {"id": "1", "content": "RAG 시스템 설치 가이드", "metadata": {}},
+            {"id": "2", "content": "채팅 API 사용법", "metadata": {}},
+        ]
+        index = build_bm25_index(docs)
+        current_path = str(tmp_path / "current")
+        save_bm25_index(index, current_path)
+
+        tokenized_corpus = index._tokenizer.tokenize_batch([doc["content"] for doc in docs])
+        legacy_path = tmp_path / "legacy.pkl"
+        with open(legacy_path, "wb") as f:
+            pickle.dump({"documents": docs, "tokenized_corpus": tokenized_corpus}, f)
+
+        current = load_bm25_index(current_path)
+        legacy = load_bm25_index(str(legacy_path))
+        assert legacy.search("설치 가이드", top_k=2) == current.search("설치 가이드", top_k=2)
+
+    def test_find_bm25_index_path_falls_back_to_legacy_pickle(self, tmp_path, monkeypatch):
+        """
+        디렉토리 인덱스가 없으면 이전 pickle 경로로 폴백
+
+        Given: 이전 pickle 파일만 있는 상태
+        When: find_bm25_index_path() 호출
+        Then: pickle 경로 반환, 디렉토리가 생기면 디렉토리 우선, 둘 다 없으면 None
+        """
+        import easy_start.load_data as load_data
+
+        index_dir = tmp_path / ".bm25_index"
+        legacy_file = tmp_path / ".bm25_index.pkl"
+        monkeypatch.setattr(load_data, "BM25_INDEX_PATH", str(index_dir))
+        monkeypatch.setattr(load_data, "LEGACY_BM25_INDEX_PATH", str(legacy_file))
+
+        assert load_data.find_bm25_index_path() is None
+
+        legacy_file.write_bytes(b"")
+        assert load_data.find_bm25_index_path() == str(legacy_file)
+
+        index_dir.mkdir()
+        assert load_data.find_bm25_index_path() == str(index_dir)
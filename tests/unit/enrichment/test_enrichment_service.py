@@ -6,44 +6,66 @@ EnrichmentService 단위 테스트
 의존성: pytest, pytest-asyncio, unittest.mock
 """
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import functools
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from app.modules.core.enrichment.enrichers.null_enricher import NullEnricher
-from app.modules.core.enrichment.schemas.enrichment_schema import (
-    EnrichmentResult,
-)
-from app.modules.core.enrichment.services.enrichment_service import EnrichmentService
+if TYPE_CHECKING:
+    from app.modules.core.enrichment.schemas.enrichment_schema import EnrichmentResult
+
+
+@functools.cache
+def _imports() -> tuple[Any, Any, Any]:
+    """(EnrichmentService, NullEnricher, EnrichmentResult) 지연 임포트
+
+    enrichment 패키지 임포트가 무거우므로 수집 시점이 아닌 첫 테스트 실행 시
+    한 번만 임포트합니다.
+    """
+    from app.modules.core.enrichment.enrichers.null_enricher import NullEnricher
+    from app.modules.core.enrichment.schemas.enrichment_schema import EnrichmentResult
+    from app.modules.core.enrichment.services.enrichment_service import EnrichmentService
+
+    return EnrichmentService, NullEnricher, EnrichmentResult
 
 # ---------------------------------------------------------------------------
 # 헬퍼: 테스트용 설정 딕셔너리 생성
 # ---------------------------------------------------------------------------
 
+# 기본 enrichment 설정 (읽기 전용 — _make_config()에서 바뀌는 섹션만 새로 만듦)
+_BASE_ENRICHMENT: dict = {
+    "enabled": False,
+    "llm": {"model": "gpt-4o-mini", "temperature": 0.1},
+    "batch": {"size": 10, "concurrency": 3},
+    "timeout": {"single": 30, "batch": 90},
+    "retry": {"max_attempts": 3},
+    "cache": {"enabled": False},
+    "quality": {"min_confidence": 0.0, "fallback_to_original": True},
+}
+
+
 def _make_config(
     enabled: bool = False,
     api_key: str | None = None,
     batch_size: int = 10,
     batch_concurrency: int = 3,
 ) -> dict:
-    """테스트용 설정 딕셔너리 생성"""
-    cfg: dict = {
+    """테스트용 설정 딕셔너리 생성 (변하지 않는 중첩 섹션은 _BASE_ENRICHMENT와 공유)"""
+    llm = _BASE_ENRICHMENT["llm"]
+    if api_key is not None:
+        llm = {**llm, "api_key": api_key}
+    return {
         "enrichment": {
+            **_BASE_ENRICHMENT,
             "enabled": enabled,
-            "llm": {"model": "gpt-4o-mini", "temperature": 0.1},
+            "llm": llm,
             "batch": {"size": batch_size, "concurrency": batch_concurrency},
-            "timeout": {"single": 30, "batch": 90},
-            "retry": {"max_attempts": 3},
-            "cache": {"enabled": False},
-            "quality": {"min_confidence": 0.0, "fallback_to_original": True},
         }
     }
-    if api_key is not None:
-        cfg["enrichment"]["llm"]["api_key"] = api_key
-    return cfg
 
 
-def _make_enrichment_result(**overrides) -> EnrichmentResult:
+def _make_enrichment_result(**overrides) -> "EnrichmentResult":
     """테스트용 EnrichmentResult 생성"""
     defaults = {
         "category_main": "테스트",
@@ -54,6 +76,7 @@ def _make_enrichment_result(**overrides) -> EnrichmentResult:
         "summary": "테스트 요약",
     }
     defaults.update(overrides)
+    _, _, EnrichmentResult = _imports()
     return EnrichmentResult(**defaults)
 
 
@@ -66,6 +89,7 @@ class TestParseEnrichmentConfig:
 
     def test_전체_설정_파싱(self) -> None:
         """모든 섹션이 있는 전체 설정 → 올바른 EnrichmentConfig 생성"""
+        EnrichmentService, _, _ = _imports()
         config = {
             "enrichment": {
                 "enabled": True,
@@ -96,6 +120,7 @@ class TestParseEnrichmentConfig:
 
     def test_빈_설정_기본값(self) -> None:
         """빈 dict → Pydantic 기본값으로 정상 생성"""
+        EnrichmentService, _, _ = _imports()
         service = EnrichmentService({})
         ec = service.enrichment_config
 
@@ -112,29 +137,29 @@ class TestParseEnrichmentConfig:
 class TestInitialize:
     """initialize() 메서드의 4가지 분기 경로 검증"""
 
-    @pytest.mark.asyncio
     async def test_경로1_비활성화시_NullEnricher(self) -> None:
         """enabled=false → NullEnricher 사용"""
+        EnrichmentService, NullEnricher, _ = _imports()
         service = EnrichmentService(_make_config(enabled=False))
         await service.initialize()
 
         assert isinstance(service.enricher, NullEnricher)
 
-    @pytest.mark.asyncio
     async def test_경로2_활성화_API키_없음_NullEnricher_폴백(self) -> None:
         """enabled=true + API 키 전부 없음 → NullEnricher 폴백
 
         폴백이 없으면 enricher=None으로 남아 모든 enrich() 호출이 실패합니다.
         """
+        EnrichmentService, NullEnricher, _ = _imports()
         # API 키 관련 설정이 전혀 없는 config
         service = EnrichmentService(_make_config(enabled=True))
         await service.initialize()
 
         assert isinstance(service.enricher, NullEnricher)
 
-    @pytest.mark.asyncio
     async def test_경로3_활성화_API키_있음_LLMEnricher_생성(self) -> None:
         """enabled=true + API 키 존재 → LLMEnricher 생성 및 initialize() 호출"""
+        EnrichmentService, _, _ = _imports()
         config = _make_config(enabled=True, api_key="sk-test-key")
 
         # LLMEnricher를 Mock하여 외부 의존성 차단
@@ -155,12 +180,12 @@ class TestInitialize:
             # enricher가 Mock LLMEnricher인지 확인
             assert service.enricher is mock_llm_enricher
 
-    @pytest.mark.asyncio
     async def test_경로4_LLMEnricher_초기화_예외시_NullEnricher_폴백(self) -> None:
         """LLMEnricher 생성/초기화 예외 → NullEnricher 폴백
 
         폴백이 없으면 서비스 전체가 중단됩니다.
         """
+        EnrichmentService, NullEnricher, _ = _imports()
         config = _make_config(enabled=True, api_key="sk-test-key")
 
         with patch(
@@ -183,6 +208,7 @@ class TestGetOpenaiApiKey:
 
     def test_1순위_enrichment_llm_api_key(self) -> None:
         """enrichment.llm.api_key가 있으면 최우선 반환"""
+        EnrichmentService, _, _ = _imports()
         config = {
             "enrichment": {"llm": {"api_key": "first-priority"}},
             "generation": {"openai": {"api_key": "second-priority"}},
@@ -193,6 +219,7 @@ class TestGetOpenaiApiKey:
 
     def test_2순위_generation_openai_api_key(self) -> None:
         """1순위 없고 generation.openai.api_key만 있으면 2순위 반환"""
+        EnrichmentService, _, _ = _imports()
         config = {
             "enrichment": {"llm": {}},
             "generation": {"openai": {"api_key": "second-priority"}},
@@ -203,6 +230,7 @@ class TestGetOpenaiApiKey:
 
     def test_3순위_llm_openai_api_key(self) -> None:
         """1,2순위 없고 llm.openai.api_key만 있으면 3순위 반환"""
+        EnrichmentService, _, _ = _imports()
         config = {
             "enrichment": {"llm": {}},
             "generation": {"openai": {}},
@@ -213,6 +241,7 @@ class TestGetOpenaiApiKey:
 
     def test_전부_없으면_None(self) -> None:
         """모든 경로에 API 키 없음 → None 반환"""
+        EnrichmentService, _, _ = _imports()
         config = {"enrichment": {"llm": {}}}
         service = EnrichmentService(config)
         assert service._get_openai_api_key() is None
@@ -225,17 +254,17 @@ class TestGetOpenaiApiKey:
 class TestEnrich:
     """enrich() 메서드의 에러 핸들링 검증"""
 
-    @pytest.mark.asyncio
     async def test_미초기화_상태_None_반환(self) -> None:
         """enricher=None (초기화 안 됨) → None 반환"""
+        EnrichmentService, _, _ = _imports()
         service = EnrichmentService(_make_config())
         # initialize() 호출하지 않음 → enricher는 None
         result = await service.enrich({"content": "테스트"})
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_enricher_예외시_None_반환(self) -> None:
         """enricher.enrich()가 예외 발생 → None 반환 (에러 삼킴)"""
+        EnrichmentService, _, _ = _imports()
         service = EnrichmentService(_make_config())
         # enricher를 예외 발생하는 Mock으로 설정
         mock_enricher = AsyncMock()
@@ -255,28 +284,30 @@ class TestEnrich:
 class TestEnrichBatch:
     """enrich_batch() 배치 처리 및 엣지 케이스 검증"""
 
-    @pytest.mark.asyncio
     async def test_빈_문서_빈_리스트(self) -> None:
         """documents=[] → [] 반환"""
+        EnrichmentService, NullEnricher, _ = _imports()
         service = EnrichmentService(_make_config())
         service.enricher = NullEnricher()
 
         result = await service.enrich_batch([])
         assert result == []
 
-    @pytest.mark.asyncio
     async def test_미초기화_None_리스트(self) -> None:
         """enricher=None → 문서 수만큼 None 리스트"""
+        EnrichmentService, _, _ = _imports()
         service = EnrichmentService(_make_config())
         docs = [{"content": "a"}, {"content": "b"}, {"content": "c"}]
 
         result = await service.enrich_batch(docs)
         assert result == [None, None, None]
 
+    # run=False: 수정 전까지 본문(Mock 구성 포함)을 실행하지 않음
+    # (버그 수정 시 run=False와 함께 xfail 마커를 제거하여 회귀 테스트로 전환)
     @pytest.mark.xfail(
-        reason="알려진 버그: 실패 배치의 None 개수가 batch_size 고정값 사용 (line 214)"
+        reason="알려진 버그: 실패 배치의 None 개수가 batch_size 고정값 사용 (line 214)",
+        run=False,
     )
-    @pytest.mark.asyncio
     async def test_실패_배치_None_개수_버그(self) -> None:
         """batch_size=3, 문서 7개 → 배치 [3,3,1], 마지막 배치 실패 시
 
@@ -284,6 +315,7 @@ class TestEnrichBatch:
         마지막 배치의 실제 크기는 1이므로 결과가 7이 아닌 9가 됩니다.
         올바른 동작은 결과 길이가 입력 문서 수(7)와 같아야 합니다.
         """
+        EnrichmentService, _, _ = _imports()
         config = _make_config(enabled=True, batch_size=3, batch_concurrency=3)
         service = EnrichmentService(config)
 
@@ -320,6 +352,7 @@ class TestGetStats:
 
     def test_NullEnricher_사용시_비활성_통계(self) -> None:
         """NullEnricher → {"enabled": False, "enricher_type": "NullEnricher"}"""
+        EnrichmentService, NullEnricher, _ = _imports()
         service = EnrichmentService(_make_config())
         service.enricher = NullEnricher()
 
@@ -328,40 +361,33 @@ class TestGetStats:
 
     def test_LLMEnricher_사용시_get_stats_호출(self) -> None:
         """LLMEnricher → enricher.get_stats() 위임 확인"""
+        EnrichmentService, _, _ = _imports()
         service = EnrichmentService(_make_config())
 
-        # LLMEnricher를 isinstance 체크를 통과하는 Mock으로 설정
-        mock_stats = {"total_enrichments": 10, "success_rate": 90.0}
-
-        with patch(
-            "app.modules.core.enrichment.services.enrichment_service.LLMEnricher",
-        ) as mock_cls:
-            mock_instance = MagicMock(spec_set=["get_stats"])
-            mock_instance.get_stats.return_value = mock_stats
-            # isinstance(service.enricher, LLMEnricher)가 True가 되도록 설정
-            mock_cls.return_value = mock_instance
-            service.enricher = mock_instance
-
-            # isinstance 체크를 위해 LLMEnricher 클래스 패치
-            # MagicMock은 isinstance 체크를 통과하지 못하므로
-            # 실제 분기에서 else로 갈 수 있음 → 직접 타입 검증
-            # 대신 LLMEnricher 인스턴스를 실제로 만들어서 테스트
-            pass
-
-        # 실제 LLMEnricher isinstance 체크를 통과하는 방법:
-        # LLMEnricher를 직접 import하고 __class__를 패치
         from app.modules.core.enrichment.enrichers.llm_enricher import LLMEnricher
 
-        mock_enricher = MagicMock(spec=LLMEnricher)
-        mock_enricher.get_stats.return_value = mock_stats
-        service.enricher = mock_enricher
+        class _StubLLMEnricher(LLMEnricher):
+            """isinstance(LLMEnricher) 분기를 타는 최소 스텁 (부모 __init__ 생략)"""
+
+            def __init__(self, stats: dict) -> None:
+                self._stats = stats
+                self.get_stats_calls = 0
+
+            def get_stats(self) -> dict:
+                self.get_stats_calls += 1
+                return self._stats
+
+        mock_stats = {"total_enrichments": 10, "success_rate": 90.0}
+        stub_enricher = _StubLLMEnricher(mock_stats)
+        service.enricher = stub_enricher
 
         stats = service.get_stats()
         assert stats == mock_stats
-        mock_enricher.get_stats.assert_called_once()
+        assert stub_enricher.get_stats_calls == 1
 
     def test_enricher_None_비활성_통계(self) -> None:
         """enricher=None → NullEnricher 분기 통계 (else 경로)"""
+        EnrichmentService, _, _ = _imports()
         service = EnrichmentService(_make_config())
         # enricher가 None이면 isinstance(None, LLMEnricher) = False → else
         stats = service.get_stats()
@@ -241,6 +241,20 @@ class TestStopwordFilter:
         assert len(filter_disabled.stopwords) == 0
         assert filter_disabled.count == 0
 
+    def test_active_stopwords(self, filter_default, filter_disabled):
+        """
+        멤버십 검사용 불용어 집합
+
+        Given: 활성/비활성 필터
+        When: active_stopwords 조회 (불용어 추가 후 포함)
+        Then: 활성 필터는 현재 불용어 반영, 비활성 필터는 빈 집합
+        """
+        filter_default.add_stopword("신규불용어")
+
+        assert "신규불용어" in filter_default.active_stopwords
+        assert "있는" in filter_default.active_stopwords
+        assert len(filter_disabled.active_stopwords) == 0
+
     def test_filter_handles_empty_tokens(self, filter_default):
         """
         빈 토큰 리스트 처리
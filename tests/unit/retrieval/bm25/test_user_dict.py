@@ -3,7 +3,7 @@ User Dictionary 사용자 사전 테스트
 
 테스트 범위:
 1. 엔트리 보호 (형태소 분석 방지)
-2. 엔트리 복원
+2. 엔트리 복원 (텍스트/토큰 리스트)
 3. 패턴 빌드 (긴 단어 우선)
 4. 엔트리 찾기
 5. 엔트리 관리 (추가/제거)
@@ -107,6 +107,24 @@ class TestUserDictionary:
         # 검증: 완전 복원
         assert restored == original
 
+    def test_restore_tokens_matches_restore_entries(self, dict_with_entries):
+        """
+        토큰 리스트 일괄 복원
+
+        Given: 임시 토큰이 포함된 토큰과 일반 토큰
+        When: restore_tokens() 호출
+        Then: 토큰별 restore_entries() 결과와 동일
+        """
+        _, restore_map = dict_with_entries.protect_entries("서울특별시 복합항목명 AI모델")
+        tokens = [*restore_map, "강남구", "조회", f"{next(iter(restore_map))}에서"]
+
+        restored = dict_with_entries.restore_tokens(tokens, restore_map)
+
+        assert restored == [
+            dict_with_entries.restore_entries(token, restore_map) for token in tokens
+        ]
+        assert set(restored[:3]) == {"서울특별시", "복합항목명", "AI모델"}
+
     def test_contains(self, dict_with_entries):
         """
         엔트리 포함 여부 확인
@@ -1,7 +1,7 @@
 """
 BM25Index 단위 테스트
 
-rank-bm25 라이브러리를 래핑한 BM25 인덱스.
+NumPy 기반 BM25+ 점수 계산기를 사용하는 BM25 인덱스.
 문서 인덱싱 및 키워드 검색 기능을 테스트합니다.
 
 테스트 범위:
@@ -10,13 +10,12 @@ rank-bm25 라이브러리를 래핑한 BM25 인덱스.
 3. 빈 인덱스 처리
 4. 점수 정규화 (0~1)
 5. 메타데이터 필터링
+6. 디렉토리 저장/메모리 맵 로드
 """
 
 import pytest
 
-# rank_bm25 선택적 의존성
-pytest.importorskip("rank_bm25")
-# kiwipiepy도 필요
+# kiwipiepy 선택적 의존성
 pytest.importorskip("kiwipiepy")
 
 
@@ -57,6 +56,114 @@ class TestBM25IndexBuild:
 
         assert index.document_count == 0
 
+    def test_build_with_process_pool_matches_single_process(self, monkeypatch) -> None:
+        """
+        프로세스 풀 토큰화 결과가 단일 프로세스와 동일
+
+        Given: 전처리 모듈이 주입된 토크나이저와 문서 5개, 임계값 2로 낮춤
+        When: build(n_workers=2) 호출
+        Then: 피클링 왕복한 워커 토크나이저로 문서 순서대로 같은 토큰 코퍼스 생성
+
+        실제 spawn 프로세스 대신 스레드 풀로 대체해 샤딩/순서/피클링 경로만 검증합니다.
+        """
+        import pickle
+        from concurrent.futures import ThreadPoolExecutor
+
+        from app.modules.core.retrieval.bm25.stopwords import StopwordFilter
+        from app.modules.core.retrieval.bm25_engine import index as index_module
+        from app.modules.core.retrieval.bm25_engine.index import BM25Index
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        pools: list[int] = []
+
+        def fake_pool(max_workers, mp_context, initializer, initargs):
+            pools.append(max_workers)
+            worker_args = pickle.loads(pickle.dumps(initargs))
+            return ThreadPoolExecutor(
+                max_workers=1, initializer=initializer, initargs=worker_args
+            )
+
+        monkeypatch.setattr(index_module, "_PARALLEL_MIN_DOCUMENTS", 2)
+        monkeypatch.setattr(index_module, "ProcessPoolExecutor", fake_pool)
+
+        tokenizer = KoreanTokenizer(stopword_filter=StopwordFilter())
+        documents = [
+            {"id": f"doc-{i}", "content": content}
+            for i, content in enumerate([
+                "삼성전자 주가 분석 리포트",
+                "애플 아이폰 신제품 출시",
+                "",
+                "RAG 시스템 설치 가이드",
+                "삼성전자 반도체 사업 전망",
+            ])
+        ]
+
+        single = BM25Index(tokenizer=tokenizer)
+        single.build(documents)
+        pooled = BM25Index(tokenizer=tokenizer)
+        pooled.build(documents, n_workers=2)
+
+        assert pools == [2]
+        for query in (["삼성전자"], ["애플", "출시", "가이드"]):
+            expected = single._bm25.get_scores(query).tolist()
+            assert pooled._bm25.get_scores(query).tolist() == expected
+        assert pooled.search("삼성전자")[0]["id"] == single.search("삼성전자")[0]["id"]
+
+    def test_build_reuses_token_cache(self, monkeypatch) -> None:
+        """
+        토큰 캐시를 넘기면 내용이 같은 문서는 다시 토큰화하지 않음
+
+        Given: 첫 구축으로 채워진 토큰 캐시
+        When: 한 문서만 내용을 바꿔 재구축
+        Then: 바뀐 문서만 토큰화되고 검색 결과는 캐시 없이 구축한 인덱스와 동일
+        """
+        from app.modules.core.retrieval.bm25_engine.index import BM25Index
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        tokenizer = KoreanTokenizer()
+        tokenized: list[str] = []
+        tokenize_batch = tokenizer.tokenize_batch
+
+        def counting_tokenize_batch(texts: list[str]) -> list[list[str]]:
+            tokenized.extend(texts)
+            return tokenize_batch(texts)
+
+        monkeypatch.setattr(tokenizer, "tokenize_batch", counting_tokenize_batch)
+
+        documents = [
+            {"id": "doc-1", "content": "삼성전자 주가 분석 리포트"},
+            {"id": "doc-2", "content": "애플 아이폰 신제품 출시"},
+        ]
+        token_cache: dict[str, list[str]] = {}
+        index = BM25Index(tokenizer=tokenizer)
+        index.build(documents, token_cache=token_cache)
+        assert len(token_cache) == 2
+
+        updated = [documents[0], {"id": "doc-2", "content": "삼성전자 반도체 사업 전망"}]
+        tokenized.clear()
+        index.build(updated, token_cache=token_cache)
+
+        assert tokenized == ["삼성전자 반도체 사업 전망"]
+        reference = BM25Index(tokenizer=KoreanTokenizer())
+        reference.build(updated)
+        assert index.search("삼성전자 전망") == reference.search("삼성전자 전망")
+
+    def test_build_small_corpus_skips_process_pool(self, monkeypatch) -> None:
+        """임계값 미만 코퍼스는 n_workers와 무관하게 프로세스 풀을 만들지 않음"""
+        from app.modules.core.retrieval.bm25_engine import index as index_module
+        from app.modules.core.retrieval.bm25_engine.index import BM25Index
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        def fail_pool(*args, **kwargs):
+            raise AssertionError("소규모 코퍼스에서 프로세스 풀이 생성됨")
+
+        monkeypatch.setattr(index_module, "ProcessPoolExecutor", fail_pool)
+
+        index = BM25Index(tokenizer=KoreanTokenizer())
+        index.build([{"id": "doc-1", "content": "삼성전자 주가"}], n_workers=4)
+
+        assert index.document_count == 1
+
 
 class TestBM25IndexSearch:
     """BM25Index 검색 테스트"""
@@ -115,6 +222,133 @@ class TestBM25IndexSearch:
         if results:
             assert all(r["score"] < 0.1 for r in results)
 
+    def test_search_caches_query_tokenization(self, built_index, monkeypatch) -> None:
+        calls: list[str] = []
+        tokenize = built_index._tokenizer.tokenize
+
+        def counting_tokenize(text: str) -> list[str]:
+            calls.append(text)
+            return tokenize(text)
+
+        monkeypatch.setattr(built_index._tokenizer, "tokenize", counting_tokenize)
+
+        first = built_index.search("삼성전자 주가", top_k=2)
+        assert built_index.search("삼성전자 주가", top_k=2) == first
+        assert calls == ["삼성전자 주가"]
+
+        # 재구축 시 캐시 초기화
+        built_index.build(built_index._documents)
+        built_index.search("삼성전자 주가", top_k=2)
+        assert calls == ["삼성전자 주가", "삼성전자 주가"]
+
+    def test_search_batch_matches_search(self, built_index) -> None:
+        queries = ["삼성전자", "아이폰 출시", "", "삼성전자 주가"]
+        results = built_index.search_batch(queries, top_k=2)
+        assert results == [built_index.search(query, top_k=2) for query in queries]
+
+    def test_search_batch_empty_index(self) -> None:
+        from app.modules.core.retrieval.bm25_engine.index import BM25Index
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        index = BM25Index(tokenizer=KoreanTokenizer())
+        index.build([])
+        assert index.search_batch(["삼성전자", "애플"], top_k=3) == [[], []]
+
+    def test_search_matches_full_sort_reference(self) -> None:
+        """
+        벡터화된 상위 top_k 선택이 전체 정렬 결과와 동일
+
+        Given: 동점 문서가 섞인 코퍼스
+        When: 여러 top_k로 search() 호출
+        Then: 양수 점수 문서를 sigmoid 정규화 후 stable 정렬한 결과와 순서/점수 일치
+        """
+        import math
+
+        from app.modules.core.retrieval.bm25_engine.index import BM25Index
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        contents = ["삼성전자 주가", "애플 아이폰", "삼성전자 반도체 삼성전자", "삼성전자 주가"] * 5
+        documents = [{"id": f"doc-{i}", "content": c} for i, c in enumerate(contents)]
+        index = BM25Index(tokenizer=KoreanTokenizer())
+        index.build(documents)
+
+        raw_scores = index._bm25.get_scores(index._tokenizer.tokenize("삼성전자 주가"))
+        reference = sorted(
+            (
+                (documents[i]["id"], 1.0 / (1.0 + math.exp(-raw)))
+                for i, raw in enumerate(raw_scores)
+                if raw > 0
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+        for top_k in (1, 3, 7, len(documents), len(documents) + 5):
+            results = index.search("삼성전자 주가", top_k=top_k)
+            assert [r["id"] for r in results] == [doc_id for doc_id, _ in reference[:top_k]]
+            assert [r["score"] for r in results] == pytest.approx(
+                [score for _, score in reference[:top_k]]
+            )
+
+
+class TestBM25IndexPersistence:
+    """BM25Index save()/load() 테스트"""
+
+    def test_save_and_load_memory_mapped(self, tmp_path) -> None:
+        """
+        디렉토리로 저장한 인덱스를 메모리 맵으로 로드
+
+        Given: 구축된 인덱스
+        When: save() 후 load()
+        Then: 포스팅 배열이 memmap으로 열리고 검색 결과가 원본과 동일
+        """
+        import numpy as np
+
+        from app.modules.core.retrieval.bm25_engine.index import BM25Index
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        tokenizer = KoreanTokenizer()
+        index = BM25Index(tokenizer=tokenizer)
+        index.build([
+            {"id": "doc-1", "content": "삼성전자 주가 분석 리포트", "metadata": {"page": 1}},
+            {"id": "doc-2", "content": "애플 아이폰 신제품 출시 소식"},
+            {"id": "doc-3", "content": "삼성전자 반도체 사업 전망"},
+        ])
+        index.save(tmp_path / "bm25")
+
+        loaded = BM25Index.load(tmp_path / "bm25", tokenizer=tokenizer)
+
+        assert isinstance(loaded._bm25._posting_weights, np.memmap)
+        assert loaded.document_count == 3
+        for query in ("삼성전자", "아이폰 출시", "삼성전자 반도체 전망"):
+            assert loaded.search(query, top_k=2) == index.search(query, top_k=2)
+
+    def test_save_and_load_empty_index(self, tmp_path) -> None:
+        """빈 인덱스도 저장/로드되며 검색 결과는 빈 리스트"""
+        from app.modules.core.retrieval.bm25_engine.index import BM25Index
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        tokenizer = KoreanTokenizer()
+        index = BM25Index(tokenizer=tokenizer)
+        index.build([])
+        index.save(tmp_path / "empty")
+
+        loaded = BM25Index.load(tmp_path / "empty", tokenizer=tokenizer)
+        assert loaded.search("삼성전자") == []
+
+    def test_load_rejects_unknown_format(self, tmp_path) -> None:
+        """형식 버전이 다른 디렉토리는 ValueError"""
+        import pickle
+
+        from app.modules.core.retrieval.bm25_engine.index import BM25Index
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        with open(tmp_path / "meta.pkl", "wb") as f:
+            pickle.dump({"format_version": 0, "documents": []}, f)
+
+        with pytest.raises(ValueError, match="형식"):
+            BM25Index.load(tmp_path, tokenizer=KoreanTokenizer())
+
 
 class TestBM25IndexResultFormat:
     """BM25Index 결과 형식 테스트"""
@@ -9,7 +9,6 @@ import pytest
 
 # 선택적 의존성 확인
 pytest.importorskip("kiwipiepy")
-pytest.importorskip("rank_bm25")
 
 from app.modules.core.retrieval.interfaces import SearchResult
 
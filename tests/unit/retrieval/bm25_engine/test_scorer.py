@@ -0,0 +1,191 @@
+"""
+BM25PlusScorer 단위 테스트
+
+NumPy 포스팅 배열 기반 BM25+ 점수 계산기.
+
+테스트 범위:
+1. BM25+ 공식과의 일치 (tf=0 문서의 delta 하한 포함)
+2. 중복/미등록 쿼리 용어 처리
+3. rank-bm25 BM25Plus와의 점수 일치 (설치된 경우)
+4. MaxScore 가지치기 후보 점수와 전체 점수의 일치
+5. 토큰 문자열 → 정수 ID 변환
+6. .npy 저장 및 메모리 맵 로드
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from app.modules.core.retrieval.bm25_engine.scorer import BM25PlusScorer, intern_corpus
+
+CORPUS = [
+    ["삼성전자", "주가", "분석"],
+    ["애플", "아이폰", "출시"],
+    [],
+    ["삼성전자", "반도체", "삼성전자", "전망"],
+    ["주가", "전망"],
+]
+
+
+def _reference_scores(
+    corpus: list[list[str]], query: list[str], k1: float = 1.5, b: float = 0.75, delta: float = 1.0
+) -> list[float]:
+    """BM25+ 공식을 문서별로 직접 계산한 기준값"""
+    n = len(corpus)
+    avgdl = sum(map(len, corpus)) / n
+    doc_freq: dict[str, int] = {}
+    for doc in corpus:
+        for term in set(doc):
+            doc_freq[term] = doc_freq.get(term, 0) + 1
+
+    scores = []
+    for doc in corpus:
+        score = 0.0
+        for term in query:
+            if term not in doc_freq:
+                continue
+            idf = math.log((n + 1) / doc_freq[term])
+            tf = doc.count(term)
+            norm = k1 * (1 - b + b * len(doc) / avgdl)
+            score += idf * (delta + tf * (k1 + 1) / (norm + tf))
+        scores.append(score)
+    return scores
+
+
+class TestBM25PlusScorer:
+    """BM25PlusScorer 점수 계산 테스트"""
+
+    def test_scores_match_bm25_plus_formula(self) -> None:
+        """
+        문서별 점수가 BM25+ 공식과 일치
+
+        Given: 빈 문서와 반복 용어가 섞인 코퍼스
+        When: get_scores() 호출
+        Then: 모든 문서(용어 미포함 문서의 delta 하한 포함) 점수가 기준값과 일치
+        """
+        scorer = BM25PlusScorer.from_tokens(CORPUS)
+
+        for query in (["삼성전자"], ["삼성전자", "주가"], ["전망", "아이폰", "분석"]):
+            assert scorer.get_scores(query).tolist() == pytest.approx(
+                _reference_scores(CORPUS, query)
+            )
+
+    def test_duplicate_and_unknown_query_terms(self) -> None:
+        """
+        중복 쿼리 용어는 횟수만큼 반영되고 미등록 용어는 무시
+
+        Given: 코퍼스에 없는 용어와 중복 용어가 포함된 쿼리
+        When: get_scores() 호출
+        Then: 미등록 용어만으로는 전부 0, 중복 용어는 점수가 두 배
+        """
+        scorer = BM25PlusScorer.from_tokens(CORPUS)
+
+        assert scorer.get_scores(["없는용어"]).tolist() == [0.0] * len(CORPUS)
+        single = scorer.get_scores(["주가"])
+        double = scorer.get_scores(["주가", "없는용어", "주가"])
+        assert double.tolist() == pytest.approx((single * 2).tolist())
+
+    def test_scores_match_rank_bm25(self) -> None:
+        """rank-bm25가 설치된 환경에서는 BM25Plus와 같은 점수를 반환"""
+        rank_bm25 = pytest.importorskip("rank_bm25")
+
+        query = ["삼성전자", "전망", "삼성전자"]
+        expected = rank_bm25.BM25Plus(CORPUS).get_scores(query)
+
+        assert BM25PlusScorer.from_tokens(CORPUS).get_scores(query).tolist() == pytest.approx(
+            expected.tolist()
+        )
+
+
+class TestBM25PlusScorerCandidates:
+    """get_candidate_scores() MaxScore 가지치기 테스트"""
+
+    @staticmethod
+    def _skewed_corpus(size: int = 2000) -> list[list[str]]:
+        """흔한 용어와 희귀 용어가 섞인 코퍼스"""
+        rng = random.Random(0)
+        common = ["회사", "주가", "전망"]
+        rare = [f"희귀{i}" for i in range(50)]
+        return [
+            rng.choices(common, k=rng.randint(1, 6)) + rng.sample(rare, k=rng.randint(0, 2))
+            for _ in range(size)
+        ]
+
+    def test_pruned_candidates_keep_top_k(self) -> None:
+        """
+        가지치기된 후보가 전체 점수 상위 top_k를 모두 포함하고 점수도 동일
+
+        Given: 희귀 용어 + 흔한 용어 쿼리
+        When: get_candidate_scores() 호출
+        Then: 일부 문서가 제외되고, 후보 점수는 get_scores()와 같으며 제외 문서는 상한 이하
+        """
+        corpus = self._skewed_corpus()
+        scorer = BM25PlusScorer.from_tokens(corpus)
+        query = ["희귀1", "희귀2", "회사", "주가"]
+        top_k = 5
+
+        full = scorer.get_scores(query)
+        doc_ids, scores, pruned_bound = scorer.get_candidate_scores(query, top_k)
+
+        assert pruned_bound is not None
+        assert doc_ids.size < len(corpus)
+        assert scores.tolist() == full[doc_ids].tolist()
+        excluded = np.setdiff1d(np.arange(len(corpus)), doc_ids)
+        assert full[excluded].max() <= pruned_bound
+        assert np.sort(scores)[-top_k] > pruned_bound
+
+    def test_single_term_or_large_top_k_scores_all_documents(self) -> None:
+        """등록 용어가 1개이거나 top_k가 코퍼스 이상이면 가지치기 없이 전체 점수"""
+        scorer = BM25PlusScorer.from_tokens(CORPUS)
+
+        for query, top_k in ((["삼성전자", "삼성전자"], 1), (["삼성전자", "주가"], len(CORPUS))):
+            doc_ids, scores, pruned_bound = scorer.get_candidate_scores(query, top_k)
+            assert doc_ids.tolist() == list(range(len(CORPUS)))
+            assert scores.tolist() == scorer.get_scores(query).tolist()
+            assert pruned_bound is None
+
+
+class TestBM25PlusScorerPersistence:
+    """save()/load() 테스트"""
+
+    def test_load_restores_scores(self, tmp_path) -> None:
+        """
+        저장한 배열로 복원한 점수 계산기가 같은 점수를 반환
+
+        Given: save()로 저장한 점수 계산기
+        When: 메모리 맵(mmap_mode="r") 및 일반 로드
+        Then: get_scores()와 get_candidate_scores() 결과가 원본과 동일
+        """
+        scorer = BM25PlusScorer.from_tokens(TestBM25PlusScorerCandidates._skewed_corpus(500))
+        scorer.save(tmp_path)
+
+        query = ["희귀1", "희귀2", "회사", "주가"]
+        for mmap_mode in ("r", None):
+            loaded = BM25PlusScorer.load(
+                tmp_path, dict(scorer.vocab), scorer.corpus_size, mmap_mode=mmap_mode
+            )
+            assert isinstance(loaded._posting_docs, np.memmap) == (mmap_mode == "r")
+            assert loaded.get_scores(query).tolist() == scorer.get_scores(query).tolist()
+            for expected, actual in zip(
+                scorer.get_candidate_scores(query, 5), loaded.get_candidate_scores(query, 5),
+                strict=True,
+            ):
+                assert np.asarray(actual).tolist() == np.asarray(expected).tolist()
+
+
+class TestInternCorpus:
+    """intern_corpus() 테스트"""
+
+    def test_assigns_ids_in_first_appearance_order(self) -> None:
+        """용어 ID는 첫 등장 순서로 부여되고 코퍼스는 ID 배열 + 문서별 토큰 수로 변환"""
+        vocab, token_ids, doc_lengths = intern_corpus(
+            [["주가", "전망", "주가"], [], ["전망", "반도체"]]
+        )
+
+        assert vocab == {"주가": 0, "전망": 1, "반도체": 2}
+        assert token_ids.tolist() == [0, 1, 0, 1, 2]
+        # 용어 수가 적으면 uint16으로 축소
+        assert token_ids.dtype == np.uint16
+        assert doc_lengths.tolist() == [3, 0, 2]
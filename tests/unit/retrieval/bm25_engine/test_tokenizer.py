@@ -89,6 +89,23 @@ class TestKoreanTokenizerBasic:
         assert all(isinstance(t, str) for t in tokens)
 
 
+    def test_tokenizers_share_kiwi_instance(self) -> None:
+        """
+        Kiwi 인스턴스 공유
+
+        Given: 같은/다른 num_workers로 생성한 토크나이저
+        When: _kiwi 비교
+        Then: 같은 num_workers는 동일 Kiwi 인스턴스, 다르면 별도 인스턴스
+        """
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        first = KoreanTokenizer()
+        second = KoreanTokenizer()
+        single_thread = KoreanTokenizer(num_workers=0)
+
+        assert first._kiwi is second._kiwi
+        assert single_thread._kiwi is not first._kiwi
+
 class TestKoreanTokenizerBatch:
     """KoreanTokenizer 배치 토큰화 테스트"""
 
@@ -130,6 +147,61 @@ class TestKoreanTokenizerBatch:
 
         assert result == []
 
+    def test_tokenize_batch_matches_single_tokenize(self) -> None:
+        """
+        배치 결과와 문서별 결과 일치
+
+        Given: 빈 문자열이 섞인 문서 리스트
+        When: tokenize_batch() 호출
+        Then: 입력 순서대로 tokenize()와 동일한 결과 반환
+        """
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        tokenizer = KoreanTokenizer()
+        docs = ["삼성전자의 주가가 올랐습니다", "", "   ", "RAG 시스템을 설치합니다"]
+
+        result = tokenizer.tokenize_batch(docs)
+
+        assert result == [tokenizer.tokenize(doc) for doc in docs]
+
+    def test_tokenize_batch_single_thread_fallback(self) -> None:
+        """
+        단일 스레드 Kiwi에서도 배치 토큰화 동작
+
+        Given: num_workers=0 (Kiwi 배치 분석 불가 모드)
+        When: tokenize_batch() 호출
+        Then: 문서별 분석으로 대체되어 동일한 결과 반환
+        """
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        tokenizer = KoreanTokenizer(num_workers=0)
+        docs = ["삼성전자 주가 분석", "애플 아이폰 출시"]
+
+        result = tokenizer.tokenize_batch(docs)
+
+        assert result == [tokenizer.tokenize(doc) for doc in docs]
+
+    def test_tokenize_batch_propagates_analysis_error(self) -> None:
+        """
+        배치 분석 중 발생한 실제 오류는 숨기지 않고 전파
+
+        Given: 배치 분석 시 예외를 던지는 Kiwi
+        When: tokenize_batch() 호출
+        Then: 문서별 분석으로 대체하지 않고 동일 예외 발생
+        """
+        from unittest.mock import MagicMock
+
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        tokenizer = KoreanTokenizer()
+        tokenizer._kiwi = MagicMock()
+        tokenizer._kiwi.tokenize.side_effect = RuntimeError("분석 실패")
+
+        with pytest.raises(RuntimeError, match="분석 실패"):
+            tokenizer.tokenize_batch(["삼성전자 주가 분석"])
+
+        tokenizer._kiwi.tokenize.assert_called_once()
+
 
 class TestKoreanTokenizerWithPreprocessors:
     """기존 BM25 전처리 모듈과의 연동 테스트"""
@@ -156,6 +228,25 @@ class TestKoreanTokenizerWithPreprocessors:
         for stopword in ["있는", "같은", "것"]:
             assert stopword not in tokens
 
+    def test_tokenize_reflects_stopwords_added_later(self) -> None:
+        """
+        생성 후 추가한 불용어도 반영
+
+        Given: StopwordFilter가 주입된 토크나이저
+        When: add_stopword() 후 tokenize() 호출
+        Then: 추가한 불용어가 제거됨
+        """
+        from app.modules.core.retrieval.bm25.stopwords import StopwordFilter
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        stopword_filter = StopwordFilter(use_defaults=False, enabled=True)
+        tokenizer = KoreanTokenizer(stopword_filter=stopword_filter)
+        assert "맛집" in tokenizer.tokenize("강남 맛집 추천")
+
+        stopword_filter.add_stopword("맛집")
+
+        assert "맛집" not in tokenizer.tokenize("강남 맛집 추천")
+
     def test_tokenize_without_preprocessors(self) -> None:
         """
         전처리 모듈 없이도 정상 동작
@@ -170,3 +261,27 @@ class TestKoreanTokenizerWithPreprocessors:
         tokens = tokenizer.tokenize("테스트 문장입니다")
 
         assert len(tokens) > 0
+
+    def test_pickle_rejects_unpicklable_preprocessor(self) -> None:
+        """
+        피클링 불가한 전처리 모듈은 명확한 TypeError로 거부
+
+        Given: 락 객체를 속성으로 가진 불용어 필터가 주입된 토크나이저
+        When: pickle.dumps() 호출
+        Then: 어떤 전처리 모듈이 문제인지 알려주는 TypeError 발생
+        """
+        import pickle
+        import threading
+
+        from app.modules.core.retrieval.bm25.stopwords import StopwordFilter
+        from app.modules.core.retrieval.bm25_engine.tokenizer import KoreanTokenizer
+
+        stopword_filter = StopwordFilter()
+        stopword_filter._lock = threading.Lock()  # type: ignore[attr-defined]
+        tokenizer = KoreanTokenizer(stopword_filter=stopword_filter)
+
+        with pytest.raises(TypeError, match="stopword_filter"):
+            pickle.dumps(tokenizer)
+
+        restored = pickle.loads(pickle.dumps(KoreanTokenizer(stopword_filter=StopwordFilter())))
+        assert restored.tokenize("삼성전자 주가") == ["삼성전자", "주가"]
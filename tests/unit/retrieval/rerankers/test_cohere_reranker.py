@@ -67,15 +67,16 @@ class TestCohereRerankerInitialization:
 
         Given: CohereReranker 인스턴스
         When: initialize() 호출
-        Then: 정상 완료 (HTTP API이므로 추가 작업 없음)
+        Then: 공유 HTTP 클라이언트 생성, close() 시 종료
         """
         from app.modules.core.retrieval.rerankers.cohere_reranker import CohereReranker
 
         reranker = CohereReranker(api_key="test-key")
         await reranker.initialize()
 
-        # 에러 없이 완료되면 성공
-        assert True
+        assert reranker._client is not None
+        await reranker.close()
+        assert reranker._client is None
 
     @pytest.mark.asyncio
     async def test_close_method(self) -> None:
@@ -148,7 +149,7 @@ class TestCohereRerankerReranking:
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -162,6 +163,82 @@ class TestCohereRerankerReranking:
             assert results[2].id == "2"  # index 1
             assert results[2].score == 0.60
 
+    @pytest.mark.asyncio
+    async def test_rerank_reuses_shared_client(self, sample_results: list[SearchResult]) -> None:
+        """
+        여러 리랭킹 요청이 하나의 HTTP 클라이언트를 공유
+
+        Given: initialize() 없이 생성된 CohereReranker
+        When: rerank() 2회 호출 후 close()
+        Then: AsyncClient는 1회만 생성되고 close() 시 aclose() 호출
+        """
+        from app.modules.core.retrieval.rerankers.cohere_reranker import CohereReranker
+
+        reranker = CohereReranker(api_key="test-key")
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"results": [{"index": 0, "relevance_score": 0.9}]}
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+
+            await reranker.rerank("Python이란?", sample_results)
+            await reranker.rerank("FastAPI란?", sample_results)
+            await reranker.close()
+
+            mock_client.assert_called_once()
+            assert mock_client.return_value.post.await_count == 2
+            mock_client.return_value.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rerank_large_payload_encoded_in_thread(
+        self, sample_results: list[SearchResult], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """
+        대용량 요청 본문은 스레드에서 JSON 인코딩
+
+        Given: 인코딩 임계값을 넘는 문서
+        When: rerank() 호출
+        Then: asyncio.to_thread로 인코딩되고, 본문은 Cohere 요청 형식의 JSON
+        """
+        import asyncio
+        import json
+
+        from app.modules.core.retrieval.rerankers import cohere_reranker
+        from app.modules.core.retrieval.rerankers.cohere_reranker import CohereReranker
+
+        monkeypatch.setattr(cohere_reranker, "_THREAD_ENCODE_MIN_CHARS", 1)
+        offloaded: list[Any] = []
+        to_thread = asyncio.to_thread
+
+        async def recording_to_thread(func: Any, *args: Any) -> Any:
+            offloaded.append(func)
+            return await to_thread(func, *args)
+
+        monkeypatch.setattr(cohere_reranker.asyncio, "to_thread", recording_to_thread)
+
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"results": [{"index": 0, "relevance_score": 0.9}]}
+        mock_response.raise_for_status = MagicMock()
+
+        reranker = CohereReranker(api_key="test-key")
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
+            await reranker.rerank("Python이란?", sample_results, top_n=1)
+
+            body = mock_client.return_value.post.call_args.kwargs["content"]
+
+        assert offloaded == [cohere_reranker._json_dumps]
+        assert json.loads(body) == {
+            "model": "rerank-multilingual-v3.0",
+            "query": "Python이란?",
+            "documents": [r.content for r in sample_results],
+            "top_n": 1,
+            "max_tokens_per_doc": 4096,
+        }
+
     @pytest.mark.asyncio
     async def test_rerank_empty_results(self) -> None:
         """
@@ -202,7 +279,7 @@ class TestCohereRerankerReranking:
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 return_value=mock_response
             )
 
@@ -211,6 +288,61 @@ class TestCohereRerankerReranking:
             # 검증: 2개만 반환됨
             assert len(results) == 2
 
+    @pytest.mark.asyncio
+    async def test_rerank_many_bounds_concurrency(
+        self, sample_results: list[SearchResult]
+    ) -> None:
+        """
+        다수 쿼리 동시 리랭킹 테스트
+
+        Given: 5개 쿼리, max_concurrency=2
+        When: rerank_many() 호출
+        Then: 동시 요청은 2개 이하, 결과는 입력 순서대로 반환, 실패 쿼리는 원본 반환
+        """
+        import asyncio
+        import json
+
+        from app.modules.core.retrieval.rerankers.cohere_reranker import CohereReranker
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_post(*args: Any, **kwargs: Any) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            query = json.loads(kwargs["content"])["query"]
+            if query == "q3":
+                raise RuntimeError("API error")
+            response = MagicMock()
+            response.json.return_value = {
+                "results": [{"index": int(query[1]) % 3, "relevance_score": 0.9}]
+            }
+            return response
+
+        reranker = CohereReranker(api_key="test-key")
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_client.return_value.post = fake_post
+
+            pairs = [(f"q{i}", sample_results) for i in range(5)]
+            results = await reranker.rerank_many(pairs, top_n=1, max_concurrency=2)
+
+        assert peak == 2
+        assert [r[0].id for r in results] == ["1", "2", "3", "1", "2"]
+        assert results[3] == sample_results
+        assert reranker.get_stats()["failed_requests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rerank_many_rejects_invalid_concurrency(self) -> None:
+        """max_concurrency가 1 미만이면 ValueError"""
+        from app.modules.core.retrieval.rerankers.cohere_reranker import CohereReranker
+
+        reranker = CohereReranker(api_key="test-key")
+        with pytest.raises(ValueError, match="max_concurrency"):
+            await reranker.rerank_many([], max_concurrency=0)
+
 
 class TestCohereRerankerErrorHandling:
     """Cohere 리랭커 에러 핸들링 테스트"""
@@ -249,7 +381,7 @@ class TestCohereRerankerErrorHandling:
         reranker = CohereReranker(api_key="test-key")
 
         with patch("httpx.AsyncClient") as mock_client:
-            mock_client.return_value.__aenter__.return_value.post = AsyncMock(
+            mock_client.return_value.post = AsyncMock(
                 side_effect=Exception("API Error")
             )
 
@@ -289,7 +421,7 @@ class TestCohereRerankerErrorHandling:
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = CohereReranker(api_key="test-api-key")
             results = await reranker.rerank(query="test", results=sample_results)
@@ -318,7 +450,7 @@ class TestCohereRerankerErrorHandling:
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = CohereReranker(api_key="test-api-key", timeout=1.0)
             results = await reranker.rerank(query="test", results=sample_results)
@@ -386,7 +518,7 @@ class TestCohereRerankerUtilities:
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = AsyncMock(return_value=mock_response)
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = CohereReranker(api_key="test-api-key")
             await reranker.rerank(query="test", results=sample_results)
@@ -420,7 +552,7 @@ class TestCohereRerankerUtilities:
 
             mock_client_instance = MagicMock()
             mock_client_instance.post = mock_post
-            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_class.return_value = mock_client_instance
 
             reranker = CohereReranker(api_key="test-api-key")
             await reranker.rerank(query="test", results=sample_results)
@@ -217,6 +217,40 @@ class TestJinaRerankerReranking:
             # 검증: 2개만 반환됨
             assert len(results) == 2
 
+    @pytest.mark.asyncio
+    async def test_request_body_is_utf8_json(self, sample_results: list[SearchResult]) -> None:
+        """
+        요청 본문이 이스케이프 없는 UTF-8 JSON으로 전송되는지 테스트
+
+        Given: 한국어 쿼리
+        When: 리랭킹 수행
+        Then: content=로 전달된 bytes에 한국어가 그대로 포함되고 요청 데이터와 일치
+        """
+        import json
+
+        from app.modules.core.retrieval.rerankers.jina_reranker import JinaReranker
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_response = MagicMock()
+            mock_response.json.return_value = {"results": [{"index": 0, "relevance_score": 0.9}]}
+
+            mock_client_instance = MagicMock()
+            mock_client_instance.post = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value.__aenter__.return_value = mock_client_instance
+
+            reranker = JinaReranker(api_key="test-api-key")
+            await reranker.rerank(query="머신러닝이란?", results=sample_results, top_n=1)
+
+            body = mock_client_instance.post.call_args.kwargs["content"]
+
+        assert "머신러닝이란?".encode() in body
+        assert json.loads(body) == {
+            "model": "jina-reranker-v1-base-en",
+            "query": "머신러닝이란?",
+            "documents": [r.content for r in sample_results],
+            "top_n": 1,
+        }
+
     @pytest.mark.asyncio
     async def test_rerank_empty_results(self) -> None:
         """
@@ -27,6 +27,17 @@ class TestRerankerFactoryV2Registry:
         assert "openai" in PROVIDER_REGISTRY
         assert "jina" in PROVIDER_REGISTRY
 
+    def test_every_approach_provider_pair_has_builder(self):
+        """모든 approach-provider 조합에 생성 함수가 등록되어 있는지 확인"""
+        from app.modules.core.retrieval.rerankers.factory import (
+            APPROACH_REGISTRY,
+            PROVIDER_REGISTRY,
+        )
+
+        for approach, info in APPROACH_REGISTRY.items():
+            for provider in info["providers"]:
+                assert callable(PROVIDER_REGISTRY[provider]["builders"][approach])
+
 
 class TestRerankerFactoryV2Create:
     """RerankerFactory v2 생성 테스트"""
@@ -740,6 +740,41 @@ class TestChromaRetrieverHybridSearch:
         assert len(results) == 2
         assert results[0].id == "doc-1"
 
+    @pytest.mark.asyncio
+    async def test_search_batch_uses_bm25_batch(
+        self,
+        mock_embedder: MagicMock,
+        mock_chroma_store_with_results: MagicMock,
+        mock_bm25_index: MagicMock,
+        mock_hybrid_merger: MagicMock,
+    ) -> None:
+        """
+        일괄 검색 시 BM25는 search_batch()로 한 번만 호출
+
+        Given: bm25_index와 hybrid_merger가 주입된 retriever
+        When: search_batch() 호출
+        Then: 쿼리별 Dense 검색 + BM25 일괄 검색 1회, 쿼리별 병합 결과 반환
+        """
+        from app.modules.core.retrieval.retrievers.chroma_retriever import ChromaRetriever
+
+        bm25_result = mock_bm25_index.search.return_value
+        mock_bm25_index.search_batch = MagicMock(return_value=[bm25_result, bm25_result])
+        retriever = ChromaRetriever(
+            embedder=mock_embedder,
+            store=mock_chroma_store_with_results,
+            bm25_index=mock_bm25_index,
+            hybrid_merger=mock_hybrid_merger,
+        )
+
+        results = await retriever.search_batch(["쿼리 1", "쿼리 2"], top_k=5)
+
+        assert len(results) == 2
+        assert mock_embedder.embed_query.call_count == 2
+        mock_bm25_index.search_batch.assert_called_once_with(["쿼리 1", "쿼리 2"], top_k=5)
+        mock_bm25_index.search.assert_not_called()
+        assert mock_hybrid_merger.merge.call_count == 2
+        assert retriever.stats["total_searches"] == 2
+
 
 class TestChromaRetrieverBM25ParameterStructure:
     """ChromaRetriever BM25 파라미터 구조 확인 테스트"""
@@ -16,6 +16,7 @@ Jina ColBERT v2 API 기반 토큰 수준 리랭킹 검증.
 TDD Phase: RED (실패 테스트 작성)
 """
 
+import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -224,7 +225,7 @@ class TestAPICall:
             assert "Bearer test_api_key" in headers["Authorization"]
 
             # 요청 바디 검증
-            json_data = call_kwargs.kwargs.get("json", {})
+            json_data = json.loads(call_kwargs.kwargs["content"])
             assert json_data.get("model") == "jina-colbert-v2"
             assert "query" in json_data
             assert "documents" in json_data
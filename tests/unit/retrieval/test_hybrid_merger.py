@@ -42,6 +42,46 @@ class TestDenseOnly:
         # 첫 번째 문서의 RRF 점수가 두 번째보다 높아야 한다
         assert result[0].score > result[1].score
 
+    def test_dense_only_applies_top_k_and_rrf_scores(self) -> None:
+        """Dense 단일 소스도 top_k로 잘리고 alpha 가중 RRF 점수를 가진다."""
+        merger = HybridMerger(alpha=0.6)
+        dense = [
+            SearchResult(id=f"d{i}", content=f"문서{i}", score=0.5, metadata={})
+            for i in range(5)
+        ]
+
+        result = merger.merge(dense_results=dense, bm25_results=[], top_k=3)
+
+        assert [r.id for r in result] == ["d0", "d1", "d2"]
+        for rank, r in enumerate(result):
+            assert r.score == pytest.approx(0.6 / (60 + rank + 1))
+
+    def test_dense_only_repeated_ids_are_merged(self) -> None:
+        """한 소스 안에서 반복된 문서 ID는 하나로 합쳐지고 RRF 점수가 합산된다."""
+        merger = HybridMerger(alpha=1.0)
+        dense = [
+            SearchResult(id="d1", content="문서1", score=0.9, metadata={}),
+            SearchResult(id="d2", content="문서2", score=0.8, metadata={}),
+            SearchResult(id="d1", content="문서1", score=0.7, metadata={}),
+        ]
+
+        result = merger.merge(dense_results=dense, bm25_results=[], top_k=10)
+
+        assert [r.id for r in result] == ["d1", "d2"]
+        assert result[0].score == pytest.approx(1 / 61 + 1 / 63)
+        assert result[1].score == pytest.approx(1 / 62)
+
+    def test_dense_only_negative_top_k_drops_tail(self) -> None:
+        """음수 top_k는 일반 병합 경로와 같이 하위 |top_k|개를 제외한다."""
+        merger = HybridMerger(alpha=1.0)
+        dense = [
+            SearchResult(id=f"d{i}", content="", score=0.5, metadata={}) for i in range(5)
+        ]
+
+        result = merger.merge(dense_results=dense, bm25_results=[], top_k=-2)
+
+        assert [r.id for r in result] == ["d0", "d1", "d2"]
+
 
 # ── BM25 전용 병합 테스트 ──────────────────────────────────
 class TestBM25Only:
@@ -62,6 +102,22 @@ class TestBM25Only:
         assert result[0].content == "키워드문서1"
         assert result[0].metadata == {"lang": "ko"}
 
+    def test_bm25_only_repeated_ids_are_merged(self) -> None:
+        """BM25 결과의 중복 ID도 하나로 합쳐지고 첫 등장 정보가 유지된다."""
+        merger = HybridMerger(alpha=0.0)
+        bm25 = [
+            {"id": "b1", "content": "첫등장", "metadata": {"rank": 0}},
+            {"id": "b2", "content": "키워드문서2"},
+            {"id": "b1", "content": "재등장", "metadata": {"rank": 2}},
+        ]
+
+        result = merger.merge(dense_results=[], bm25_results=bm25, top_k=10)
+
+        assert [r.id for r in result] == ["b1", "b2"]
+        assert result[0].content == "첫등장"
+        assert result[0].metadata == {"rank": 0}
+        assert result[0].score == pytest.approx(1 / 61 + 1 / 63)
+
 
 # ── 하이브리드 중복 문서 점수 합산 테스트 ─────────────────
 class TestHybridDuplicate:
@@ -88,6 +144,64 @@ class TestHybridDuplicate:
         assert len(result) == 3
 
 
+# ── RRF 점수 정확성 테스트 ─────────────────────────────────
+class TestRRFScores:
+    """대량 입력에서도 RRF 점수와 정렬 순서가 정의대로 계산되는지 검증"""
+
+    def test_scores_match_rrf_formula(self) -> None:
+        """각 문서 점수는 alpha/(k+rank+1) + (1-alpha)/(k+rank+1)의 합이다."""
+        alpha = 0.6
+        merger = HybridMerger(alpha=alpha)
+        dense = [
+            SearchResult(id=f"doc{i}", content=f"문서{i}", score=1.0, metadata={})
+            for i in range(300)
+        ]
+        # BM25는 역순 + 일부 신규 문서
+        bm25 = [{"id": f"doc{i}", "content": f"문서{i}"} for i in range(399, 99, -1)]
+
+        result = merger.merge(dense_results=dense, bm25_results=bm25, top_k=50)
+
+        expected: dict[str, float] = {}
+        for rank, r in enumerate(dense):
+            expected[r.id] = expected.get(r.id, 0.0) + alpha / (60 + rank + 1)
+        for rank, item in enumerate(bm25):
+            expected[item["id"]] = expected.get(item["id"], 0.0) + (1 - alpha) / (60 + rank + 1)
+        expected_top = sorted(expected.values(), reverse=True)[:50]
+
+        # 수학적 동점은 부동소수점 반올림에 따라 순서가 달라질 수 있으므로 점수로 비교
+        assert [r.score for r in result] == pytest.approx(expected_top)
+        for r in result:
+            assert r.score == pytest.approx(expected[r.id])
+
+    def test_ranks_beyond_precomputed_table(self) -> None:
+        """사전 계산 테이블(4096)을 넘는 순위도 RRF 공식대로 계산된다."""
+        merger = HybridMerger(alpha=0.5)
+        dense = [
+            SearchResult(id=f"doc{i}", content="", score=1.0, metadata={}) for i in range(5000)
+        ]
+        bm25 = [{"id": "doc0", "content": ""}]
+
+        result = merger.merge(dense_results=dense, bm25_results=bm25, top_k=5000)
+        scores = {r.id: r.score for r in result}
+
+        assert len(result) == 5000
+        assert scores["doc4999"] == pytest.approx(0.5 / (60 + 4999 + 1))
+        assert scores["doc4096"] == pytest.approx(0.5 / (60 + 4096 + 1))
+
+    def test_top_k_boundary_ties_keep_first_appearance_order(self) -> None:
+        """top_k 경계의 동점 문서는 먼저 등장한 문서가 선택된다."""
+        merger = HybridMerger(alpha=0.5)
+        dense = [
+            SearchResult(id=f"doc{i}", content="", score=1.0, metadata={}) for i in range(10)
+        ]
+        # 역순 BM25 + alpha=0.5 → doc{i}와 doc{9-i}가 정확히 같은 점수
+        bm25 = [{"id": f"doc{i}", "content": ""} for i in range(9, -1, -1)]
+
+        result = merger.merge(dense_results=dense, bm25_results=bm25, top_k=3)
+
+        assert [r.id for r in result] == ["doc0", "doc9", "doc1"]
+
+
 # ── BM25 metadata 없을 때 빈 dict 테스트 ─────────────────
 class TestBM25NoMetadata:
     """BM25 결과에 metadata 키가 없을 때 빈 dict로 처리되는지 검증"""